@@ -0,0 +1,38 @@
+"""Lazy package re-exports (PEP 562)."""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Callable, Iterable, Mapping
+from importlib import import_module
+from typing import Any
+
+
+def lazy_exports(
+    package: str,
+    exports: Mapping[str, Iterable[str]],
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Build a package's module-level __getattr__ and __dir__.
+
+    exports maps each submodule to the names it provides. A name is imported
+    from its submodule on first access and then cached in the package
+    namespace, so importing one submodule does not load its siblings.
+    Packages keep a static __all__ and a TYPE_CHECKING import block for
+    type checkers.
+    """
+    namespace = sys.modules[package].__dict__
+    module_of = {name: module for module, names in exports.items() for name in names}
+
+    def __getattr__(name: str) -> Any:
+        module = module_of.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(module), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*namespace, *module_of})
+
+    return __getattr__, __dir__
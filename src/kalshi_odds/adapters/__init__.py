@@ -1,6 +1,24 @@
 """Venue adapters for data ingestion."""
 
-from kalshi_odds.adapters.kalshi import KalshiAdapter
-from kalshi_odds.adapters.odds_api import OddsAPIAdapter
+from __future__ import annotations
 
-__all__ = ["KalshiAdapter", "OddsAPIAdapter"]
+from typing import TYPE_CHECKING
+
+from kalshi_odds._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from kalshi_odds.adapters.kalshi import KalshiAdapter
+    from kalshi_odds.adapters.odds_api import OddsAPIAdapter
+
+__all__ = [
+    "KalshiAdapter",
+    "OddsAPIAdapter",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "kalshi_odds.adapters.kalshi": ["KalshiAdapter"],
+        "kalshi_odds.adapters.odds_api": ["OddsAPIAdapter"],
+    },
+)
@@ -6,13 +6,22 @@ Simplified read-only adapter for fetching contracts and orderbooks.
 
 from __future__ import annotations
 
-import time
 import asyncio
-from datetime import datetime, timezone
+import base64
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, Coroutine
+from contextlib import aclosing
+from datetime import UTC, datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional
+from typing import Any, ClassVar, Self
 
 import httpx
+import orjson
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import padding, rsa
 from tenacity import (
@@ -24,37 +33,122 @@ from tenacity import (
 
 from kalshi_odds.models.kalshi import KalshiContract, KalshiTopOfBook, OutcomeSide, cents_to_decimal
 
+# Response cache freshness (seconds). Orderbooks go stale fast; market lists don't.
+ORDERBOOK_CACHE_TTL = 2.0
+MARKETS_CACHE_TTL = 30.0
+CACHE_MAX_ENTRIES = 512
+
+# Tickers per batched orderbook request
+BATCH_ORDERBOOK_MAX_TICKERS = 100
+
+# How long a persisted batch-orderbook probe result is trusted (seconds)
+CAPABILITY_CACHE_TTL = 86_400.0
+
+# Probe failures that say nothing about endpoint support: auth (bad key, clock
+# skew) and rate limiting. 5xx responses are treated the same way.
+_TRANSIENT_PROBE_STATUSES = frozenset({401, 403, 429})
+
+# Request-signing parameters are immutable: build them once, not per request.
+# The RSA private-key operation is the whole cost of a signature, so no prehashing.
+_SIGNATURE_HASH = hashes.SHA256()
+_SIGNATURE_PADDING = padding.PSS(
+    mgf=padding.MGF1(hashes.SHA256()), salt_length=padding.PSS.MAX_LENGTH
+)
+
+
+@lru_cache(maxsize=4)
+def _load_private_key(path: Path, mtime_ns: int) -> rsa.RSAPrivateKey:
+    """
+    Parse a PEM private key once per process.
+
+    Loading validates the RSA key (tens of ms); adapters created later in the
+    same process reuse the parsed key. mtime_ns in the cache key picks up a
+    rotated key file.
+    """
+    return serialization.load_pem_private_key(path.read_bytes(), password=None)  # type: ignore
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_datetime(value: str) -> datetime:
+    """datetime.fromisoformat, memoized: market pages repeat the same few close times."""
+    return datetime.fromisoformat(value)
+
 
 class KalshiAdapter:
     """Read-only Kalshi API adapter with RSA auth."""
 
+    # base_url → whether GET /markets/orderbooks accepts a tickers list; absent until probed.
+    # Shared by adapters in one process, but demo and prod are probed separately.
+    _batch_orderbooks_by_url: ClassVar[dict[str, bool]] = {}
+
+    __slots__ = (
+        "_api_key_id",
+        "_base_url",
+        "_burst",
+        "_cache",
+        "_cache_dir",
+        "_client",
+        "_keepalive_expiry",
+        "_private_key",
+        "_private_key_path",
+        "_rate",
+        "_throttle_lock",
+        "_tokens",
+        "_tokens_at",
+    )
+
     def __init__(
         self,
         api_key_id: str,
         private_key_path: str,
         base_url: str = "https://api.elections.kalshi.com/trade-api/v2",
         requests_per_second: float = 5.0,
+        cache_dir: str | Path | None = None,
+        keepalive_expiry: float = 60.0,
     ) -> None:
         self._api_key_id = api_key_id
         self._private_key_path = private_key_path
         self._base_url = base_url.rstrip("/")
-        self._min_delay = 1.0 / requests_per_second
-        self._last_request_time = 0.0
-        self._client: Optional[httpx.AsyncClient] = None
-        self._private_key: Optional[rsa.RSAPrivateKey] = None
+        # Token bucket: up to one second's worth of requests may go out back to back
+        self._rate = requests_per_second
+        self._burst = max(1.0, requests_per_second)
+        self._tokens = self._burst
+        self._tokens_at = time.monotonic()
+        self._throttle_lock = asyncio.Lock()
+        self._client: httpx.AsyncClient | None = None
+        self._private_key: rsa.RSAPrivateKey | None = None
+        # (path, sorted params) → (expires_at, response json), oldest first
+        self._cache: OrderedDict[tuple[Any, ...], tuple[float, dict[str, Any]]] = OrderedDict()
+        # Probe results survive restarts under cache_dir (None = per process only)
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+        # Idle seconds a pooled Kalshi connection (up to 20 kept) stays open for the next
+        # orderbook burst
+        self._keepalive_expiry = keepalive_expiry
+
+    @property
+    def _supports_batch_orderbooks(self) -> bool | None:
+        return KalshiAdapter._batch_orderbooks_by_url.get(self._base_url)
 
     async def connect(self) -> None:
         """Initialize connection."""
-        key_path = Path(self._private_key_path)
+        key_path = Path(self._private_key_path).resolve()
         if not key_path.exists():
             raise FileNotFoundError(f"Kalshi private key not found: {key_path}")
 
-        key_data = key_path.read_bytes()
-        self._private_key = serialization.load_pem_private_key(key_data, password=None)  # type: ignore
+        self._private_key = _load_private_key(key_path, key_path.stat().st_mtime_ns)
 
+        # One pooled keep-alive client; HTTP/2 multiplexes concurrent
+        # orderbook fetches over a single connection to the API host.
+        # No default Content-Type: GETs have no body; _post sets it on the one request that has one.
         self._client = httpx.AsyncClient(
             base_url=self._base_url,
             timeout=httpx.Timeout(30.0, connect=10.0),
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=self._keepalive_expiry,
+            ),
         )
 
     async def close(self) -> None:
@@ -64,61 +158,98 @@ class KalshiAdapter:
             self._client = None
 
     def _sign_request(self, method: str, path: str, timestamp_ms: str) -> str:
-        """Create RSA-PSS signature for Kalshi auth."""
+        """
+        Create RSA-PSS signature for Kalshi auth.
+
+        Runs inline on the event loop: cryptography holds the GIL for the whole
+        sign, so handing it to a thread pool would add a hop without overlapping
+        anything.
+        """
         message = f"{timestamp_ms}{method}{path}"
         signature = self._private_key.sign(  # type: ignore
-            message.encode("utf-8"),
-            padding.PSS(
-                mgf=padding.MGF1(hashes.SHA256()),
-                salt_length=padding.PSS.MAX_LENGTH,
-            ),
-            hashes.SHA256(),
+            message.encode("utf-8"), _SIGNATURE_PADDING, _SIGNATURE_HASH
         )
-        import base64
         return base64.b64encode(signature).decode("utf-8")
 
     def _auth_headers(self, method: str, path: str) -> dict[str, str]:
-        ts = str(int(time.time() * 1000))
+        # The RSA sign dominates; the rest is a few string ops, not worth specializing
+        ts = str(time.time_ns() // 1_000_000)
         sig = self._sign_request(method.upper(), path, ts)
         return {
             "KALSHI-ACCESS-KEY": self._api_key_id,
             "KALSHI-ACCESS-SIGNATURE": sig,
             "KALSHI-ACCESS-TIMESTAMP": ts,
-            "Content-Type": "application/json",
         }
 
     async def _throttle(self) -> None:
-        now = time.monotonic()
-        elapsed = now - self._last_request_time
-        if elapsed < self._min_delay:
-            await asyncio.sleep(self._min_delay - elapsed)
-        self._last_request_time = time.monotonic()
+        # Serialized so concurrent callers (get_top_of_books) still respect the rate limit
+        async with self._throttle_lock:
+            now = time.monotonic()
+            self._tokens = min(self._burst, self._tokens + (now - self._tokens_at) * self._rate)
+            self._tokens_at = now
+            if self._tokens < 1.0:
+                await asyncio.sleep((1.0 - self._tokens) / self._rate)
+                self._tokens = 1.0
+                self._tokens_at = time.monotonic()
+            self._tokens -= 1.0
+
+    def _raise_for_status(self, resp: httpx.Response) -> None:
+        if resp.status_code == 429:
+            self._tokens = 0.0  # rate limited: stop bursting; tenacity backs off before the retry
+        resp.raise_for_status()
 
     @retry(
         retry=retry_if_exception_type((httpx.HTTPStatusError, httpx.ConnectError)),
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=30),
     )
-    async def _get(self, path: str, params: Optional[dict] = None) -> dict:
+    async def _get(
+        self, path: str, params: dict[str, Any] | None = None, cache_ttl: float = 0.0
+    ) -> dict[str, Any]:
+        """
+        GET a JSON endpoint.
+
+        With cache_ttl > 0, a response for the same path/params younger than
+        cache_ttl seconds is returned from memory without a request. Cached
+        dicts are shared between callers and must not be mutated.
+        """
+        key = (path, tuple(sorted(params.items())) if params else ())
+        if cache_ttl > 0:
+            hit = self._cache.get(key)
+            if hit is not None:
+                if hit[0] > time.monotonic():
+                    self._cache.move_to_end(key)
+                    return hit[1]
+                del self._cache[key]
+
         assert self._client is not None
         await self._throttle()
         headers = self._auth_headers("GET", path)
         resp = await self._client.get(path, params=params, headers=headers)
-        resp.raise_for_status()
-        return resp.json()
+        self._raise_for_status(resp)
+        data: dict[str, Any] = orjson.loads(resp.content)
+
+        if cache_ttl > 0:
+            self._cache[key] = (time.monotonic() + cache_ttl, data)
+            if len(self._cache) > CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+        return data
 
     @retry(
         retry=retry_if_exception_type((httpx.HTTPStatusError, httpx.ConnectError)),
         stop=stop_after_attempt(2),
         wait=wait_exponential(multiplier=1, min=1, max=10),
     )
-    async def _post(self, path: str, json_body: dict) -> dict:
+    async def _post(self, path: str, json_body: dict[str, Any]) -> dict[str, Any]:
         assert self._client is not None
         await self._throttle()
         headers = self._auth_headers("POST", path)
-        resp = await self._client.post(path, json=json_body, headers=headers)
-        resp.raise_for_status()
-        return resp.json()
+        headers["Content-Type"] = "application/json"
+        # orjson rather than httpx's json= (stdlib json.dumps) for the order body
+        resp = await self._client.post(path, content=orjson.dumps(json_body), headers=headers)
+        self._raise_for_status(resp)
+        result: dict[str, Any] = orjson.loads(resp.content)
+        return result
 
     async def place_order(
         self,
@@ -127,9 +258,9 @@ class KalshiAdapter:
         action: str,
         count: int,
         type: str = "limit",
-        yes_price: Optional[int] = None,
-        no_price: Optional[int] = None,
-    ) -> dict:
+        yes_price: int | None = None,
+        no_price: int | None = None,
+    ) -> dict[str, Any]:
         """
         Place a limit order on Kalshi.
         side: "yes" | "no"
@@ -146,7 +277,7 @@ class KalshiAdapter:
             raise ValueError('action must be "buy" or "sell"')
         if yes_price is None and no_price is None:
             raise ValueError("Provide yes_price or no_price (in cents 1-99)")
-        payload: dict = {
+        payload: dict[str, Any] = {
             "ticker": ticker,
             "side": side,
             "action": action,
@@ -157,65 +288,156 @@ class KalshiAdapter:
             payload["yes_price"] = max(1, min(99, yes_price))
         if no_price is not None:
             payload["no_price"] = max(1, min(99, no_price))
-        return await self._post("/portfolio/orders", payload)
+        try:
+            return await self._post("/portfolio/orders", payload)
+        finally:
+            # Even a failed request may have reached the book; never serve a pre-order snapshot
+            self._invalidate_orderbooks(ticker)
+
+    def _invalidate_orderbooks(self, ticker: str) -> None:
+        """Drop cached single and batched orderbook responses that include ticker."""
+        single = f"/markets/{ticker}/orderbook"
+        stale = [
+            key
+            for key in self._cache
+            if key[0] == single
+            or (
+                key[0] == "/markets/orderbooks"
+                and ticker in dict(key[1]).get("tickers", "").split(",")
+            )
+        ]
+        for key in stale:
+            del self._cache[key]
 
-    async def list_markets(self, series_ticker: Optional[str] = None, limit: int = 100, status: str = "open") -> list[dict]:
+    async def list_markets(
+        self, series_ticker: str | None = None, limit: int = 100, status: str = "open"
+    ) -> list[dict[str, Any]]:
         """
         Fetch markets from Kalshi, optionally filtered by series_ticker.
         Returns list of raw market dicts.
         """
-        params: dict = {"limit": limit, "status": status}
+        params: dict[str, Any] = {"limit": limit, "status": status}
         if series_ticker:
             params["series_ticker"] = series_ticker
-        data = await self._get("/markets", params=params)
-        return data.get("markets", [])
+        data = await self._get("/markets", params=params, cache_ttl=MARKETS_CACHE_TTL)
+        markets: list[dict[str, Any]] = data.get("markets", [])
+        return markets
 
-    async def list_contracts(self, limit: int = 200, series_ticker: Optional[str] = None) -> list[KalshiContract]:
+    async def list_contracts(
+        self,
+        limit: int = 200,
+        series_ticker: str | None = None,
+        max_results: int | None = None,
+    ) -> list[KalshiContract]:
         """
         Fetch active contracts from Kalshi.
         If series_ticker is set, only return contracts in that series.
+        If max_results is set, page sizes shrink to what is still needed and
+        pagination stops as soon as that many contracts are collected.
         Returns list of YES-side contracts only.
         """
-        contracts: list[KalshiContract] = []
-        cursor: Optional[str] = None
+        pages = self.iter_contracts(
+            limit=limit, series_ticker=series_ticker, max_results=max_results
+        )
+        async with aclosing(pages):
+            return [c async for c in pages]
+
+    async def iter_contracts(
+        self,
+        limit: int = 200,
+        series_ticker: str | None = None,
+        max_results: int | None = None,
+        prefetch: bool = False,
+    ) -> AsyncGenerator[KalshiContract, None]:
+        """
+        Yield active YES-side contracts page by page.
+
+        Each page is parsed and yielded before the next is requested, so a
+        caller that stops iterating early never fetches the remaining pages.
+        With prefetch=True the next page is requested as soon as the current
+        one is parsed and downloads while the caller consumes it; a caller
+        that stops early then costs at most one extra (cancelled) request.
+
+        A caller that may stop early must iterate inside
+        contextlib.aclosing(...): otherwise the generator (and a pending
+        prefetch) is only finalized when garbage-collected, possibly after
+        close() has shut the client.
+        """
+        if max_results is not None and max_results <= 0:
+            return  # nothing wanted: a limit<=0 request would fetch a full page anyway
+        seen: set[str] = set()  # tickers already taken (pages can overlap as the book moves)
+        cursor: str | None = None
         max_pages = 10
+        count = 0
+        next_page: asyncio.Task[dict[str, Any]] | None = None
 
-        for page in range(max_pages):
-            params: dict = {"limit": limit, "status": "open"}
+        def _fetch_page(cursor: str | None) -> Coroutine[Any, Any, dict[str, Any]]:
+            page_size = limit if max_results is None else min(limit, max_results - count)
+            params: dict[str, Any] = {"limit": page_size, "status": "open"}
             if series_ticker:
                 params["series_ticker"] = series_ticker
             if cursor:
                 params["cursor"] = cursor
+            return self._get("/markets", params=params, cache_ttl=MARKETS_CACHE_TTL)
 
-            try:
-                data = await self._get("/markets", params=params)
-            except Exception:
-                break
-
-            for m in data.get("markets", []):
-                contract = self._parse_contract(m)
-                if contract:
-                    contracts.append(contract)
-
-            cursor = data.get("cursor")
-            if not cursor:
-                break
-
-        return contracts
+        try:
+            for page in range(max_pages):
+                try:
+                    data = await (next_page or _fetch_page(cursor))
+                except Exception:  # noqa: BLE001 - a failed page ends the listing
+                    return
+                next_page = None
+
+                fetched_at = datetime.now(UTC)
+                contracts: list[KalshiContract] = []
+                for m in data.get("markets", []):
+                    ticker = m.get("ticker", "")
+                    if ticker in seen:
+                        continue
+                    contract = self._parse_contract(m, fetched_at)
+                    if contract:
+                        seen.add(ticker)
+                        contracts.append(contract)
+                        count += 1
+                        if max_results is not None and count >= max_results:
+                            break
+
+                cursor = data.get("cursor")
+                done = not cursor or (max_results is not None and count >= max_results)
+                if prefetch and not done and page + 1 < max_pages:
+                    next_page = asyncio.create_task(_fetch_page(cursor))
+
+                for contract in contracts:
+                    yield contract
+                if done:
+                    return
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+                # Wait for the cancellation so no request outlives the iteration
+                await asyncio.gather(next_page, return_exceptions=True)
+
+    def _parse_contract(
+        self, raw: dict[str, Any], fetched_at: datetime | None = None
+    ) -> KalshiContract | None:
+        """
+        Parse a Kalshi market into a contract (YES side only).
 
-    def _parse_contract(self, raw: dict) -> Optional[KalshiContract]:
-        """Parse a Kalshi market into a contract (YES side only)."""
+        fetched_at lets list_contracts stamp a whole page with one timestamp.
+        """
         try:
             ticker = raw.get("ticker", "")
-            title = raw.get("title", raw.get("subtitle", ""))
+            title = raw.get("title")
+            if title is None:
+                title = raw.get("subtitle", "")
             status = raw.get("status", "")
 
-            # Parse expiration
+            # Parse expiration (fromisoformat accepts a trailing "Z" on 3.11+)
             exp_str = raw.get("expiration_time") or raw.get("close_time")
             close_time = None
             if exp_str:
                 try:
-                    close_time = datetime.fromisoformat(exp_str.replace("Z", "+00:00"))
+                    close_time = _parse_iso_datetime(exp_str)
                 except (ValueError, TypeError):
                     pass
 
@@ -238,21 +460,30 @@ class KalshiAdapter:
                 settlement_rules=raw.get("rules", ""),
                 status=status,
                 last_price=yes_price,
-                fetched_at=datetime.now(timezone.utc),
+                fetched_at=fetched_at or datetime.now(UTC),
             )
-        except Exception:
+        except Exception:  # noqa: BLE001 - malformed market: skip it
             return None
 
-    async def get_top_of_book(self, contract_id: str) -> Optional[KalshiTopOfBook]:
+    async def get_top_of_book(self, contract_id: str) -> KalshiTopOfBook | None:
         """Fetch orderbook for a contract."""
         try:
-            data = await self._get(f"/markets/{contract_id}/orderbook")
-        except Exception:
+            data = await self._get(
+                f"/markets/{contract_id}/orderbook", cache_ttl=ORDERBOOK_CACHE_TTL
+            )
+        except Exception:  # noqa: BLE001 - no book for this contract this cycle
             return None
+        return self._parse_top_of_book(contract_id, data)
 
+    def _parse_top_of_book(self, contract_id: str, data: dict[str, Any]) -> KalshiTopOfBook:
+        """Build a top-of-book snapshot from an orderbook payload."""
         ob = data.get("orderbook", data)
-        yes_bids = ob.get("yes", []) if isinstance(ob.get("yes"), list) else []
-        no_bids = ob.get("no", []) if isinstance(ob.get("no"), list) else []
+        yes_bids = ob.get("yes")
+        if not isinstance(yes_bids, list):
+            yes_bids = []
+        no_bids = ob.get("no")
+        if not isinstance(no_bids, list):
+            no_bids = []
 
         yes_bid = None
         yes_bid_size = 0
@@ -260,19 +491,23 @@ class KalshiAdapter:
         yes_ask_size = 0
         no_bid = None
         no_bid_size = 0
+        no_ask = None
 
+        # Only the best (highest-priced) level on each ladder is needed: one max() pass, no sort
+        # and no array conversion.
+        # Complements are taken in integer cents so each price is converted exactly once.
         if yes_bids:
-            sorted_yes = sorted(yes_bids, key=lambda x: x[0], reverse=True)
-            yes_bid = cents_to_decimal(sorted_yes[0][0])
-            yes_bid_size = sorted_yes[0][1]
+            yes_bid_cents, yes_bid_size = max(yes_bids, key=itemgetter(0))[:2]
+            yes_bid = cents_to_decimal(yes_bid_cents)
+            if yes_bid_cents:
+                no_ask = cents_to_decimal(100 - yes_bid_cents)
 
         if no_bids:
-            sorted_no = sorted(no_bids, key=lambda x: x[0], reverse=True)
+            no_bid_cents, no_bid_size = max(no_bids, key=itemgetter(0))[:2]
+            no_bid = cents_to_decimal(no_bid_cents)
             # YES ask ≈ 1 - NO bid
-            yes_ask = 1.0 - cents_to_decimal(sorted_no[0][0])
-            yes_ask_size = sorted_no[0][1]
-            no_bid = cents_to_decimal(sorted_no[0][0])
-            no_bid_size = sorted_no[0][1]
+            yes_ask = cents_to_decimal(100 - no_bid_cents)
+            yes_ask_size = no_bid_size
 
         return KalshiTopOfBook(
             contract_id=contract_id,
@@ -281,15 +516,141 @@ class KalshiAdapter:
             yes_bid_size=yes_bid_size,
             yes_ask_size=yes_ask_size,
             no_bid=no_bid,
-            no_ask=1.0 - yes_bid if yes_bid else None,
+            no_ask=no_ask,
             no_bid_size=no_bid_size,
             no_ask_size=yes_bid_size,
-            timestamp=datetime.now(timezone.utc),
+            timestamp=datetime.now(UTC),
         )
 
-    async def __aenter__(self) -> KalshiAdapter:
+    async def get_top_of_books(
+        self,
+        contract_ids: list[str],
+        concurrency: int = 10,
+    ) -> dict[str, KalshiTopOfBook | None]:
+        """
+        Fetch orderbooks for many contracts concurrently.
+
+        At most `concurrency` requests are in flight; the shared throttle still
+        applies. Returns contract_id → top of book (None if the fetch failed).
+        """
+        unique_ids = list(dict.fromkeys(contract_ids))
+        result: dict[str, KalshiTopOfBook | None] = dict.fromkeys(unique_ids)
+
+        if self._supports_batch_orderbooks is None:
+            self._load_batch_capability()
+        chunks = [
+            unique_ids[start : start + BATCH_ORDERBOOK_MAX_TICKERS]
+            for start in range(0, len(unique_ids), BATCH_ORDERBOOK_MAX_TICKERS)
+        ]
+        if chunks and self._supports_batch_orderbooks is None:
+            # Undecided: the first chunk probes the endpoint before anything else is sent
+            batch = await self._get_top_of_books_batch(chunks.pop(0))
+            if batch is None:
+                chunks = []
+            else:
+                result.update(batch)
+        if chunks and self._supports_batch_orderbooks:
+            # Known to work: remaining chunks go out together
+            for batch in await asyncio.gather(*(self._get_top_of_books_batch(c) for c in chunks)):
+                if batch:
+                    result.update(batch)
+
+        # Per-ticker fallback for anything the batch endpoint did not return
+        missing = [cid for cid, tob in result.items() if tob is None]
+        sem = asyncio.Semaphore(max(1, concurrency))
+
+        async def _fetch(contract_id: str) -> KalshiTopOfBook | None:
+            async with sem:
+                return await self.get_top_of_book(contract_id)
+
+        books = await asyncio.gather(*(_fetch(cid) for cid in missing))
+        result.update(zip(missing, books))
+        return result
+
+    async def _get_top_of_books_batch(
+        self, contract_ids: list[str]
+    ) -> dict[str, KalshiTopOfBook] | None:
+        """
+        Fetch several orderbooks with one GET /markets/orderbooks?tickers=... call.
+
+        Returns None when the batch endpoint is unavailable; the first such
+        failure marks it unsupported for every adapter on this base_url.
+        """
+        # Probe without tenacity backoff: a 404/405 here means "not supported", not "retry"
+        get_once = KalshiAdapter._get.retry_with(stop=stop_after_attempt(1), reraise=True)
+        try:
+            data = await get_once(
+                self,
+                "/markets/orderbooks",
+                params={"tickers": ",".join(contract_ids)},
+                cache_ttl=ORDERBOOK_CACHE_TTL,
+            )
+        except httpx.HTTPStatusError as e:
+            status = e.response.status_code
+            if status in (404, 405):
+                self._set_batch_capability(False)  # endpoint missing: remember across runs
+            elif status not in _TRANSIENT_PROBE_STATUSES and status < 500:
+                # Rejected for another reason (bad params?): skip it in this process only
+                self._set_batch_capability(False, persist=False)
+            return None
+        except Exception:  # noqa: BLE001 - transient; keep the capability undecided
+            return None
+
+        entries = data.get("orderbooks")
+        if not isinstance(entries, list):
+            self._set_batch_capability(False)
+            return None
+
+        self._set_batch_capability(True)
+        books: dict[str, KalshiTopOfBook] = {}
+        for entry in entries:
+            ticker = entry.get("ticker")
+            if ticker:
+                books[ticker] = self._parse_top_of_book(ticker, entry)
+        return books
+
+    def _capability_file(self) -> Path | None:
+        if self._cache_dir is None:
+            return None
+        return (
+            self._cache_dir
+            / f"capabilities-{hashlib.sha1(self._base_url.encode()).hexdigest()}.json"
+        )
+
+    def _load_batch_capability(self) -> None:
+        """Adopt a fresh batch-orderbook probe result from an earlier run, if any."""
+        path = self._capability_file()
+        if path is None or not path.exists():
+            return
+        try:
+            raw = orjson.loads(path.read_bytes())
+            if time.time() - float(raw["checked_at"]) < CAPABILITY_CACHE_TTL:
+                supported = bool(raw["batch_orderbooks"])
+                KalshiAdapter._batch_orderbooks_by_url[self._base_url] = supported
+        except (OSError, ValueError, KeyError, TypeError):
+            pass  # unreadable cache entry: probe again
+
+    def _set_batch_capability(self, supported: bool, persist: bool = True) -> None:
+        """Record the probe result for this process and, best-effort, for later runs."""
+        if self._supports_batch_orderbooks is supported:
+            return
+        KalshiAdapter._batch_orderbooks_by_url[self._base_url] = supported
+        path = self._capability_file() if persist else None
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_bytes(
+                orjson.dumps({"batch_orderbooks": supported, "checked_at": time.time()})
+            )
+            os.replace(tmp, path)
+        except OSError:
+            pass  # cache is best-effort
+
+    async def __aenter__(self) -> Self:
         await self.connect()
         return self
 
-    async def __aexit__(self, *exc) -> None:
+    async def __aexit__(self, *exc: object) -> None:
         await self.close()
@@ -9,12 +9,17 @@ Requires API key (free tier: 500 requests/month).
 
 from __future__ import annotations
 
-import time
 import asyncio
-from datetime import datetime, timezone
-from typing import Optional
+import hashlib
+import time
+from collections.abc import Collection
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Self
+from urllib.parse import urlencode
 
 import httpx
+import orjson
 from tenacity import (
     retry,
     retry_if_exception_type,
@@ -22,7 +27,17 @@ from tenacity import (
     wait_exponential,
 )
 
-from kalshi_odds.models.odds import OddsQuote, OddsFormat, MarketType
+from kalshi_odds.models.odds import MarketType, OddsFormat, OddsQuote
+
+# Response cache freshness (seconds) for slow-changing listings. Odds are never cached.
+SPORTS_CACHE_TTL = 86_400.0
+EVENTS_CACHE_TTL = 300.0
+
+# Most event ids sent in one eventIds filter; longer lists fetch the whole sport
+EVENT_IDS_FILTER_MAX = 100
+
+# Odds API market key -> MarketType (dict hit instead of Enum lookup + ValueError per market)
+_MARKET_TYPES: dict[str, MarketType] = {m.value: m for m in MarketType}
 
 
 class OddsAPIAdapter:
@@ -32,23 +47,53 @@ class OddsAPIAdapter:
     Read-only, no execution capabilities.
     """
 
+    __slots__ = (
+        "_api_key",
+        "_base_url",
+        "_cache",
+        "_cache_dir",
+        "_client",
+        "_keepalive_expiry",
+        "_last_request_time",
+        "_min_delay",
+        "_throttle_lock",
+    )
+
     def __init__(
         self,
         api_key: str,
         base_url: str = "https://api.the-odds-api.com/v4",
         requests_per_second: float = 1.0,  # Conservative for free tier
+        cache_dir: str | Path | None = None,
+        keepalive_expiry: float = 60.0,
     ) -> None:
         self._api_key = api_key
         self._base_url = base_url.rstrip("/")
         self._min_delay = 1.0 / requests_per_second
         self._last_request_time = 0.0
-        self._client: Optional[httpx.AsyncClient] = None
+        self._throttle_lock = asyncio.Lock()
+        self._client: httpx.AsyncClient | None = None
+        # Cached listings survive restarts under cache_dir (None = memory only)
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+        # "path?params" → (fetched_at epoch seconds, ETag or "", response json)
+        self._cache: dict[str, tuple[float, str, dict[str, Any] | list[Any]]] = {}
+        # Idle seconds pooled Odds API connections stay open; quota-limited polling is
+        # sparse, so a short expiry would re-handshake on every odds fetch
+        self._keepalive_expiry = keepalive_expiry
 
     async def connect(self) -> None:
         """Initialize connection."""
+        # Keep-alive HTTP/2 client: sports/events/odds calls reuse one TLS
+        # connection to the API host instead of reconnecting per request.
         self._client = httpx.AsyncClient(
             base_url=self._base_url,
             timeout=httpx.Timeout(30.0, connect=10.0),
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=10,
+                max_keepalive_connections=5,
+                keepalive_expiry=self._keepalive_expiry,
+            ),
         )
 
     async def close(self) -> None:
@@ -58,47 +103,109 @@ class OddsAPIAdapter:
             self._client = None
 
     async def _throttle(self) -> None:
-        now = time.monotonic()
-        elapsed = now - self._last_request_time
-        if elapsed < self._min_delay:
-            await asyncio.sleep(self._min_delay - elapsed)
-        self._last_request_time = time.monotonic()
+        # Serialized so concurrent callers still respect the (quota-billed) rate limit
+        async with self._throttle_lock:
+            now = time.monotonic()
+            elapsed = now - self._last_request_time
+            if elapsed < self._min_delay:
+                await asyncio.sleep(self._min_delay - elapsed)
+            self._last_request_time = time.monotonic()
 
     @retry(
         retry=retry_if_exception_type((httpx.HTTPStatusError, httpx.ConnectError)),
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=30),
     )
-    async def _get(self, path: str, params: Optional[dict] = None) -> dict | list:
+    async def _get(
+        self, path: str, params: dict[str, Any] | None = None, cache_ttl: float = 0.0
+    ) -> dict[str, Any] | list[Any]:
+        """
+        GET a JSON endpoint.
+
+        With cache_ttl > 0 a response younger than cache_ttl seconds is served
+        from memory (or from cache_dir, across runs) without a request. A
+        stale entry with an ETag is revalidated; a 304 keeps the cached body.
+        """
+        params = dict(params or {})
+        key = f"{path}?{urlencode(sorted(params.items()))}"
+        cached = None
+        if cache_ttl > 0:
+            cached = self._cache.get(key) or self._read_disk_cache(key)
+            if cached is not None and time.time() - cached[0] < cache_ttl:
+                self._cache[key] = cached
+                return cached[2]
+
         assert self._client is not None
         await self._throttle()
-        
-        params = params or {}
+
         params["apiKey"] = self._api_key
-        
-        resp = await self._client.get(path, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        headers = {"If-None-Match": cached[1]} if cached is not None and cached[1] else None
+
+        resp = await self._client.get(path, params=params, headers=headers)
+        if resp.status_code == 304 and cached is not None:
+            data = cached[2]
+            etag = cached[1]
+        else:
+            resp.raise_for_status()
+            data = orjson.loads(resp.content)
+            etag = resp.headers.get("etag", "")
+
+        if cache_ttl > 0:
+            entry = (time.time(), etag, data)
+            self._cache[key] = entry
+            self._write_disk_cache(key, entry)
+        return data
+
+    def _cache_file(self, key: str) -> Path | None:
+        if self._cache_dir is None:
+            return None
+        # Keyed by the full URL: adapters for different hosts never share entries
+        url = f"{self._base_url}{key}"
+        return self._cache_dir / f"{hashlib.sha1(url.encode()).hexdigest()}.json"
 
-    async def list_sports(self) -> list[dict]:
+    def _read_disk_cache(self, key: str) -> tuple[float, str, dict[str, Any] | list[Any]] | None:
+        path = self._cache_file(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            raw = orjson.loads(path.read_bytes())
+            return (float(raw["fetched_at"]), raw.get("etag", ""), raw["data"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None  # unreadable cache entry: treat as a miss
+
+    def _write_disk_cache(
+        self, key: str, entry: tuple[float, str, dict[str, Any] | list[Any]]
+    ) -> None:
+        path = self._cache_file(key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(
+                orjson.dumps({"fetched_at": entry[0], "etag": entry[1], "data": entry[2]})
+            )
+        except OSError:
+            pass  # cache is best-effort
+
+    async def list_sports(self) -> list[dict[str, Any]]:
         """
         List available sports.
-        
+
         Returns list of sport objects:
         [
             {"key": "americanfootball_nfl", "group": "American Football", "title": "NFL", ...},
             ...
         ]
         """
-        return await self._get("/sports")  # type: ignore
+        return await self._get("/sports", cache_ttl=SPORTS_CACHE_TTL)  # type: ignore
 
-    async def list_events(self, sport: str) -> list[dict]:
+    async def list_events(self, sport: str) -> list[dict[str, Any]]:
         """
         List upcoming events for a sport.
-        
+
         Args:
             sport: Sport key (e.g., "americanfootball_nfl")
-            
+
         Returns list of events:
         [
             {
@@ -112,7 +219,8 @@ class OddsAPIAdapter:
             ...
         ]
         """
-        return await self._get(f"/sports/{sport}/events")  # type: ignore
+        path = f"/sports/{sport}/events"
+        return await self._get(path, cache_ttl=EVENTS_CACHE_TTL)  # type: ignore
 
     async def get_odds(
         self,
@@ -120,18 +228,21 @@ class OddsAPIAdapter:
         regions: str = "us",
         markets: str = "h2h",
         odds_format: str = "american",
-        bookmakers: Optional[str] = None,
-    ) -> list[dict]:
+        bookmakers: str | None = None,
+        event_ids: Collection[str] | None = None,
+    ) -> list[dict[str, Any]]:
         """
         Get odds for all events in a sport.
-        
+
         Args:
             sport: Sport key
             regions: Comma-separated regions (us, uk, eu, au)
             markets: Comma-separated markets (h2h, spreads, totals, outrights, etc.)
             odds_format: "american" or "decimal"
             bookmakers: Optional comma-separated bookmaker keys
-            
+            event_ids: Optional event ids to keep. Filtered server-side (smaller
+                payload) when there are at most EVENT_IDS_FILTER_MAX of them.
+
         Returns list of events with odds:
         [
             {
@@ -167,83 +278,92 @@ class OddsAPIAdapter:
         }
         if bookmakers:
             params["bookmakers"] = bookmakers
-        
-        return await self._get(f"/sports/{sport}/odds", params=params)  # type: ignore
+        if event_ids is not None and len(event_ids) <= EVENT_IDS_FILTER_MAX:
+            params["eventIds"] = ",".join(sorted(event_ids))
+
+        events: list[dict] = await self._get(f"/sports/{sport}/odds", params=params)  # type: ignore
+        if event_ids is None:
+            return events
+        wanted = set(event_ids)
+        return [e for e in events if e.get("id") in wanted]
 
-    def parse_odds_to_quotes(self, raw_events: list[dict]) -> list[OddsQuote]:
+    def parse_odds_to_quotes(self, raw_events: list[dict[str, Any]]) -> list[OddsQuote]:
         """
         Parse The Odds API response into OddsQuote objects.
-        
+
         Args:
             raw_events: Raw events list from get_odds()
-            
+
         Returns list of OddsQuote objects
         """
         quotes: list[OddsQuote] = []
-        
+        # One fetch timestamp for the whole response
+        fetched_at = datetime.now(UTC)
+
         for event in raw_events:
             event_id = event.get("id", "")
             sport = event.get("sport_key", "")
             commence_time_str = event.get("commence_time")
-            
+
             commence_time = None
             if commence_time_str:
                 try:
-                    commence_time = datetime.fromisoformat(commence_time_str.replace("Z", "+00:00"))
+                    commence_time = datetime.fromisoformat(commence_time_str)  # 3.11+ accepts "Z"
                 except (ValueError, TypeError):
                     pass
-            
+
             # Build event title
             home = event.get("home_team", "")
             away = event.get("away_team", "")
             event_title = f"{away} @ {home}" if away and home else ""
-            
+
             for bookmaker in event.get("bookmakers", []):
                 bookmaker_key = bookmaker.get("key", "")
-                
+
                 for market in bookmaker.get("markets", []):
                     market_key = market.get("key", "")
-                    
+
                     # Map to MarketType
-                    try:
-                        market_type = MarketType(market_key)
-                    except ValueError:
+                    market_type = _MARKET_TYPES.get(market_key)
+                    if market_type is None:
                         continue  # Skip unknown market types
-                    
+
                     for outcome in market.get("outcomes", []):
                         selection = outcome.get("name", "")
                         price = outcome.get("price")
                         point = outcome.get("point")  # For spreads/totals
-                        
+
                         if price is None:
                             continue
-                        
+
                         # Determine odds format
                         if isinstance(price, int) or (isinstance(price, float) and abs(price) > 10):
                             odds_format = OddsFormat.AMERICAN
                         else:
                             odds_format = OddsFormat.DECIMAL
-                        
-                        quotes.append(OddsQuote(
-                            source="theoddsapi",
-                            bookmaker=bookmaker_key,
-                            event_id=event_id,
-                            market_type=market_type,
-                            selection=selection,
-                            odds_format=odds_format,
-                            odds_value=float(price),
-                            point=point,
-                            timestamp=datetime.now(timezone.utc),
-                            event_title=event_title,
-                            sport=sport,
-                            commence_time=commence_time,
-                        ))
-        
+
+                        quotes.append(
+                            OddsQuote(
+                                source="theoddsapi",
+                                bookmaker=bookmaker_key,
+                                event_id=event_id,
+                                market_type=market_type,
+                                selection=selection,
+                                odds_format=odds_format,
+                                odds_value=float(price),
+                                point=point,
+                                timestamp=fetched_at,
+                                event_title=event_title,
+                                sport=sport,
+                                commence_time=commence_time,
+                            )
+                        )
+
         return quotes
 
-    async def __aenter__(self) -> OddsAPIAdapter:
+    async def __aenter__(self) -> Self:
         await self.connect()
         return self
 
-    async def __aexit__(self, *exc) -> None:
+    async def __aexit__(self, *exc: object) -> None:
         await self.close()
@@ -2,29 +2,38 @@
 
 from __future__ import annotations
 
-import asyncio
-import json
-from datetime import datetime, timezone
+from collections import defaultdict
+from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any
 
 import typer
 from rich.console import Console
-from rich.table import Table
 
-from kalshi_odds.config import get_settings
-from kalshi_odds.adapters.kalshi import KalshiAdapter
-from kalshi_odds.adapters.odds_api import OddsAPIAdapter
-from kalshi_odds.core.automapper import auto_map as run_auto_map
-from kalshi_odds.core.matcher import MarketMatcher
-from kalshi_odds.core.scanner import Scanner, aggregate_opportunities
-from kalshi_odds.db import Repository
-from kalshi_odds.models.comparison import Alert, Opportunity
+# Settings, adapters, DB and models are imported inside the commands that use
+# them, so --help and argument errors never load pydantic/httpx/aiosqlite.
+if TYPE_CHECKING:
+    from collections.abc import Coroutine
+
+    from pydantic import TypeAdapter
+    from rich.text import Text
+
+    from kalshi_odds.adapters.kalshi import KalshiAdapter
+    from kalshi_odds.adapters.odds_api import OddsAPIAdapter
+    from kalshi_odds.config import Settings
+    from kalshi_odds.core.matcher import MarketMatcher
+    from kalshi_odds.core.scanner import Scanner
+    from kalshi_odds.db import Repository
+    from kalshi_odds.models.comparison import Alert, Opportunity
+    from kalshi_odds.models.odds import OddsQuote
 
 app = typer.Typer(
     name="kalshi-odds",
     help="Alert-only Kalshi vs Sportsbook odds comparison scanner.",
     no_args_is_help=True,
+    # No --install-completion: skips loading Typer's shell-completion machinery on every run
+    add_completion=False,
 )
 console = Console()
 
@@ -32,6 +41,76 @@ console = Console()
 LAST_OPPORTUNITIES_FILE = Path(".last_opportunities.json")
 
 
+def _run_async(coro: Coroutine[Any, Any, Any]) -> Any:
+    """
+    Run a command's coroutine on an asyncio.Runner-owned event loop and return its result.
+
+    Uses uvloop's libuv-backed loop when the "fast" extra is installed (not on Windows).
+    """
+    import asyncio
+
+    try:
+        import uvloop
+    except ImportError:
+        loop_factory = None
+    else:
+        loop_factory = uvloop.new_event_loop
+
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        return runner.run(coro)
+
+
+@lru_cache(maxsize=1)
+def _opportunity_list() -> TypeAdapter[list[Opportunity]]:
+    """Whole-list (de)serializer: one pydantic-core pass instead of a model call per item."""
+    from pydantic import TypeAdapter
+
+    from kalshi_odds.models.comparison import Opportunity
+
+    return TypeAdapter(list[Opportunity])
+
+
+def _kalshi_adapter(settings: Settings, keepalive_expiry: float = 60.0) -> KalshiAdapter:
+    """Kalshi adapter configured from settings (one per command; it owns its response cache)."""
+    from kalshi_odds.adapters.kalshi import KalshiAdapter
+
+    return KalshiAdapter(
+        api_key_id=settings.kalshi_api_key_id,
+        private_key_path=settings.kalshi_private_key_path,
+        base_url=settings.kalshi_base_url,
+        requests_per_second=settings.kalshi_requests_per_second,
+        cache_dir=settings.kalshi_cache_dir or None,
+        keepalive_expiry=keepalive_expiry,
+    )
+
+
+def _odds_adapter(settings: Settings, keepalive_expiry: float = 60.0) -> OddsAPIAdapter:
+    """Odds API adapter configured from settings, sharing the on-disk listings cache."""
+    from kalshi_odds.adapters.odds_api import OddsAPIAdapter
+
+    return OddsAPIAdapter(
+        api_key=settings.odds_api_key,
+        base_url=settings.odds_api_base_url,
+        requests_per_second=settings.odds_api_requests_per_second,
+        cache_dir=settings.odds_api_cache_dir or None,
+        keepalive_expiry=keepalive_expiry,
+    )
+
+
+def _truncate(text: str, width: int) -> str:
+    """Clip text to width characters, marking the cut with an ellipsis."""
+    return text if len(text) <= width else text[: width - 1] + "…"
+
+
+# Table label per confidence level value
+_CONFIDENCE_LABELS: dict[str, str] = {level: level.upper()[:3] for level in ("low", "med", "high")}
+
+
+def _format_minute(ts: datetime) -> str:
+    """YYYY-MM-DD HH:MM from the datetime fields (no strftime format parsing per row)."""
+    return f"{ts.year:04d}-{ts.month:02d}-{ts.day:02d} {ts.hour:02d}:{ts.minute:02d}"
+
+
 def _format_liquidity(n: int) -> str:
     if n >= 1_000_000:
         return f"{n / 1_000_000:.1f}M"
@@ -48,10 +127,14 @@ def _edge_style(edge_cents: float) -> str:
     return "dim"
 
 
-def _render_opportunities_table(opportunities: list[Opportunity], title: str = "Opportunities") -> None:
+def _render_opportunities_table(
+    opportunities: list[Opportunity], title: str = "Opportunities"
+) -> None:
     if not opportunities:
         console.print("[dim]No opportunities[/]")
         return
+    from rich.table import Table
+
     table = Table(
         title=title,
         show_header=True,
@@ -69,79 +152,165 @@ def _render_opportunities_table(opportunities: list[Opportunity], title: str = "
         edge_style = _edge_style(opp.edge_cents)
         table.add_row(
             str(i),
-            opp.game_label[:22],
+            _truncate(opp.game_label, 22),
             f"[{edge_style}]{opp.edge_cents:.1f}c[/]",
-            opp.kalshi_action[:36],
-            opp.hedge_action[:38],
+            _truncate(opp.kalshi_action, 36),
+            _truncate(opp.hedge_action, 38),
             f"{opp.book_count}",
             _format_liquidity(opp.kalshi_liquidity),
-            opp.confidence.value.upper()[:3],
+            _CONFIDENCE_LABELS[opp.confidence.value],
         )
     console.print(table)
     console.print(
-        "[dim]Detail: kalshi-odds detail <#>     |     Execute: kalshi-odds execute <#> --shares 100[/]"
+        "[dim]Detail: kalshi-odds detail <#>     |     "
+        "Execute: kalshi-odds execute <#> --shares 100[/]"
     )
 
 
+def _detail_text(index: int, opp: Opportunity) -> Text:
+    """Full breakdown for one opportunity, styled spans appended directly (no markup parsing)."""
+    from rich.text import Text
+
+    text = Text("\n")
+    text.append(f"#{index} {opp.game_label}", style="bold")
+    text.append("\n\n")
+    for label, value in (
+        ("Kalshi:", f"  {opp.kalshi_action}"),
+        ("Hedge:", f"   {opp.hedge_action}"),
+        ("Edge:", f"   {opp.edge_cents:.2f}c per share  ({opp.edge_bps:.0f} bps)"),
+        (
+            "Books:",
+            f"  {opp.book_count} agreeing  |  Best: {opp.book_best}  |  Worst: {opp.book_worst}",
+        ),
+        (
+            "Liq:",
+            f"    {_format_liquidity(opp.kalshi_liquidity)} shares  |  Max size: {opp.max_shares}",
+        ),
+        ("P&L:", f"    ${opp.pnl_per_100_shares:.2f} expected per 100 shares"),
+    ):
+        text.append("  ")
+        text.append(label, style="bold")
+        text.append(value + "\n")
+    text.append("\n  ")
+    text.append("P&L scenarios (100 shares):", style="dim")
+    text.append(f"\n    Win on Kalshi side:  ~${opp.edge_cents * 100 / 100:.2f} edge captured")
+    text.append("\n    Lose:                depends on hedge sizing\n\n  ")
+    text.append("Kalshi:", style="bold")
+    text.append(" ")
+    text.append(opp.kalshi_url, style=f"underline bright_blue link {opp.kalshi_url}")
+    text.append("\n")
+    return text
+
+
 def _save_last_opportunities(opportunities: list[Opportunity]) -> None:
-    data = [o.model_dump(mode="json") for o in opportunities]
-    with open(LAST_OPPORTUNITIES_FILE, "w") as f:
-        json.dump(data, f, indent=0, default=str)
+    LAST_OPPORTUNITIES_FILE.write_bytes(_opportunity_list().dump_json(opportunities))
+
+
+def _append_jsonl(path: str, lines: list[str]) -> None:
+    with open(path, "a") as f:
+        f.write("".join(f"{line}\n" for line in lines))
 
 
 def _load_last_opportunities() -> list[Opportunity]:
     if not LAST_OPPORTUNITIES_FILE.exists():
         return []
-    with open(LAST_OPPORTUNITIES_FILE) as f:
-        data = json.load(f)
-    return [Opportunity.model_validate(d) for d in data]
+    return _opportunity_list().validate_json(LAST_OPPORTUNITIES_FILE.read_bytes())
 
 
 @app.command("sync-kalshi")
-def sync_kalshi() -> None:
+def sync_kalshi(
+    limit: int | None = typer.Option(None, "--limit", "-n", help="Stop after this many contracts"),
+    sport: str | None = typer.Option(
+        None,
+        "--sport",
+        "-s",
+        help=(
+            "Only fetch these series: comma-separated sport keys or series tickers "
+            "(e.g. basketball_nba,KXNFLGAME)"
+        ),
+    ),
+) -> None:
     """Fetch and cache Kalshi markets/contracts."""
+    from rich.table import Table
+
+    from kalshi_odds.config import get_settings
+    from kalshi_odds.core.automapper import SPORT_TO_SERIES, resolve_series_ticker
+    from kalshi_odds.db import Repository
+
     settings = get_settings()
-    
+
     if not settings.kalshi_configured:
-        console.print("[red]✗ Kalshi not configured. Set KALSHI_ODDS_KALSHI_API_KEY_ID and KALSHI_ODDS_KALSHI_PRIVATE_KEY_PATH[/]")
+        console.print(
+            "[red]✗ Kalshi not configured. Set KALSHI_ODDS_KALSHI_API_KEY_ID and "
+            "KALSHI_ODDS_KALSHI_PRIVATE_KEY_PATH[/]"
+        )
         raise typer.Exit(1)
 
-    async def _run():
-        async with KalshiAdapter(
-            api_key_id=settings.kalshi_api_key_id,
-            private_key_path=settings.kalshi_private_key_path,
-            base_url=settings.kalshi_base_url,
-            requests_per_second=settings.kalshi_requests_per_second,
-        ) as kalshi, Repository(settings.database_url.split("///")[-1]) as repo:
+    # Known sports/series: filter server-side instead of paging every open market
+    series_tickers: list[str | None] = [None]
+    if sport:
+        requested = [s for s in dict.fromkeys(map(str.strip, sport.split(","))) if s]
+        resolved = {s: resolve_series_ticker(s) for s in requested}
+        unknown = [s for s, ticker in resolved.items() if ticker is None]
+        if unknown or not resolved:
+            console.print(
+                f"[red]✗ Unknown sport/series: {', '.join(unknown) or sport!r}. "
+                f"Supported: {', '.join(SPORT_TO_SERIES)}[/]"
+            )
+            raise typer.Exit(1)
+        # A sport key and its series ticker name the same series: fetch it once
+        series_tickers = list(dict.fromkeys(resolved.values()))
+
+    async def _run() -> None:
+        async with (
+            _kalshi_adapter(settings) as kalshi,
+            Repository(settings.database_url.split("///")[-1]) as repo,
+        ):
             console.print("[blue]Fetching Kalshi contracts...[/]")
-            contracts = await kalshi.list_contracts()
-            
+            if limit is None:
+                # Series are disjoint: page them concurrently (the adapter's throttle
+                # still paces requests)
+                import asyncio
+
+                pages = await asyncio.gather(
+                    *(kalshi.list_contracts(series_ticker=t) for t in series_tickers)
+                )
+                contracts = [c for page in pages for c in page]
+            else:
+                # Capped: fill from each series in turn until the limit is reached
+                contracts = []
+                for series_ticker in series_tickers:
+                    if len(contracts) >= limit:
+                        break
+                    contracts += await kalshi.list_contracts(
+                        series_ticker=series_ticker, max_results=limit - len(contracts)
+                    )
+
             console.print(f"[green]✓[/] Fetched {len(contracts)} contracts")
-            
+
             # Save to database
-            for contract in contracts:
-                await repo.save_kalshi_contract(contract)
-            
-            console.print(f"[green]✓[/] Saved to database")
-            
+            await repo.save_kalshi_contracts(contracts)
+
+            console.print("[green]✓[/] Saved to database")
+
             # Display sample
             table = Table(title="Sample Contracts")
             table.add_column("Contract ID")
             table.add_column("Title")
             table.add_column("Close Time")
             table.add_column("Last Price")
-            
+
             for contract in contracts[:10]:
                 table.add_row(
                     contract.contract_id,
-                    contract.title[:50],
-                    contract.close_time.strftime("%Y-%m-%d %H:%M") if contract.close_time else "",
+                    _truncate(contract.title, 50),
+                    _format_minute(contract.close_time) if contract.close_time else "",
                     f"{contract.last_price:.2f}" if contract.last_price else "",
                 )
-            
+
             console.print(table)
 
-    asyncio.run(_run())
+    _run_async(_run())
 
 
 @app.command("sync-odds")
@@ -149,49 +318,55 @@ def sync_odds(
     sport: str = typer.Option("americanfootball_nfl", "--sport", "-s", help="Sport key"),
 ) -> None:
     """Fetch and cache odds from sportsbooks."""
+    from rich.table import Table
+
+    from kalshi_odds.config import get_settings
+    from kalshi_odds.db import Repository
+    from kalshi_odds.models.odds import OddsFormat
+
     settings = get_settings()
-    
+
     if not settings.odds_api_configured:
         console.print("[red]✗ The Odds API not configured. Set KALSHI_ODDS_ODDS_API_KEY[/]")
         raise typer.Exit(1)
 
-    async def _run():
-        async with OddsAPIAdapter(
-            api_key=settings.odds_api_key,
-            base_url=settings.odds_api_base_url,
-            requests_per_second=settings.odds_api_requests_per_second,
-        ) as odds_api, Repository(settings.database_url.split("///")[-1]) as repo:
+    async def _run() -> None:
+        async with (
+            _odds_adapter(settings) as odds_api,
+            Repository(settings.database_url.split("///")[-1]) as repo,
+        ):
             console.print(f"[blue]Fetching odds for {sport}...[/]")
-            
+
             raw_events = await odds_api.get_odds(sport=sport, markets="h2h")
             quotes = odds_api.parse_odds_to_quotes(raw_events)
-            
+
             console.print(f"[green]✓[/] Fetched {len(quotes)} quotes from {len(raw_events)} events")
-            
+
             # Save to database
-            for quote in quotes:
-                await repo.save_odds_quote(quote)
-            
-            console.print(f"[green]✓[/] Saved to database")
-            
+            await repo.save_odds_quotes(quotes)
+
+            console.print("[green]✓[/] Saved to database")
+
             # Display sample
             table = Table(title="Sample Odds")
             table.add_column("Event")
             table.add_column("Bookmaker")
             table.add_column("Selection")
             table.add_column("Odds")
-            
+
             for quote in quotes[:15]:
                 table.add_row(
-                    quote.event_title[:40],
+                    _truncate(quote.event_title, 40),
                     quote.bookmaker,
-                    quote.selection[:25],
-                    f"{quote.odds_value:+.0f}" if quote.odds_format.value == "american" else f"{quote.odds_value:.2f}",
+                    _truncate(quote.selection, 25),
+                    f"{quote.odds_value:+.0f}"
+                    if quote.odds_format is OddsFormat.AMERICAN
+                    else f"{quote.odds_value:.2f}",
                 )
-            
+
             console.print(table)
 
-    asyncio.run(_run())
+    _run_async(_run())
 
 
 @app.command("match-candidates")
@@ -199,27 +374,32 @@ def match_candidates(
     fuzzy: bool = typer.Option(True, "--fuzzy/--no-fuzzy", help="Enable fuzzy matching"),
 ) -> None:
     """Show fuzzy match candidates for manual review."""
+    from kalshi_odds.config import get_settings
+    from kalshi_odds.core.matcher import MarketMatcher
+    from kalshi_odds.db import Repository
+
     settings = get_settings()
-    if fuzzy:
-        settings.fuzzy_match_enabled = True
+    fuzzy_enabled = fuzzy or settings.fuzzy_match_enabled
 
-    console.print("[yellow]⚠ This command shows candidates only. Review and manually add to mappings.yaml[/]")
-    
-    async def _run():
+    console.print(
+        "[yellow]⚠ This command shows candidates only. Review and manually add to mappings.yaml[/]"
+    )
+
+    async def _run() -> None:
         matcher = MarketMatcher(
             mapping_file=settings.mapping_path,
-            fuzzy_enabled=settings.fuzzy_match_enabled,
+            fuzzy_enabled=fuzzy_enabled,
             fuzzy_threshold=settings.fuzzy_match_threshold,
         )
         matcher.load_mappings()
-        
+
         # Load contracts and quotes from DB
-        async with Repository(settings.database_url.split("///")[-1]) as repo:
+        async with Repository(settings.database_url.split("///")[-1]):
             # Simplified: just show the concept
             console.print("[blue]Fuzzy matching not fully implemented in DB layer.[/]")
             console.print("[blue]Add contracts/quotes to DB via sync commands first.[/]")
 
-    asyncio.run(_run())
+    _run_async(_run())
 
 
 async def _run_scan_cycle(
@@ -228,11 +408,17 @@ async def _run_scan_cycle(
     scanner: Scanner,
     kalshi: KalshiAdapter,
     odds_api: OddsAPIAdapter,
+    top: int | None = None,
+    concurrency: int = 10,
 ) -> tuple[list[Alert], list[Opportunity]]:
-    """Run one scan: fetch odds, compare all mapped markets, return alerts and aggregated opportunities."""
-    raw_events = await odds_api.get_odds(sport=sport)
-    quotes = odds_api.parse_odds_to_quotes(raw_events)
-    all_alerts: list[Alert] = []
+    """
+    Run one scan: fetch odds, compare all mapped markets, return alerts and aggregated
+    opportunities. With top, only the best `top` opportunities are kept; concurrency
+    bounds orderbook requests in flight.
+    """
+    from kalshi_odds.core.scanner import aggregate_opportunities
+
+    mapped: list[tuple[str, dict[str, Any], str, tuple[str, str]]] = []
     for market_key in matcher.get_all_market_keys():
         mapping = matcher.get_mapping(market_key)
         if not mapping:
@@ -241,33 +427,107 @@ async def _run_scan_cycle(
         contract_id = kalshi_data.get("contract_id")
         if not contract_id:
             continue
-        tob = await kalshi.get_top_of_book(contract_id)
-        if not tob:
-            continue
         odds_data = mapping.get("odds", {})
-        event_id = odds_data.get("event_id", "")
-        market_type = odds_data.get("market_type", "")
-        relevant_quotes = [
-            q for q in quotes
-            if q.event_id == event_id and q.market_type.value == market_type
-        ]
+        market = (odds_data.get("event_id", ""), odds_data.get("market_type", ""))
+        mapped.append((market_key, mapping, contract_id, market))
+    if not mapped:
+        return [], []
+    # Only mapped events are priced: ask the API for just those
+    raw_events = await odds_api.get_odds(
+        sport=sport, event_ids={market[0] for *_, market in mapped}
+    )
+    quotes = odds_api.parse_odds_to_quotes(raw_events)
+    # Group quotes by (event_id, market_type) once rather than filtering the full list per mapping
+    quotes_by_market: dict[tuple[str, str], list[OddsQuote]] = defaultdict(list)
+    for q in quotes:
+        quotes_by_market[(q.event_id, q.market_type.value)].append(q)
+    # Keep the mappings worth pricing, then fetch their orderbooks concurrently
+    pending: list[tuple[str, dict[str, Any], str, list[OddsQuote]]] = []
+    for market_key, mapping, contract_id, market in mapped:
+        relevant_quotes = quotes_by_market.get(market)
+        # No sportsbook prices for this market: skip the orderbook request entirely
         if not relevant_quotes:
             continue
+        pending.append((market_key, mapping, contract_id, relevant_quotes))
+    books = await kalshi.get_top_of_books([p[2] for p in pending], concurrency=concurrency)
+    all_alerts: list[Alert] = []
+    for market_key, mapping, contract_id, relevant_quotes in pending:
+        tob = books.get(contract_id)
+        if not tob:
+            continue
         alerts = scanner.compare(market_key, tob, relevant_quotes, mapping)
         all_alerts.extend(alerts)
-    opportunities = aggregate_opportunities(all_alerts)
+    opportunities = aggregate_opportunities(all_alerts, limit=top)
     return all_alerts, opportunities
 
 
+def _scan_header(count: int) -> Text:
+    """Banner line printed above each scan's table; fixed segments are pre-styled, not markup."""
+    from rich.text import Text
+
+    now = datetime.now(UTC).strftime("%b %d %Y %I:%M%p EST")
+    return Text.assemble(
+        "\n",
+        ("KALSHI ODDS SCANNER", "bold"),
+        "  |  ",
+        (f"{count} opportunities", "cyan"),
+        f"  |  {now}\n",
+    )
+
+
+async def _publish_scan(
+    repo: Repository,
+    output_jsonl: str,
+    all_alerts: list[Alert],
+    opportunities: list[Opportunity],
+) -> None:
+    """Display a scan's opportunities and persist its alerts (DB, last-scan file, JSONL)."""
+    import asyncio
+
+    # Console context buffers header + table into a single write on exit
+    with console:
+        console.print(_scan_header(len(opportunities)))
+        _render_opportunities_table(opportunities)
+    _save_last_opportunities(opportunities)
+    # Each alert is serialized once, for both the DB row and the JSONL line
+    alerts_json = [alert.model_dump_json() for alert in all_alerts]
+    writes = [repo.save_alerts(all_alerts, alerts_json)]
+    if all_alerts:
+        writes.append(asyncio.to_thread(_append_jsonl, output_jsonl, alerts_json))
+    # aiosqlite and to_thread each write on their own thread: the two writes overlap
+    await asyncio.gather(*writes)
+
+
 @app.command("scan")
 def scan(
     sport: str = typer.Option(None, "--sport", "-s", help="Sport key (default from config)"),
-    auto_map: Optional[bool] = typer.Option(None, "--auto-map/--no-auto-map", help="Refresh mappings from Kalshi + Odds API before scanning"),
+    auto_map: bool | None = typer.Option(
+        None,
+        "--auto-map/--no-auto-map",
+        help="Refresh mappings from Kalshi + Odds API before scanning",
+    ),
+    top: int | None = typer.Option(
+        None, "--top", "-t", min=1, help="Only show the N best opportunities"
+    ),
+    concurrency: int | None = typer.Option(
+        None,
+        "--concurrency",
+        "-c",
+        min=1,
+        help="Max orderbook requests in flight (default from config)",
+    ),
 ) -> None:
     """One-shot scan: fetch, compare, display ranked opportunities, and exit."""
+    from kalshi_odds.config import get_settings
+    from kalshi_odds.core.automapper import auto_map as run_auto_map
+    from kalshi_odds.core.matcher import MarketMatcher
+    from kalshi_odds.core.scanner import Scanner
+    from kalshi_odds.db import Repository
+
     settings = get_settings()
     sport = sport or settings.default_sport
     do_auto_map = auto_map if auto_map is not None else settings.auto_map_enabled
+    concurrency = concurrency or settings.kalshi_max_concurrency
     if not settings.kalshi_configured:
         console.print("[red]✗ Kalshi not configured[/]")
         raise typer.Exit(1)
@@ -275,24 +535,25 @@ def scan(
         console.print("[red]✗ The Odds API not configured[/]")
         raise typer.Exit(1)
 
-    async def _run():
+    async def _run() -> None:
         async with (
-            KalshiAdapter(
-                api_key_id=settings.kalshi_api_key_id,
-                private_key_path=settings.kalshi_private_key_path,
-            ) as kalshi,
-            OddsAPIAdapter(api_key=settings.odds_api_key) as odds_api,
+            _kalshi_adapter(settings) as kalshi,
+            _odds_adapter(settings) as odds_api,
             Repository(settings.database_url.split("///")[-1]) as repo,
         ):
             if do_auto_map:
                 console.print("[blue]Auto-mapping Kalshi ↔ Odds API...[/]")
                 try:
                     mappings = await run_auto_map(
-                        kalshi, odds_api, sport, settings.mapping_path,
-                        merge_with_existing=True, write=True,
+                        kalshi,
+                        odds_api,
+                        sport,
+                        settings.mapping_path,
+                        merge_with_existing=True,
+                        write=True,
                     )
                     console.print(f"[green]✓[/] Mapped {len(mappings)} markets")
-                except Exception as e:
+                except Exception as e:  # noqa: BLE001 - report and scan with existing mappings
                     console.print(f"[yellow]Auto-map failed: {e}[/]")
             matcher = MarketMatcher(mapping_file=settings.mapping_path, fuzzy_enabled=False)
             loaded = matcher.load_mappings()
@@ -307,33 +568,48 @@ def scan(
                 max_staleness_seconds=settings.max_staleness_seconds,
             )
             console.print(f"[blue]Scanning {sport}...[/]")
-            all_alerts, opportunities = await _run_scan_cycle(sport, matcher, scanner, kalshi, odds_api)
-            now = datetime.now(timezone.utc).strftime("%b %d %Y %I:%M%p EST")
-            console.print(f"\n[bold]KALSHI ODDS SCANNER[/]  |  [cyan]{len(opportunities)} opportunities[/]  |  {now}\n")
-            _render_opportunities_table(opportunities)
-            _save_last_opportunities(opportunities)
-            for alert in all_alerts:
-                await repo.save_alert(alert)
-                with open(settings.output_jsonl, "a") as f:
-                    f.write(alert.model_dump_json() + "\n")
+            all_alerts, opportunities = await _run_scan_cycle(
+                sport, matcher, scanner, kalshi, odds_api, top=top, concurrency=concurrency
+            )
+            await _publish_scan(repo, settings.output_jsonl, all_alerts, opportunities)
 
-    asyncio.run(_run())
+    _run_async(_run())
 
 
 @app.command("run")
 def run(
     sport: str = typer.Option(None, "--sport", "-s"),
-    interval: Optional[float] = typer.Option(None, "--interval", "-i", help="Poll interval in seconds"),
-    auto_map: Optional[bool] = typer.Option(None, "--auto-map/--no-auto-map", help="Refresh mappings before first scan"),
+    interval: float | None = typer.Option(
+        None, "--interval", "-i", help="Poll interval in seconds"
+    ),
+    auto_map: bool | None = typer.Option(
+        None, "--auto-map/--no-auto-map", help="Refresh mappings before first scan"
+    ),
+    top: int | None = typer.Option(
+        None, "--top", "-t", min=1, help="Only show the N best opportunities"
+    ),
+    concurrency: int | None = typer.Option(
+        None,
+        "--concurrency",
+        "-c",
+        min=1,
+        help="Max orderbook requests in flight (default from config)",
+    ),
 ) -> None:
     """Start continuous scanner loop (alerts only)."""
+    from kalshi_odds.config import get_settings
+    from kalshi_odds.core.automapper import auto_map as run_auto_map
+    from kalshi_odds.core.matcher import MarketMatcher
+    from kalshi_odds.core.scanner import Scanner
+    from kalshi_odds.db import Repository
+
     settings = get_settings()
     sport = sport or settings.default_sport
     do_auto_map = auto_map if auto_map is not None else settings.auto_map_enabled
-    if interval:
-        settings.poll_interval_seconds = interval or 60.0
-    else:
-        settings.poll_interval_seconds = 60.0
+    concurrency = concurrency or settings.kalshi_max_concurrency
+    poll_interval = interval or settings.poll_interval_seconds
+    # Outlive the sleep between cycles so each cycle reuses the previous cycle's connections
+    keepalive_expiry = max(60.0, poll_interval + 30.0)
     if not settings.kalshi_configured:
         console.print("[red]✗ Kalshi not configured[/]")
         raise typer.Exit(1)
@@ -342,24 +618,27 @@ def run(
         raise typer.Exit(1)
     console.print("[green]Starting scanner (alert-only mode)...[/]")
 
-    async def _run():
+    async def _run() -> None:
+        import asyncio
+
         async with (
-            KalshiAdapter(
-                api_key_id=settings.kalshi_api_key_id,
-                private_key_path=settings.kalshi_private_key_path,
-            ) as kalshi,
-            OddsAPIAdapter(api_key=settings.odds_api_key) as odds_api,
+            _kalshi_adapter(settings, keepalive_expiry) as kalshi,
+            _odds_adapter(settings, keepalive_expiry) as odds_api,
             Repository(settings.database_url.split("///")[-1]) as repo,
         ):
             if do_auto_map:
                 console.print("[blue]Auto-mapping Kalshi ↔ Odds API...[/]")
                 try:
                     mappings = await run_auto_map(
-                        kalshi, odds_api, sport, settings.mapping_path,
-                        merge_with_existing=True, write=True,
+                        kalshi,
+                        odds_api,
+                        sport,
+                        settings.mapping_path,
+                        merge_with_existing=True,
+                        write=True,
                     )
                     console.print(f"[green]✓[/] Mapped {len(mappings)} markets")
-                except Exception as e:
+                except Exception as e:  # noqa: BLE001 - report and scan with existing mappings
                     console.print(f"[yellow]Auto-map failed: {e}[/]")
             matcher = MarketMatcher(mapping_file=settings.mapping_path, fuzzy_enabled=False)
             loaded = matcher.load_mappings()
@@ -376,29 +655,24 @@ def run(
             )
             while True:
                 try:
-                    console.print(f"[dim]Scanning at [cyan]NOW[/]...[/]")
-                    all_alerts, opportunities = await _run_scan_cycle(sport, matcher, scanner, kalshi, odds_api)
+                    console.print("[dim]Scanning at [cyan]NOW[/]...[/]")
+                    all_alerts, opportunities = await _run_scan_cycle(
+                        sport, matcher, scanner, kalshi, odds_api, top=top, concurrency=concurrency
+                    )
                     if opportunities:
-                        now = datetime.now(timezone.utc).strftime("%b %d %Y %I:%M%p EST")
-                        console.print(f"\n[bold]KALSHI ODDS SCANNER[/]  |  [cyan]{len(opportunities)} opportunities[/]  |  {now}\n")
-                        _render_opportunities_table(opportunities)
-                        _save_last_opportunities(opportunities)
-                        for alert in all_alerts:
-                            await repo.save_alert(alert)
-                            with open(settings.output_jsonl, "a") as f:
-                                f.write(alert.model_dump_json() + "\n")
+                        await _publish_scan(repo, settings.output_jsonl, all_alerts, opportunities)
                     else:
                         console.print("[dim]No opportunities[/]")
-                    await asyncio.sleep(settings.poll_interval_seconds)
+                    await asyncio.sleep(poll_interval)
                 except KeyboardInterrupt:
                     console.print("\n[yellow]Stopped by user[/]")
                     break
-                except Exception as e:
+                except Exception as e:  # noqa: BLE001 - keep the polling loop alive
                     console.print(f"[red]Error: {e}[/]")
                     await asyncio.sleep(10)
 
     try:
-        asyncio.run(_run())
+        _run_async(_run())
     except KeyboardInterrupt:
         console.print("\n[yellow]Stopped[/]")
 
@@ -406,6 +680,7 @@ def run(
 @app.command("detail")
 def detail(
     index: int = typer.Argument(1, help="Opportunity number from last scan (1-based)"),
+    plain: bool = typer.Option(False, "--plain", help="Unstyled text, no wrapping (for scripts)"),
 ) -> None:
     """Show full breakdown for an opportunity from the last scan."""
     opportunities = _load_last_opportunities()
@@ -416,31 +691,36 @@ def detail(
         console.print(f"[red]Invalid index {index}. Use 1–{len(opportunities)}.[/]")
         raise typer.Exit(1)
     opp = opportunities[index - 1]
-    console.print(f"\n[bold]#{index} {opp.game_label}[/]\n")
-    console.print(f"  [bold]Kalshi:[/]  {opp.kalshi_action}")
-    console.print(f"  [bold]Hedge:[/]   {opp.hedge_action}")
-    console.print(f"  [bold]Edge:[/]   {opp.edge_cents:.2f}c per share  ({opp.edge_bps:.0f} bps)")
-    console.print(f"  [bold]Books:[/]  {opp.book_count} agreeing  |  Best: {opp.book_best}  |  Worst: {opp.book_worst}")
-    console.print(f"  [bold]Liq:[/]    {_format_liquidity(opp.kalshi_liquidity)} shares  |  Max size: {opp.max_shares}")
-    console.print(f"  [bold]P&L:[/]    ${opp.pnl_per_100_shares:.2f} expected per 100 shares")
-    console.print(f"\n  [dim]P&L scenarios (100 shares):[/]")
-    console.print(f"    Win on Kalshi side:  ~${opp.edge_cents * 100 / 100:.2f} edge captured")
-    console.print(f"    Lose:                depends on hedge sizing")
-    console.print(f"\n  [bold]Kalshi:[/] [link={opp.kalshi_url}]{opp.kalshi_url}[/]")
-    console.print()
+    text = _detail_text(index, opp)
+    # Plain: the same text without styles in one write, no Rich layout or wrapping
+    if plain:
+        console.file.write(text.plain + "\n")
+        return
+    console.print(text)
 
 
 @app.command("execute")
 def execute(
     index: int = typer.Argument(1, help="Opportunity number from last scan (1-based)"),
     shares: int = typer.Option(100, "--shares", "-n", help="Number of shares to trade"),
-    dry_run: bool = typer.Option(True, "--dry-run/--no-dry-run", help="Preview only, do not place order"),
-    confirm: bool = typer.Option(False, "--confirm", "-y", help="Confirm execution (required for real orders)"),
+    dry_run: bool = typer.Option(
+        True, "--dry-run/--no-dry-run", help="Preview only, do not place order"
+    ),
+    confirm: bool = typer.Option(
+        False, "--confirm", "-y", help="Confirm execution (required for real orders)"
+    ),
 ) -> None:
-    """Place the Kalshi leg of an opportunity (buy/sell YES). You must place the sportsbook hedge manually."""
+    """
+    Place the Kalshi leg of an opportunity (buy/sell YES).
+    You must place the sportsbook hedge manually.
+    """
+    from kalshi_odds.config import get_settings
+
     settings = get_settings()
     if not settings.execution_enabled and not dry_run:
-        console.print("[red]Execution is disabled. Set KALSHI_ODDS_EXECUTION_ENABLED=true to enable.[/]")
+        console.print(
+            "[red]Execution is disabled. Set KALSHI_ODDS_EXECUTION_ENABLED=true to enable.[/]"
+        )
         raise typer.Exit(1)
     opportunities = _load_last_opportunities()
     if not opportunities:
@@ -451,13 +731,18 @@ def execute(
         raise typer.Exit(1)
     opp = opportunities[index - 1]
     if shares > opp.max_shares:
-        console.print(f"[yellow]Requested {shares} shares exceeds max {opp.max_shares}. Capping.[/]")
+        console.print(
+            f"[yellow]Requested {shares} shares exceeds max {opp.max_shares}. Capping.[/]"
+        )
         shares = opp.max_shares
-    if dry_run:
-        console.print(f"[bold]DRY RUN[/] – no order will be placed.\n")
-    console.print(f"  Opportunity: {opp.game_label}")
-    console.print(f"  Action:      {opp.kalshi_action}  x {shares} shares")
-    console.print(f"  Then hedge:  {opp.hedge_action}")
+    preview = (
+        f"  Opportunity: {opp.game_label}\n"
+        f"  Action:      {opp.kalshi_action}  x {shares} shares\n"
+        f"  Then hedge:  {opp.hedge_action}"
+    )
+    console.print(
+        f"[bold]DRY RUN[/] – no order will be placed.\n\n{preview}" if dry_run else preview
+    )
     if not dry_run and not confirm:
         console.print("\n[red]Add [bold]--confirm[/] to place the order.[/]")
         raise typer.Exit(1)
@@ -465,12 +750,10 @@ def execute(
         console.print("\n[dim]Run with --no-dry-run --confirm to place the order.[/]")
         return
 
-    async def _place():
+    async def _place() -> dict[str, Any]:
         from kalshi_odds.models.comparison import Direction
-        async with KalshiAdapter(
-            api_key_id=settings.kalshi_api_key_id,
-            private_key_path=settings.kalshi_private_key_path,
-        ) as kalshi:
+
+        async with _kalshi_adapter(settings) as kalshi:
             side = "yes"
             action = "sell" if opp.direction == Direction.KALSHI_RICH else "buy"
             price_cents = max(1, min(99, opp.kalshi_price_cents))
@@ -484,11 +767,12 @@ def execute(
             return result
 
     try:
-        result = asyncio.run(_place())
-        console.print("[green]Order placed.[/]")
-        console.print(f"  [dim]{result}[/]")
-        console.print("\n[yellow]Remember to place the sportsbook hedge manually.[/]")
-    except Exception as e:
+        result = _run_async(_place())
+        console.print(
+            f"[green]Order placed.[/]\n  [dim]{result}[/]\n\n"
+            "[yellow]Remember to place the sportsbook hedge manually.[/]"
+        )
+    except Exception as e:  # noqa: BLE001 - any failure aborts the command
         console.print(f"[red]Order failed: {e}[/]")
         raise typer.Exit(1)
 
@@ -496,41 +780,70 @@ def execute(
 @app.command("show")
 def show(
     last: int = typer.Option(20, "--last", "-n", help="Show last N alerts"),
+    plain: bool = typer.Option(
+        False, "--plain", help="Tab-separated lines instead of a table (for scripts)"
+    ),
 ) -> None:
     """Print recent alerts from database."""
+    from kalshi_odds.config import get_settings
+    from kalshi_odds.db import Repository
+
     settings = get_settings()
 
-    async def _run():
+    async def _run() -> None:
         async with Repository(settings.database_url.split("///")[-1]) as repo:
-            alerts = await repo.get_recent_alerts(limit=last)
-            
+            alerts = await repo.get_recent_alert_rows(limit=last)
+
             if not alerts:
                 console.print("[yellow]No alerts found[/]")
                 return
-            
-            table = Table(title=f"Last {len(alerts)} Alerts")
-            table.add_column("Time", style="dim")
-            table.add_column("Market")
-            table.add_column("Direction")
-            table.add_column("Edge")
-            table.add_column("Confidence")
-            table.add_column("Kalshi Price")
-            table.add_column("Book Prob")
-            
-            for alert in alerts:
-                table.add_row(
-                    alert.timestamp.strftime("%m-%d %H:%M"),
-                    alert.market_key[:25],
-                    alert.direction.value,
-                    f"{alert.edge_bps:.0f}bps",
-                    alert.confidence.value,
-                    f"{alert.kalshi_price:.3f}",
-                    f"{alert.sportsbook_p_no_vig:.3f}",
+
+            columns = (
+                "Time",
+                "Market",
+                "Direction",
+                "Edge",
+                "Confidence",
+                "Kalshi Price",
+                "Book Prob",
+            )
+            # Stored ISO timestamps slice straight to "MM-DD HH:MM"
+            rows = [
+                (
+                    f"{timestamp[5:10]} {timestamp[11:16]}",
+                    market_key,
+                    direction,
+                    f"{edge_bps:.0f}bps",
+                    confidence,
+                    f"{kalshi_price:.3f}",
+                    f"{p_no_vig:.3f}",
                 )
-            
+                for (
+                    timestamp,
+                    market_key,
+                    direction,
+                    edge_bps,
+                    confidence,
+                    kalshi_price,
+                    p_no_vig,
+                ) in alerts
+            ]
+
+            # Plain: tab-separated lines in one write, no table layout
+            if plain:
+                console.file.write("\n".join("\t".join(row) for row in (columns, *rows)) + "\n")
+                return
+
+            from rich.table import Table
+
+            table = Table(title=f"Last {len(alerts)} Alerts")
+            for name in columns:
+                table.add_column(name, style="dim" if name == "Time" else None)
+            for time_str, market_key, *rest in rows:
+                table.add_row(time_str, _truncate(market_key, 25), *rest)
             console.print(table)
 
-    asyncio.run(_run())
+    _run_async(_run())
 
 
 def main() -> None:
@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+import os
+from functools import lru_cache
 from pathlib import Path
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+def _user_cache_dir(name: str) -> str:
+    """Per-user cache directory ($XDG_CACHE_HOME or ~/.cache), outside the working tree."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return str(Path(base, "kalshi_odds", name))
+
+
 class Settings(BaseSettings):
     """Global settings."""
 
@@ -23,11 +31,22 @@ class Settings(BaseSettings):
     kalshi_private_key_path: str = Field(default="", description="Path to Kalshi RSA private key")
     kalshi_base_url: str = Field(default="https://api.elections.kalshi.com/trade-api/v2")
     kalshi_requests_per_second: float = Field(default=5.0)
+    kalshi_max_concurrency: int = Field(
+        default=10, description="Max Kalshi orderbook requests in flight"
+    )
+    kalshi_cache_dir: str = Field(
+        default_factory=lambda: _user_cache_dir("kalshi"),
+        description="On-disk cache for API capability probes (empty = none)",
+    )
 
     # ── The Odds API ────────────────────────────────────────────────────────
     odds_api_key: str = Field(default="", description="The Odds API key")
     odds_api_base_url: str = Field(default="https://api.the-odds-api.com/v4")
     odds_api_requests_per_second: float = Field(default=1.0)
+    odds_api_cache_dir: str = Field(
+        default_factory=lambda: _user_cache_dir("odds_api"),
+        description="On-disk cache for sports/events listings (empty = memory only)",
+    )
 
     # ── Matching ────────────────────────────────────────────────────────────
     mapping_file: str = Field(default="mappings.yaml")
@@ -36,8 +55,12 @@ class Settings(BaseSettings):
 
     # ── Scanner ─────────────────────────────────────────────────────────────
     poll_interval_seconds: float = Field(default=60.0, description="Seconds between poll cycles")
-    kalshi_slippage_buffer: float = Field(default=0.005, description="Slippage buffer for Kalshi (0.005 = 0.5%)")
-    sportsbook_execution_friction: float = Field(default=0.01, description="Execution friction buffer for sportsbook")
+    kalshi_slippage_buffer: float = Field(
+        default=0.005, description="Slippage buffer for Kalshi (0.005 = 0.5%)"
+    )
+    sportsbook_execution_friction: float = Field(
+        default=0.01, description="Execution friction buffer for sportsbook"
+    )
     min_edge_bps: float = Field(default=50.0, description="Min edge in basis points to alert")
     min_liquidity: int = Field(default=10, description="Min Kalshi liquidity (shares)")
     max_staleness_seconds: float = Field(default=60.0, description="Max data age in seconds")
@@ -49,9 +72,15 @@ class Settings(BaseSettings):
     output_jsonl: str = Field(default="alerts.jsonl")
 
     # ── Execution & automation ──────────────────────────────────────────────
-    max_notional_per_trade: float = Field(default=100.0, description="Max dollars per Kalshi order when executing")
-    execution_enabled: bool = Field(default=False, description="Allow execute command (must be explicitly enabled)")
-    auto_map_enabled: bool = Field(default=True, description="Allow auto-mapping of games to odds events")
+    max_notional_per_trade: float = Field(
+        default=100.0, description="Max dollars per Kalshi order when executing"
+    )
+    execution_enabled: bool = Field(
+        default=False, description="Allow execute command (must be explicitly enabled)"
+    )
+    auto_map_enabled: bool = Field(
+        default=True, description="Allow auto-mapping of games to odds events"
+    )
     default_sport: str = Field(default="basketball_nba", description="Default sport for scan/run")
 
     # ── Helpers ─────────────────────────────────────────────────────────────
@@ -69,6 +98,18 @@ class Settings(BaseSettings):
         return Path(self.mapping_file)
 
 
+@lru_cache(maxsize=1)
+def _default_settings() -> Settings:
+    return Settings()
+
+
 def get_settings(**overrides) -> Settings:  # type: ignore
-    """Factory with optional overrides."""
-    return Settings(**overrides)
+    """
+    Factory with optional overrides.
+
+    Without overrides the environment and .env file are read once and the
+    same instance is returned on every call; treat it as read-only.
+    """
+    if overrides:
+        return Settings(**overrides)
+    return _default_settings()
@@ -1,26 +1,49 @@
 """Core utilities."""
 
-from kalshi_odds.core.odds_math import (
-    american_to_prob,
-    decimal_to_prob,
-    prob_to_american,
-    prob_to_decimal,
-    no_vig_two_way,
-    no_vig_multi_way,
-)
-from kalshi_odds.core.scanner import Scanner, aggregate_opportunities
-from kalshi_odds.core.automapper import auto_map, build_mappings, SPORT_TO_SERIES
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from kalshi_odds._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from kalshi_odds.core.automapper import SPORT_TO_SERIES, auto_map, build_mappings
+    from kalshi_odds.core.odds_math import (
+        american_to_prob,
+        decimal_to_prob,
+        no_vig_multi_way,
+        no_vig_two_way,
+        prob_to_american,
+        prob_to_decimal,
+    )
+    from kalshi_odds.core.scanner import Scanner, aggregate_opportunities
 
 __all__ = [
-    "american_to_prob",
-    "decimal_to_prob",
-    "prob_to_american",
-    "prob_to_decimal",
-    "no_vig_two_way",
-    "no_vig_multi_way",
+    "SPORT_TO_SERIES",
     "Scanner",
     "aggregate_opportunities",
+    "american_to_prob",
     "auto_map",
     "build_mappings",
-    "SPORT_TO_SERIES",
+    "decimal_to_prob",
+    "no_vig_multi_way",
+    "no_vig_two_way",
+    "prob_to_american",
+    "prob_to_decimal",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "kalshi_odds.core.odds_math": [
+            "american_to_prob",
+            "decimal_to_prob",
+            "prob_to_american",
+            "prob_to_decimal",
+            "no_vig_two_way",
+            "no_vig_multi_way",
+        ],
+        "kalshi_odds.core.scanner": ["Scanner", "aggregate_opportunities"],
+        "kalshi_odds.core.automapper": ["auto_map", "build_mappings", "SPORT_TO_SERIES"],
+    },
+)
@@ -7,14 +7,42 @@ matches by team name similarity, and writes/merges mappings.yaml.
 
 from __future__ import annotations
 
+import asyncio
 import re
+from collections.abc import Mapping
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Protocol
 
 import yaml
 
-from kalshi_odds.adapters.kalshi import KalshiAdapter
-from kalshi_odds.adapters.odds_api import OddsAPIAdapter
+try:  # optional: single-pass multi-keyword scan (pip install pyahocorasick)
+    import ahocorasick
+except ImportError:  # pragma: no cover - exercised only without the extra
+    ahocorasick = None
+
+if TYPE_CHECKING:
+    from kalshi_odds.models.kalshi import KalshiContract
+
+
+class KalshiContractSource(Protocol):
+    """What the auto-mapper needs from Kalshi (KalshiAdapter satisfies it)."""
+
+    async def list_contracts(
+        self, limit: int = ..., series_ticker: str | None = ..., max_results: int | None = ...
+    ) -> list[KalshiContract]: ...
+
+
+class OddsEventSource(Protocol):
+    """What the auto-mapper needs from The Odds API (OddsAPIAdapter satisfies it)."""
+
+    async def list_events(self, sport: str) -> list[dict[str, Any]]: ...
+
+
+# libyaml-backed loader/dumper when PyYAML was built with it; pure-Python otherwise
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
 
 # Sport key (Odds API) -> Kalshi series_ticker for game-winner markets
@@ -24,39 +52,51 @@ SPORT_TO_SERIES: dict[str, str] = {
     "basketball_ncaab": "KXNCAABGAME",
 }
 
+# Lowercased sport key or series ticker -> series ticker
+_SERIES_LOOKUP: dict[str, str] = {
+    **SPORT_TO_SERIES,
+    **{series.lower(): series for series in SPORT_TO_SERIES.values()},
+}
+
+
+def resolve_series_ticker(value: str) -> str | None:
+    """Map a sport key (basketball_nba) or series ticker (kxnbagame) to a known Kalshi series."""
+    return _SERIES_LOOKUP.get(value.strip().lower())
+
+
 # Kalshi team code (e.g. OKC, HOU) -> keywords to match Odds API team names (substring match)
 TEAM_CODE_KEYWORDS: dict[str, list[str]] = {
-    # NBA
-    "ATL": ["Atlanta", "Hawks"],
+    # NBA (codes shared with NFL list both teams' keywords)
+    "ATL": ["Atlanta", "Hawks", "Falcons"],
     "BKN": ["Brooklyn", "Nets"],
     "BOS": ["Boston", "Celtics"],
     "CHA": ["Charlotte", "Hornets"],
-    "CHI": ["Chicago", "Bulls"],
-    "CLE": ["Cleveland", "Cavaliers"],
-    "DAL": ["Dallas", "Mavericks"],
+    "CHI": ["Chicago", "Bulls", "Bears"],
+    "CLE": ["Cleveland", "Cavaliers", "Browns"],
+    "DAL": ["Dallas", "Mavericks", "Cowboys"],
     "DEN": ["Denver", "Nuggets"],
-    "DET": ["Detroit", "Pistons"],
+    "DET": ["Detroit", "Pistons", "Lions"],
     "GSW": ["Golden State", "Warriors", "GS "],
-    "HOU": ["Houston", "Rockets"],
-    "IND": ["Indiana", "Pacers"],
-    "LAC": ["LA Clippers", "Clippers"],
+    "HOU": ["Houston", "Rockets", "Texans"],
+    "IND": ["Indiana", "Pacers", "Indianapolis", "Colts"],
+    "LAC": ["LA Clippers", "Clippers", "Los Angeles Chargers", "Chargers"],
     "LAL": ["Lakers", "Los Angeles Lakers"],
     "MEM": ["Memphis", "Grizzlies"],
-    "MIA": ["Miami", "Heat"],
+    "MIA": ["Miami", "Heat", "Dolphins"],
     "MIL": ["Milwaukee", "Bucks"],
-    "MIN": ["Minnesota", "Timberwolves"],
+    "MIN": ["Minnesota", "Timberwolves", "Vikings"],
     "NOP": ["New Orleans", "Pelicans"],
     "NYK": ["New York", "Knicks"],
     "OKC": ["Oklahoma City", "Thunder"],
     "ORL": ["Orlando", "Magic"],
-    "PHI": ["Philadelphia", "76ers", "Sixers"],
+    "PHI": ["Philadelphia", "76ers", "Sixers", "Eagles"],
     "PHX": ["Phoenix", "Suns"],
     "POR": ["Portland", "Trail Blazers", "Blazers"],
     "SAC": ["Sacramento", "Kings"],
     "SAS": ["San Antonio", "Spurs"],
     "TOR": ["Toronto", "Raptors"],
     "UTA": ["Utah", "Jazz"],
-    "WAS": ["Washington", "Wizards"],
+    "WAS": ["Washington", "Wizards", "Commanders"],
     # NFL (common)
     "SEA": ["Seattle", "Seahawks"],
     "NE": ["New England", "Patriots"],
@@ -65,46 +105,85 @@ TEAM_CODE_KEYWORDS: dict[str, list[str]] = {
     "BUF": ["Buffalo", "Bills"],
     "BAL": ["Baltimore", "Ravens"],
     "CIN": ["Cincinnati", "Bengals"],
-    "CLE": ["Cleveland", "Browns"],
-    "HOU": ["Houston", "Texans"],
-    "IND": ["Indianapolis", "Colts"],
     "JAX": ["Jacksonville", "Jaguars"],
     "LV": ["Las Vegas", "Raiders"],
-    "LAC": ["Los Angeles Chargers", "Chargers"],
-    "MIA": ["Miami", "Dolphins"],
     "NYJ": ["New York Jets", "Jets"],
     "NYG": ["New York Giants", "Giants"],
-    "PHI": ["Philadelphia", "Eagles"],
     "PIT": ["Pittsburgh", "Steelers"],
     "LAR": ["Los Angeles Rams", "Rams"],
     "TB": ["Tampa Bay", "Buccaneers"],
     "TEN": ["Tennessee", "Titans"],
-    "MIN": ["Minnesota", "Vikings"],
-    "CHI": ["Chicago", "Bears"],
-    "DET": ["Detroit", "Lions"],
     "GB": ["Green Bay", "Packers"],
-    "ATL": ["Atlanta", "Falcons"],
     "CAR": ["Carolina", "Panthers"],
     "NO": ["New Orleans", "Saints"],
-    "DAL": ["Dallas", "Cowboys"],
-    "NYG": ["New York Giants", "Giants"],
-    "WAS": ["Washington", "Commanders"],
 }
 
 
+# Kalshi ticker date part, e.g. 26FEB07 -> ("26", "FEB", "07")
+_DATE_PART_RE = re.compile(r"(\d{2})([A-Z]{3})(\d{2})")
+
+# League tag in a ticker; the leftmost hit is the series (KXNBAGAME-..., KXNFLGAME-...)
+_LEAGUE_RE = re.compile(r"NBA|NFL")
+
+_MONTH_MAP: Mapping[str, str] = MappingProxyType({
+    "JAN": "01", "FEB": "02", "MAR": "03", "APR": "04", "MAY": "05", "JUN": "06",
+    "JUL": "07", "AUG": "08", "SEP": "09", "OCT": "10", "NOV": "11", "DEC": "12",
+})
+
+# Inverted keyword table: (lowercased keyword, team code), built once at import
+_KEYWORD_CODES: tuple[tuple[str, str], ...] = tuple(
+    (kw.lower(), code) for code, keywords in TEAM_CODE_KEYWORDS.items() for kw in keywords
+)
+
+
+def _build_keyword_automaton() -> Any:
+    """Aho-Corasick automaton over all keywords (keyword → codes), or None if unavailable."""
+    if ahocorasick is None:
+        return None
+    codes_by_kw: dict[str, set[str]] = {}
+    for kw, code in _KEYWORD_CODES:
+        codes_by_kw.setdefault(kw, set()).add(code)
+    automaton = ahocorasick.Automaton()
+    for kw, codes in codes_by_kw.items():
+        automaton.add_word(kw, frozenset(codes))
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+
+@lru_cache(maxsize=1024)
+def _team_codes(team_name: str) -> frozenset[str]:
+    """All known team codes whose keywords appear in team_name (scanned once per name)."""
+    name = team_name.lower()
+    if _KEYWORD_AUTOMATON is not None:
+        # One pass over the name reports every (possibly overlapping) keyword hit
+        return frozenset(code for _end, codes in _KEYWORD_AUTOMATON.iter(name) for code in codes)
+    return frozenset(code for kw, code in _KEYWORD_CODES if kw in name)
+
+
+@lru_cache(maxsize=4096)
 def _team_matches(code: str, team_name: str) -> bool:
-    """True if team_name matches the given Kalshi team code (substring keywords)."""
+    """
+    True if team_name matches the given Kalshi team code (substring keywords).
+
+    Cached per (code, name): both contracts of a game test the same codes
+    against every event, so each pair is only decided once per process.
+    """
     if not team_name:
         return False
-    keywords = TEAM_CODE_KEYWORDS.get(code, [code])
-    return any(kw.lower() in team_name.lower() for kw in keywords)
+    if code in TEAM_CODE_KEYWORDS:
+        return code in _team_codes(team_name)
+    return code.lower() in team_name.lower()
 
 
-def parse_kalshi_ticker(ticker: str) -> Optional[tuple[str, str, str]]:
+@lru_cache(maxsize=4096)
+def parse_kalshi_ticker(ticker: str) -> tuple[str, str, str] | None:
     """
     Parse Kalshi game-winner ticker into (date_part, game_code, side_code).
     Example: KXNBAGAME-26FEB07HOUOKC-OKC -> ("26FEB07", "HOUOKC", "OKC").
-    Returns None if format unrecognized.
+    Returns None if format unrecognized. Cached per ticker (the result is immutable).
     """
     if not ticker or "-" not in ticker:
         return None
@@ -124,7 +203,7 @@ def parse_kalshi_ticker(ticker: str) -> Optional[tuple[str, str, str]]:
     return (date_part, game_code, side_code)
 
 
-def _game_codes_from_ticker(ticker: str) -> Optional[tuple[str, str]]:
+def _game_codes_from_ticker(ticker: str) -> tuple[str, str] | None:
     """
     Get the two team codes from a game ticker (e.g. HOUOKC -> (HOU, OKC)).
     Assumes 6-char game code = two 3-letter codes.
@@ -132,7 +211,11 @@ def _game_codes_from_ticker(ticker: str) -> Optional[tuple[str, str]]:
     parsed = parse_kalshi_ticker(ticker)
     if not parsed:
         return None
-    _date, game_code, _side = parsed
+    return _split_game_code(parsed[1])
+
+
+def _split_game_code(game_code: str) -> tuple[str, str] | None:
+    """Split a 6- or 4-char game code into its two team codes."""
     if len(game_code) == 6:
         return (game_code[:3], game_code[3:])
     if len(game_code) == 4:
@@ -140,7 +223,9 @@ def _game_codes_from_ticker(ticker: str) -> Optional[tuple[str, str]]:
     return None
 
 
-def _match_event_to_codes(home_team: str, away_team: str, code_a: str, code_b: str) -> Optional[tuple[str, str]]:
+def _match_event_to_codes(
+    home_team: str, away_team: str, code_a: str, code_b: str
+) -> tuple[str, str] | None:
     """
     If event (home_team, away_team) matches team codes (code_a, code_b), return (name_for_a, name_for_b).
     Otherwise return None.
@@ -156,31 +241,31 @@ def _match_event_to_codes(home_team: str, away_team: str, code_a: str, code_b: s
     return None
 
 
+@lru_cache(maxsize=4096)
 def _market_key_from_ticker(ticker: str, date_part: str, side_code: str, game_code: str) -> str:
     """Generate a stable market_key for YAML (e.g. nba_20260207_houokc_okc)."""
     # Normalize date: 26FEB07 -> 20260207
-    m = re.match(r"(\d{2})([A-Z]{3})(\d{2})", date_part)
-    month_map = {"JAN": "01", "FEB": "02", "MAR": "03", "APR": "04", "MAY": "05", "JUN": "06",
-                 "JUL": "07", "AUG": "08", "SEP": "09", "OCT": "10", "NOV": "11", "DEC": "12"}
+    m = _DATE_PART_RE.match(date_part)
     if m:
         year = "20" + m.group(1)
-        month = month_map.get(m.group(2), "01")
+        month = _MONTH_MAP.get(m.group(2), "01")
         day = m.group(3)
     else:
         year, month, day = "2026", "01", "01"
     date_str = f"{year}{month}{day}"
-    prefix = "nba" if "NBA" in ticker or "KXNBAGAME" in ticker else "nfl" if "NFL" in ticker or "KXNFLGAME" in ticker else "game"
+    league = _LEAGUE_RE.search(ticker)
+    prefix = league.group().lower() if league else "game"
     return f"{prefix}_{date_str}_{game_code.lower()}_{side_code.lower()}"
 
 
 async def build_mappings(
-    kalshi: KalshiAdapter,
-    odds_api: OddsAPIAdapter,
+    kalshi: KalshiContractSource,
+    odds_api: OddsEventSource,
     sport: str,
     mapping_path: Path,
     *,
     merge_with_existing: bool = True,
-) -> list[dict]:
+) -> list[dict[str, Any]]:
     """
     Fetch Kalshi game markets and Odds API events, match by team names, build mapping entries.
     Optionally merge with existing mappings (by market_key / contract_id).
@@ -190,23 +275,37 @@ async def build_mappings(
     if not series_ticker:
         raise ValueError(f"No Kalshi series for sport {sport}. Supported: {list(SPORT_TO_SERIES)}")
 
-    contracts = await kalshi.list_contracts(series_ticker=series_ticker, limit=200)
-    events = await odds_api.list_events(sport)
+    # Independent requests to two different APIs: overlap them. The task group
+    # cancels the other fetch (and its throttle tokens) as soon as one fails.
+    try:
+        async with asyncio.TaskGroup() as tg:
+            contracts_task = tg.create_task(
+                kalshi.list_contracts(series_ticker=series_ticker, limit=200)
+            )
+            events_task = tg.create_task(odds_api.list_events(sport))
+    except ExceptionGroup as eg:
+        raise eg.exceptions[0] from None  # callers see the failed fetch's own error
+    contracts, events = contracts_task.result(), events_task.result()
 
-    existing_list: list[dict] = []
-    existing_by_contract: dict[str, dict] = {}
+    existing_list: list[dict[str, Any]] = []
+    existing_by_contract: dict[str, dict[str, Any]] = {}
     if merge_with_existing and mapping_path.exists():
-        with open(mapping_path) as f:
-            data = yaml.safe_load(f) or {}
-        existing_list = data.get("markets", [])
+        existing_list = await asyncio.to_thread(read_mappings, mapping_path)
         for entry in existing_list:
             cid = (entry.get("kalshi") or {}).get("contract_id", "")
             if cid:
                 existing_by_contract[cid] = entry
 
-    new_mappings: list[dict] = []
+    new_mappings: list[dict[str, Any]] = []
     seen_contracts: set[str] = set()
 
+    # Pull the fields we match on out of each event once, not once per contract
+    event_teams = [
+        (ev.get("id", ""), ev.get("home_team", ""), ev.get("away_team", "")) for ev in events
+    ]
+    # game code -> (event_id, name for code_a, name for code_b), or None when no event matched
+    game_matches: dict[str, tuple[str, str, str] | None] = {}
+
     for contract in contracts:
         ticker = contract.contract_id
         if ticker in seen_contracts:
@@ -215,59 +314,85 @@ async def build_mappings(
         if not parsed:
             continue
         date_part, game_code, side_code = parsed
-        codes = _game_codes_from_ticker(ticker)
+        codes = _split_game_code(game_code)
         if not codes:
             continue
         code_a, code_b = codes
+        side_is_a = side_code.upper() == code_a.upper()
 
-        for ev in events:
-            event_id = ev.get("id", "")
-            home_team = ev.get("home_team", "")
-            away_team = ev.get("away_team", "")
-            names = _match_event_to_codes(home_team, away_team, code_a, code_b)
-            if not names:
-                continue
-            name_a, name_b = names
-            selection = name_a if side_code.upper() == code_a.upper() else name_b
-            market_key = _market_key_from_ticker(ticker, date_part, side_code, game_code)
-            entry = {
-                "market_key": market_key,
-                "kalshi": {"contract_id": ticker, "side": "YES"},
-                "odds": {"event_id": event_id, "market_type": "h2h", "selection": selection},
-            }
-            if merge_with_existing and ticker in existing_by_contract:
-                entry = {**existing_by_contract[ticker], **entry}
-            new_mappings.append(entry)
-            seen_contracts.add(ticker)
-            break
+        # Both sides of a game share its game code: scan the events once per game
+        if game_code in game_matches:
+            match = game_matches[game_code]
+        else:
+            match = None
+            for event_id, home_team, away_team in event_teams:
+                names = _match_event_to_codes(home_team, away_team, code_a, code_b)
+                if names:
+                    match = (event_id, *names)
+                    break
+            game_matches[game_code] = match
+        if match is None:
+            continue
+
+        event_id, name_a, name_b = match
+        selection = name_a if side_is_a else name_b
+        market_key = _market_key_from_ticker(ticker, date_part, side_code, game_code)
+        entry = {
+            "market_key": market_key,
+            "kalshi": {"contract_id": ticker, "side": "YES"},
+            "odds": {"event_id": event_id, "market_type": "h2h", "selection": selection},
+        }
+        if merge_with_existing and ticker in existing_by_contract:
+            entry = {**existing_by_contract[ticker], **entry}
+        new_mappings.append(entry)
+        seen_contracts.add(ticker)
 
     # When merging, keep existing entries whose contract_id we did not auto-match
     if merge_with_existing and existing_list:
-        kept = [e for e in existing_list if (e.get("kalshi") or {}).get("contract_id") not in seen_contracts]
+        kept = [
+            e
+            for e in existing_list
+            if (e.get("kalshi") or {}).get("contract_id") not in seen_contracts
+        ]
         new_mappings = kept + new_mappings
 
     return new_mappings
 
 
-def write_mappings(mapping_path: Path, mappings: list[dict]) -> None:
+def read_mappings(mapping_path: Path) -> list[dict[str, Any]]:
+    """Read the market entries of a mappings YAML file."""
+    with open(mapping_path) as f:
+        data = yaml.load(f, Loader=_YAML_LOADER) or {}
+    markets: list[dict[str, Any]] = data.get("markets", [])
+    return markets
+
+
+def write_mappings(mapping_path: Path, mappings: list[dict[str, Any]]) -> None:
     """Write mappings to YAML file."""
     mapping_path.parent.mkdir(parents=True, exist_ok=True)
     data = {
         "markets": mappings,
     }
     with open(mapping_path, "w") as f:
-        yaml.safe_dump(data, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        yaml.dump(
+            data,
+            f,
+            Dumper=_YAML_DUMPER,
+            default_flow_style=False,
+            allow_unicode=True,
+            sort_keys=False,
+        )
 
 
 async def auto_map(
-    kalshi: KalshiAdapter,
-    odds_api: OddsAPIAdapter,
+    kalshi: KalshiContractSource,
+    odds_api: OddsEventSource,
     sport: str,
     mapping_path: Path,
     *,
     merge_with_existing: bool = True,
     write: bool = True,
-) -> list[dict]:
+) -> list[dict[str, Any]]:
     """
     Run auto-mapper: build mappings and optionally write to mapping_path.
     Returns list of mapping entries.
@@ -6,12 +6,12 @@ Manual YAML mapping + optional fuzzy candidate suggestions.
 
 from __future__ import annotations
 
+import heapq
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional
-
-import yaml
-from rapidfuzz import fuzz
+from typing import Any
 
+from kalshi_odds.core.automapper import read_mappings
 from kalshi_odds.models.kalshi import KalshiContract
 from kalshi_odds.models.odds import OddsQuote
 
@@ -24,9 +24,18 @@ class MarketMatcher:
     Optional: fuzzy title matching for candidate suggestions (log-only).
     """
 
+    __slots__ = (
+        "_fuzzy_enabled",
+        "_fuzzy_threshold",
+        "_kalshi_to_key",
+        "_mapping_file",
+        "_mappings",
+        "_odds_to_key",
+    )
+
     def __init__(
         self,
-        mapping_file: Optional[Path] = None,
+        mapping_file: Path | None = None,
         fuzzy_enabled: bool = False,
         fuzzy_threshold: float = 0.75,
     ) -> None:
@@ -35,7 +44,7 @@ class MarketMatcher:
         self._fuzzy_threshold = fuzzy_threshold
         
         # market_key → mapping dict
-        self._mappings: dict[str, dict] = {}
+        self._mappings: dict[str, dict[str, Any]] = {}
         
         # Reverse indexes
         self._kalshi_to_key: dict[str, str] = {}  # contract_id → market_key
@@ -44,16 +53,13 @@ class MarketMatcher:
     def load_mappings(self) -> int:
         """
         Load manual mappings from YAML.
-        
+
         Returns count of mappings loaded.
         """
         if self._mapping_file is None or not self._mapping_file.exists():
             return 0
 
-        with open(self._mapping_file) as f:
-            data = yaml.safe_load(f) or {}
-
-        markets = data.get("markets", [])
+        markets = read_mappings(self._mapping_file)
         count = 0
 
         for entry in markets:
@@ -81,17 +87,17 @@ class MarketMatcher:
 
         return count
 
-    def get_market_key_for_kalshi(self, contract_id: str) -> Optional[str]:
+    def get_market_key_for_kalshi(self, contract_id: str) -> str | None:
         """Get market_key for a Kalshi contract ID."""
         return self._kalshi_to_key.get(contract_id)
 
     def get_market_key_for_odds(
         self, event_id: str, market_type: str, selection: str
-    ) -> Optional[str]:
+    ) -> str | None:
         """Get market_key for a sportsbook selection."""
         return self._odds_to_key.get((event_id, market_type, selection))
 
-    def get_mapping(self, market_key: str) -> Optional[dict]:
+    def get_mapping(self, market_key: str) -> dict[str, Any] | None:
         """Get full mapping dict for a market_key."""
         return self._mappings.get(market_key)
 
@@ -108,37 +114,57 @@ class MarketMatcher:
     ) -> list[tuple[KalshiContract, OddsQuote, float]]:
         """
         Find potential matches using fuzzy title similarity.
-        
+
         Returns list of (contract, quote, score) tuples.
-        
+
         NOTE: This is for manual review only. Do NOT auto-map.
         """
         if not self._fuzzy_enabled:
             return []
 
-        candidates: list[tuple[KalshiContract, OddsQuote, float]] = []
-
-        for contract in kalshi_contracts:
-            # Skip if already mapped
-            if contract.contract_id in self._kalshi_to_key:
-                continue
-
-            for quote in odds_quotes:
-                # Skip if already mapped
-                key = (quote.event_id, quote.market_type.value, quote.selection)
-                if key in self._odds_to_key:
-                    continue
-
-                # Compare titles
-                score = fuzz.token_sort_ratio(
-                    contract.title.lower(),
-                    quote.event_title.lower(),
-                ) / 100.0
-
-                if score >= self._fuzzy_threshold:
-                    candidates.append((contract, quote, score))
+        # Imported on first use: fuzzy matching is off by default
+        import numpy as np
+        from rapidfuzz import fuzz, process
+
+        # Skip anything already mapped
+        contracts = [c for c in kalshi_contracts if c.contract_id not in self._kalshi_to_key]
+        quotes = [
+            q
+            for q in odds_quotes
+            if (q.event_id, q.market_type.value, q.selection) not in self._odds_to_key
+        ]
+        if not contracts or not quotes:
+            return []
 
-        # Sort by score descending
-        candidates.sort(key=lambda x: x[2], reverse=True)
-        
-        return candidates[:50]  # Limit to top 50
+        # Contracts and quotes both repeat titles (one contract per side, one quote
+        # per bookmaker/selection): score each distinct lowercased title pair once,
+        # then expand the scores back to one row per contract and one column per quote
+        contract_keys = [c.title.lower() for c in contracts]
+        quote_keys = [q.event_title.lower() for q in quotes]
+        row_of = {t: i for i, t in enumerate(dict.fromkeys(contract_keys))}
+        col_of = {t: j for j, t in enumerate(dict.fromkeys(quote_keys))}
+
+        # Score every distinct title pair in one batched call
+        title_scores = (
+            process.cdist(
+                list(row_of),
+                list(col_of),
+                scorer=fuzz.token_sort_ratio,
+                dtype="float64",
+                workers=-1,
+            )
+            / 100.0
+        )
+        rows = [row_of[k] for k in contract_keys]
+        cols = [col_of[k] for k in quote_keys]
+        scores = title_scores[np.ix_(rows, cols)]
+
+        # nonzero() walks row-major, i.e. contract by contract then quote by quote,
+        # so tied scores keep the input order through the stable top-50 below
+        candidates: list[tuple[KalshiContract, OddsQuote, float]] = [
+            (contracts[i], quotes[j], float(scores[i, j]))
+            for i, j in zip(*np.nonzero(scores >= self._fuzzy_threshold))
+        ]
+
+        # Top 50 by score descending
+        return heapq.nlargest(50, candidates, key=itemgetter(2))
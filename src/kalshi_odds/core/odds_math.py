@@ -26,8 +26,8 @@ def american_to_prob(odds: float) -> float:
         0.4
     """
     if odds < 0:
-        # Favorite: prob = |odds| / (|odds| + 100)
-        return abs(odds) / (abs(odds) + 100)
+        # Favorite: prob = |odds| / (|odds| + 100), with |odds| = -odds
+        return -odds / (100 - odds)
     else:
         # Underdog: prob = 100 / (odds + 100)
         return 100 / (odds + 100)
@@ -7,76 +7,149 @@ and aggregation into actionable Opportunities.
 
 from __future__ import annotations
 
+import heapq
 import math
 import re
 import uuid
+from bisect import bisect_right
 from collections import defaultdict
-from datetime import datetime, timezone
-from typing import Optional
+from datetime import UTC, datetime
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any
 
 from kalshi_odds.core.odds_math import american_to_prob, decimal_to_prob, no_vig_two_way
-from kalshi_odds.models.kalshi import KalshiTopOfBook
-from kalshi_odds.models.odds import OddsQuote, OddsFormat
 from kalshi_odds.models.comparison import (
-    Comparison,
     Alert,
-    Opportunity,
-    Direction,
     Confidence,
+    Direction,
+    Opportunity,
 )
+from kalshi_odds.models.kalshi import KalshiTopOfBook
+from kalshi_odds.models.odds import MarketType, OddsFormat, OddsQuote
 from kalshi_odds.models.probability import NormalizedProb, VigMethod
 
+# Market-key tokens that name the sport/event rather than a team
+_SPORT_PREFIXES: frozenset[str] = frozenset({"nba", "nfl", "superbowl"})
+
+# Integer rank for picking the best confidence in a group (HIGH > MED > LOW)
+_CONFIDENCE_RANK: dict[Confidence, int] = {Confidence.LOW: 0, Confidence.MED: 1, Confidence.HIGH: 2}
 
+# Confidence scoring ladders: points[bisect_right(cutoffs, x)]
+_EDGE_CUTOFFS_BPS = (50.0, 100.0, 200.0)
+_EDGE_POINTS = (0.1, 0.2, 0.3, 0.4)
+_AGE_CUTOFFS_S = (10.0, 30.0, 60.0)
+_FRESHNESS_POINTS = (0.3, 0.2, 0.1, 0.0)
+_LIQUIDITY_CUTOFFS = (20, 50, 100)
+_LIQUIDITY_POINTS = (0.05, 0.1, 0.15, 0.2)
+_OVERROUND_CUTOFFS = (1.03, 1.05)
+_OVERROUND_POINTS = (0.1, 0.05, 0.0)
+_SCORE_CUTOFFS = (0.50, 0.75)
+_CONFIDENCE_BY_BUCKET = (Confidence.LOW, Confidence.MED, Confidence.HIGH)
+
+# Odds format -> implied-probability converter; one dict hit per quote
+_TO_PROB = {
+    OddsFormat.AMERICAN: american_to_prob,
+    OddsFormat.DECIMAL: decimal_to_prob,
+}
+
+
+@lru_cache(maxsize=1024)
 def _game_label_from_market_key(market_key: str) -> str:
     """Derive a readable game label from market_key e.g. nba_20260207_rockets_thunder_okc -> Thunder vs Rockets."""
-    parts = market_key.split("_")
-    # Drop sport prefix and date (digits)
-    rest = [p for p in parts if not re.match(r"^\d+$", p) and p not in ("nba", "nfl", "superbowl")]
+    # One pass: drop sport prefix and date (digits; isdecimal() is the regex-free
+    # equivalent of \d+), collecting the first two team-sized tokens as we go
+    rest: list[str] = []
+    team_parts: list[str] = []
+    for p in market_key.split("_"):
+        if p.isdecimal() or p in _SPORT_PREFIXES:
+            continue
+        rest.append(p)
+        if len(team_parts) < 2 and 2 <= len(p) <= 6:
+            team_parts.append(p)
     if not rest:
         return market_key.replace("_", " ").title()
     # Last part is often the side (okc, hou, sea, ne); rest are team names
-    if len(rest) >= 2:
-        # e.g. rockets_thunder_okc -> Thunder vs Rockets
-        team_parts = [p for p in rest if len(p) >= 2 and len(p) <= 6][:2]
-        if len(team_parts) >= 2:
-            return " vs ".join(t.title() for t in sorted(team_parts))
+    # e.g. rockets_thunder_okc -> Thunder vs Rockets
+    if len(rest) >= 2 and len(team_parts) >= 2:
+        return " vs ".join(t.title() for t in sorted(team_parts))
     return " vs ".join(p.title() for p in rest[:2]) if len(rest) >= 2 else rest[0].title()
 
 
+# Lowercased ticker prefix -> Kalshi market page for that series
+_MARKET_URL_BASES: dict[str, str] = {
+    "kxnbagame": "https://kalshi.com/markets/kxnbagame/professional-basketball-game",
+    "kxsb": "https://kalshi.com/markets/kxsb/super-bowl",
+    "kxnfl": "https://kalshi.com/markets/kxnflgame/professional-football-game",
+}
+_MARKET_URL_PREFIX_RE = re.compile("|".join(map(re.escape, _MARKET_URL_BASES)))
+
+
+@lru_cache(maxsize=1024)
 def _kalshi_url_from_ticker(ticker: str) -> str:
     """Build Kalshi market URL from contract ticker."""
     ticker_lower = ticker.lower()
-    if ticker_lower.startswith("kxnbagame"):
-        base = "https://kalshi.com/markets/kxnbagame/professional-basketball-game"
-    elif ticker_lower.startswith("kxsb"):
-        base = "https://kalshi.com/markets/kxsb/super-bowl"
-    elif ticker_lower.startswith("kxnfl"):
-        base = "https://kalshi.com/markets/kxnflgame/professional-football-game"
-    else:
-        base = "https://kalshi.com/markets"
+    prefix = _MARKET_URL_PREFIX_RE.match(ticker_lower)
+    base = _MARKET_URL_BASES[prefix.group()] if prefix else "https://kalshi.com/markets"
     return f"{base}/{ticker_lower}"
 
 
-def aggregate_opportunities(alerts: list[Alert]) -> list[Opportunity]:
+# direction → (Kalshi action, sportsbook hedge) templates
+_ACTION_TEMPLATES: dict[Direction, tuple[str, str]] = {
+    Direction.KALSHI_RICH: (
+        "SELL {selection} YES @ {price}c",
+        "Bet {selection} ML on {book} at {odds}",
+    ),
+    Direction.KALSHI_CHEAP: (
+        "BUY {selection} YES @ {price}c",
+        "Bet opposite of {selection} on {book} at {odds}",
+    ),
+}
+
+
+_UNDERSCORE_TO_SPACE = str.maketrans("_", " ")
+
+
+@lru_cache(maxsize=256)
+def _bookmaker_display_name(bookmaker: str) -> str:
+    """Bookmaker key to display name, e.g. fan_duel -> Fan Duel."""
+    return bookmaker.translate(_UNDERSCORE_TO_SPACE).title()
+
+
+def _odds_str(alert: Alert) -> str:
+    """Display odds string from an alert's raw snapshot (e.g. '-130' or '1.91')."""
+    if not alert.raw_snapshot_refs or "odds" not in alert.raw_snapshot_refs:
+        return ""
+    ov = alert.raw_snapshot_refs["odds"].get("odds_value")
+    if ov is None:
+        return ""
+    v = float(ov)
+    return f"{v:+.0f}" if abs(v) > 10 else f"{v:.2f}"
+
+
+_RANK_SCORE = attrgetter("rank_score")
+
+
+def aggregate_opportunities(alerts: list[Alert], limit: int | None = None) -> list[Opportunity]:
     """
     Group raw alerts by (market_key, direction) and build one Opportunity per group.
     Rank by edge_cents * sqrt(liquidity) * book_count.
+    With limit, return only the top `limit` (partial heap selection, no full sort).
     """
     if not alerts:
         return []
 
-    groups: dict[tuple[str, str], list[Alert]] = defaultdict(list)
+    groups: dict[tuple[str, Direction], list[Alert]] = defaultdict(list)
     for a in alerts:
-        groups[(a.market_key, a.direction.value)].append(a)
+        groups[(a.market_key, a.direction)].append(a)
 
     opportunities: list[Opportunity] = []
-    for (market_key, direction_val), group in groups.items():
-        direction = Direction(direction_val)
+    for (market_key, direction), group in groups.items():
         a0 = group[0]
 
         # Kalshi side (same for all in group)
         kalshi_price = a0.kalshi_price
-        kalshi_price_cents = int(round(kalshi_price * 100))
+        kalshi_price_cents = round(kalshi_price * 100)
         kalshi_ticker = a0.kalshi_contract_id
         kalshi_liquidity = a0.kalshi_liquidity
         selection = a0.sportsbook_selection
@@ -88,60 +161,56 @@ def aggregate_opportunities(alerts: list[Alert]) -> list[Opportunity]:
             yb = kob.get("yes_bid")
             ya = kob.get("yes_ask")
             if yb is not None and ya is not None:
-                kalshi_spread_cents = int(round((float(ya) - float(yb)) * 100))
-
-        # Book consensus
-        probs = [a.sportsbook_p_no_vig for a in group]
+                kalshi_spread_cents = round((float(ya) - float(yb)) * 100)
+
+        # Book consensus probs and best confidence (HIGH > MED > LOW) in one pass
+        probs: list[float] = []
+        confidence = a0.confidence
+        best_rank = _CONFIDENCE_RANK[confidence]
+        for a in group:
+            probs.append(a.sportsbook_p_no_vig)
+            rank = _CONFIDENCE_RANK[a.confidence]
+            if rank > best_rank:
+                best_rank = rank
+                confidence = a.confidence
         probs.sort()
         mid = len(probs) // 2
         book_fair_prob = (probs[mid] + probs[mid - 1]) / 2.0 if len(probs) % 2 == 0 else probs[mid]
         book_count = len(group)
 
-        # Best/worst book by edge
+        # Rank the group by edge once: worst first, median in the middle.
+        # Best is taken with max() so ties go to the first book, as before.
+        ranked = sorted(group, key=lambda a: a.edge_bps)
         best_alert = max(group, key=lambda a: a.edge_bps)
-        worst_alert = min(group, key=lambda a: a.edge_bps)
-        book_best_name = best_alert.sportsbook_bookmaker.replace("_", " ").title()
-        book_worst_name = worst_alert.sportsbook_bookmaker.replace("_", " ").title()
-
-        # Odds string from raw snapshot
-        def _odds_str(alert: Alert) -> str:
-            if not alert.raw_snapshot_refs or "odds" not in alert.raw_snapshot_refs:
-                return ""
-            ov = alert.raw_snapshot_refs["odds"].get("odds_value")
-            if ov is None:
-                return ""
-            v = float(ov)
-            return f"{v:+.0f}" if abs(v) > 10 else f"{v:.2f}"
-
-        book_best = f"{book_best_name} {_odds_str(best_alert)}".strip() or book_best_name
-        book_worst = f"{book_worst_name} {_odds_str(worst_alert)}".strip() or book_worst_name
+        worst_alert = ranked[0]
+        book_best_name = _bookmaker_display_name(best_alert.sportsbook_bookmaker)
+        book_worst_name = _bookmaker_display_name(worst_alert.sportsbook_bookmaker)
+
+        best_odds = _odds_str(best_alert)
+        worst_odds = _odds_str(worst_alert)
+        book_best = f"{book_best_name} {best_odds}" if best_odds else book_best_name
+        book_worst = f"{book_worst_name} {worst_odds}" if worst_odds else book_worst_name
 
         # Edge in cents and bps (use median)
-        edges_bps = [a.edge_bps for a in group]
-        edges_bps.sort()
-        mid_e = len(edges_bps) // 2
-        median_bps = (edges_bps[mid_e] + edges_bps[mid_e - 1]) / 2.0 if len(edges_bps) % 2 == 0 else edges_bps[mid_e]
+        mid_e = len(ranked) // 2
+        if len(ranked) % 2 == 0:
+            median_bps = (ranked[mid_e].edge_bps + ranked[mid_e - 1].edge_bps) / 2.0
+        else:
+            median_bps = ranked[mid_e].edge_bps
         edge_cents = median_bps / 100.0
         edge_bps = median_bps
 
-        # Kalshi action string
-        if direction == Direction.KALSHI_RICH:
-            kalshi_action = f"SELL {selection} YES @ {kalshi_price_cents}c"
-            hedge_action = f"Bet {selection} ML on {book_best_name} at {_odds_str(best_alert)}"
-        else:
-            kalshi_action = f"BUY {selection} YES @ {kalshi_price_cents}c"
-            hedge_action = f"Bet opposite of {selection} on {book_best_name} at {_odds_str(best_alert)}"
+        # Kalshi and hedge action strings
+        kalshi_tmpl, hedge_tmpl = _ACTION_TEMPLATES[direction]
+        kalshi_action = kalshi_tmpl.format(selection=selection, price=kalshi_price_cents)
+        hedge_action = hedge_tmpl.format(selection=selection, book=book_best_name, odds=best_odds)
 
-        hedge_odds = _odds_str(best_alert) or "—"
+        hedge_odds = best_odds or "—"
 
         # P&L per 100 shares (edge in cents = cents per share; 100 shares = edge_cents dollars)
         pnl_per_100_shares = edge_cents
         max_shares = kalshi_liquidity
 
-        # Confidence: best in group (HIGH > MED > LOW)
-        conf_order = {Confidence.LOW: 0, Confidence.MED: 1, Confidence.HIGH: 2}
-        confidence = max((a.confidence for a in group), key=lambda c: conf_order.get(c, 0))
-
         # Rank score: edge_cents * sqrt(liquidity) * (1 + log(book_count))
         rank_score = edge_cents * math.sqrt(max(1, kalshi_liquidity)) * (1 + math.log1p(book_count))
 
@@ -175,17 +244,27 @@ def aggregate_opportunities(alerts: list[Alert]) -> list[Opportunity]:
             )
         )
 
-    opportunities.sort(key=lambda o: o.rank_score, reverse=True)
+    if limit is not None and limit < len(opportunities):
+        return heapq.nlargest(limit, opportunities, key=_RANK_SCORE)
+    opportunities.sort(key=_RANK_SCORE, reverse=True)
     return opportunities
 
 
 class Scanner:
     """
     Core scanner for detecting Kalshi vs sportsbook discrepancies.
-    
+
     Alert-only, no execution.
     """
 
+    __slots__ = (
+        "kalshi_slippage_buffer",
+        "max_staleness_seconds",
+        "min_edge_bps",
+        "min_liquidity",
+        "sportsbook_execution_friction",
+    )
+
     def __init__(
         self,
         kalshi_slippage_buffer: float = 0.005,  # 0.5%
@@ -205,19 +284,28 @@ class Scanner:
         market_key: str,
         kalshi_tob: KalshiTopOfBook,
         odds_quotes: list[OddsQuote],
-        market_mapping: dict,
+        market_mapping: dict[str, Any],
     ) -> list[Alert]:
         """
         Compare Kalshi orderbook vs sportsbook odds quotes.
-        
+
         Returns list of alerts if thresholds are met.
         """
         alerts: list[Alert] = []
 
+        # Read thresholds once per call rather than once per quote
+        max_staleness = self.max_staleness_seconds
+        min_edge_bps = self.min_edge_bps
+        min_liquidity = self.min_liquidity
+        friction_mult = 1 - self.sportsbook_execution_friction
+
         # Validate staleness
-        now = datetime.now(timezone.utc)
-        kalshi_age = (now - kalshi_tob.timestamp).total_seconds()
-        if kalshi_age > self.max_staleness_seconds:
+        now = datetime.now(UTC)
+        kt = kalshi_tob.timestamp
+        if kt.tzinfo is None:
+            kt = kt.replace(tzinfo=UTC)
+        kalshi_age = (now - kt).total_seconds()
+        if kalshi_age > max_staleness:
             return []
 
         if not kalshi_tob.is_valid:
@@ -225,76 +313,107 @@ class Scanner:
 
         # Get Kalshi prices with slippage buffer
         # For "buy YES", use ask + buffer
-        kalshi_yes_ask_adj = min(1.0, kalshi_tob.yes_ask + self.kalshi_slippage_buffer) if kalshi_tob.yes_ask else None  # type: ignore
+        kalshi_yes_ask_adj = (
+            min(1.0, kalshi_tob.yes_ask + self.kalshi_slippage_buffer)
+            if kalshi_tob.yes_ask
+            else None
+        )
         # For "sell YES" (implied), use bid - buffer
-        kalshi_yes_bid_adj = max(0.0, kalshi_tob.yes_bid - self.kalshi_slippage_buffer) if kalshi_tob.yes_bid else None  # type: ignore
+        kalshi_yes_bid_adj = (
+            max(0.0, kalshi_tob.yes_bid - self.kalshi_slippage_buffer)
+            if kalshi_tob.yes_bid
+            else None
+        )
 
         if kalshi_yes_ask_adj is None:
             return []
 
         # Check liquidity
-        if kalshi_tob.yes_ask_size < self.min_liquidity:
+        yes_ask_size = kalshi_tob.yes_ask_size
+        yes_bid_size = kalshi_tob.yes_bid_size
+        if yes_ask_size < min_liquidity:
             return []
+        rich_allowed = yes_bid_size >= min_liquidity
+
+        # Same orderbook snapshot is attached to every alert from this call
+        kalshi_snapshot = kalshi_tob.model_dump()
+
+        # Index quotes by (bookmaker, event, market type) once so each quote's
+        # opposite side is found without rescanning the full quote list
+        book_markets: dict[tuple[str, str, MarketType], list[OddsQuote]] = defaultdict(list)
+        for q in odds_quotes:
+            book_markets[(q.bookmaker, q.event_id, q.market_type)].append(q)
 
         # Process odds quotes (normalize naive timestamps to UTC for subtraction)
         for quote in odds_quotes:
             qt = quote.timestamp
             if qt.tzinfo is None:
-                qt = qt.replace(tzinfo=timezone.utc)
+                qt = qt.replace(tzinfo=UTC)
             odds_age = (now - qt).total_seconds()
-            if odds_age > self.max_staleness_seconds:
+            if odds_age > max_staleness:
                 continue
 
-            # Convert odds to no-vig probability
-            normalized = self._normalize_odds(quote, odds_quotes)
-            if normalized is None:
+            # Convert odds to no-vig probability. The NormalizedProb model is
+            # only built once an edge clears the threshold.
+            probs = self._no_vig_probs(
+                quote, book_markets[(quote.bookmaker, quote.event_id, quote.market_type)]
+            )
+            if probs is None:
                 continue
+            normalized: NormalizedProb | None = None
 
             # Apply sportsbook execution friction (conservative)
-            sportsbook_p_adj = normalized.p_no_vig * (1 - self.sportsbook_execution_friction)
+            sportsbook_p_adj = probs[1] * friction_mult
 
             # Compute edges in both directions
-            
+
             # Direction 1: Kalshi cheap (buy YES on Kalshi, implied "sell" on sportsbook)
             # Edge = sportsbook_p - kalshi_yes_ask
             edge_kalshi_cheap = sportsbook_p_adj - kalshi_yes_ask_adj
             edge_bps_cheap = edge_kalshi_cheap * 10_000
 
-            if edge_bps_cheap >= self.min_edge_bps:
+            if edge_bps_cheap >= min_edge_bps:
+                normalized = self._to_normalized(quote, probs)
                 alert = self._build_alert(
                     market_key=market_key,
                     direction=Direction.KALSHI_CHEAP,
                     kalshi_tob=kalshi_tob,
                     kalshi_price=kalshi_yes_ask_adj,
                     kalshi_side="YES",
-                    kalshi_liquidity=kalshi_tob.yes_ask_size,
+                    kalshi_liquidity=yes_ask_size,
                     quote=quote,
                     normalized=normalized,
                     edge_bps=edge_bps_cheap,
                     kalshi_age=kalshi_age,
                     odds_age=odds_age,
+                    kalshi_snapshot=kalshi_snapshot,
+                    now=now,
                 )
                 alerts.append(alert)
 
             # Direction 2: Kalshi rich (sell YES on Kalshi, implied "buy" on sportsbook)
             # Edge = kalshi_yes_bid - sportsbook_p
-            if kalshi_yes_bid_adj is not None and kalshi_tob.yes_bid_size >= self.min_liquidity:
+            if rich_allowed and kalshi_yes_bid_adj is not None:
                 edge_kalshi_rich = kalshi_yes_bid_adj - sportsbook_p_adj
                 edge_bps_rich = edge_kalshi_rich * 10_000
 
-                if edge_bps_rich >= self.min_edge_bps:
+                if edge_bps_rich >= min_edge_bps:
+                    if normalized is None:
+                        normalized = self._to_normalized(quote, probs)
                     alert = self._build_alert(
                         market_key=market_key,
                         direction=Direction.KALSHI_RICH,
                         kalshi_tob=kalshi_tob,
                         kalshi_price=kalshi_yes_bid_adj,
                         kalshi_side="YES",
-                        kalshi_liquidity=kalshi_tob.yes_bid_size,
+                        kalshi_liquidity=yes_bid_size,
                         quote=quote,
                         normalized=normalized,
                         edge_bps=edge_bps_rich,
                         kalshi_age=kalshi_age,
                         odds_age=odds_age,
+                        kalshi_snapshot=kalshi_snapshot,
+                        now=now,
                     )
                     alerts.append(alert)
 
@@ -304,20 +423,32 @@ class Scanner:
         self,
         target_quote: OddsQuote,
         all_quotes: list[OddsQuote],
-    ) -> Optional[NormalizedProb]:
+    ) -> NormalizedProb | None:
         """
         Convert odds to no-vig probability.
-        
+
         For two-way markets, finds the opposite side and removes vig.
         For multi-way, uses all outcomes (future enhancement).
+
+        all_quotes may be the full quote list or just the quotes sharing the
+        target's bookmaker/event/market (as pre-grouped by compare()).
         """
+        probs = self._no_vig_probs(target_quote, all_quotes)
+        if probs is None:
+            return None
+        return self._to_normalized(target_quote, probs)
+
+    def _no_vig_probs(
+        self,
+        target_quote: OddsQuote,
+        all_quotes: list[OddsQuote],
+    ) -> tuple[float, float, float] | None:
+        """Return (p_implied, p_no_vig, overround) without building a model."""
         # Convert to implied prob
-        if target_quote.odds_format == OddsFormat.AMERICAN:
-            p_implied = american_to_prob(target_quote.odds_value)
-        elif target_quote.odds_format == OddsFormat.DECIMAL:
-            p_implied = decimal_to_prob(target_quote.odds_value)
-        else:
+        to_prob = _TO_PROB.get(target_quote.odds_format)
+        if to_prob is None:
             return None
+        p_implied = to_prob(target_quote.odds_value)
 
         # Find opposite side for two-way vig removal
         # For h2h markets, look for the other team's odds from same bookmaker
@@ -334,28 +465,36 @@ class Scanner:
 
         if opposite_quote:
             # Two-way vig removal
-            if opposite_quote.odds_format == OddsFormat.AMERICAN:
-                p_opposite = american_to_prob(opposite_quote.odds_value)
-            elif opposite_quote.odds_format == OddsFormat.DECIMAL:
-                p_opposite = decimal_to_prob(opposite_quote.odds_value)
+            to_prob = _TO_PROB.get(opposite_quote.odds_format)
+            if to_prob is not None:
+                p_opposite = to_prob(opposite_quote.odds_value)
             else:
                 p_opposite = 1.0 - p_implied
 
-            p_no_vig, p_opposite_nv = no_vig_two_way(p_implied, p_opposite)
+            p_no_vig, _ = no_vig_two_way(p_implied, p_opposite)
             overround = p_implied + p_opposite
         else:
             # No opposite side found, use raw implied
             p_no_vig = p_implied
             overround = 1.0
 
+        return p_implied, p_no_vig, overround
+
+    @staticmethod
+    def _to_normalized(
+        quote: OddsQuote,
+        probs: tuple[float, float, float],
+    ) -> NormalizedProb:
+        """Wrap (p_implied, p_no_vig, overround) for a quote in a NormalizedProb."""
+        p_implied, p_no_vig, overround = probs
         return NormalizedProb(
             p_implied=p_implied,
             p_no_vig=p_no_vig,
             overround=overround,
             method=VigMethod.PROPORTIONAL,
-            selection=target_quote.selection,
-            bookmaker=target_quote.bookmaker,
-            timestamp=target_quote.timestamp,
+            selection=quote.selection,
+            bookmaker=quote.bookmaker,
+            timestamp=quote.timestamp,
         )
 
     def _build_alert(
@@ -371,8 +510,15 @@ class Scanner:
         edge_bps: float,
         kalshi_age: float,
         odds_age: float,
+        kalshi_snapshot: dict[str, Any] | None = None,
+        now: datetime | None = None,
     ) -> Alert:
-        """Build an alert object."""
+        """
+        Build an alert object.
+
+        compare() passes a shared orderbook snapshot and timestamp so they
+        are computed once per call instead of once per alert.
+        """
         edge_pct = edge_bps / 100.0
 
         # Confidence scoring
@@ -386,7 +532,7 @@ class Scanner:
 
         return Alert(
             alert_id=str(uuid.uuid4())[:8],
-            timestamp=datetime.now(timezone.utc),
+            timestamp=now or datetime.now(UTC),
             market_key=market_key,
             direction=direction,
             edge_pct=edge_pct,
@@ -402,7 +548,9 @@ class Scanner:
             sportsbook_p_no_vig=normalized.p_no_vig,
             notes=f"Overround: {normalized.overround:.4f}",
             raw_snapshot_refs={
-                "kalshi": kalshi_tob.model_dump(),
+                "kalshi": kalshi_snapshot
+                if kalshi_snapshot is not None
+                else kalshi_tob.model_dump(),
                 "odds": quote.model_dump(),
                 "normalized": normalized.model_dump(),
             },
@@ -420,7 +568,7 @@ class Scanner:
     ) -> tuple[Confidence, float]:
         """
         Compute confidence level and score.
-        
+
         Factors:
         - Larger edge = higher confidence
         - Fresher data = higher confidence
@@ -430,47 +578,19 @@ class Scanner:
         score = 0.0
 
         # Edge contribution (0-0.4)
-        if edge_bps >= 200:
-            score += 0.4
-        elif edge_bps >= 100:
-            score += 0.3
-        elif edge_bps >= 50:
-            score += 0.2
-        else:
-            score += 0.1
+        score += _EDGE_POINTS[bisect_right(_EDGE_CUTOFFS_BPS, edge_bps)]
 
         # Freshness contribution (0-0.3)
-        max_age = max(kalshi_age, odds_age)
-        if max_age < 10:
-            score += 0.3
-        elif max_age < 30:
-            score += 0.2
-        elif max_age < 60:
-            score += 0.1
+        score += _FRESHNESS_POINTS[bisect_right(_AGE_CUTOFFS_S, max(kalshi_age, odds_age))]
 
         # Liquidity contribution (0-0.2)
-        if kalshi_liquidity >= 100:
-            score += 0.2
-        elif kalshi_liquidity >= 50:
-            score += 0.15
-        elif kalshi_liquidity >= 20:
-            score += 0.1
-        else:
-            score += 0.05
+        score += _LIQUIDITY_POINTS[bisect_right(_LIQUIDITY_CUTOFFS, kalshi_liquidity)]
 
         # Overround contribution (0-0.1)
         # Lower overround = less vig = more reliable
-        if overround < 1.03:
-            score += 0.1
-        elif overround < 1.05:
-            score += 0.05
+        score += _OVERROUND_POINTS[bisect_right(_OVERROUND_CUTOFFS, overround)]
 
         # Classify
-        if score >= 0.75:
-            confidence = Confidence.HIGH
-        elif score >= 0.50:
-            confidence = Confidence.MED
-        else:
-            confidence = Confidence.LOW
+        confidence = _CONFIDENCE_BY_BUCKET[bisect_right(_SCORE_CUTOFFS, score)]
 
         return confidence, score
@@ -9,24 +9,27 @@ Stores:
 
 from __future__ import annotations
 
-import json
-from datetime import datetime
-from pathlib import Path
-from typing import Optional
+from typing import Self
 
 import aiosqlite
 
-from kalshi_odds.models.kalshi import KalshiContract, KalshiTopOfBook
-from kalshi_odds.models.odds import OddsQuote
 from kalshi_odds.models.comparison import Alert
+from kalshi_odds.models.kalshi import KalshiContract
+from kalshi_odds.models.odds import OddsQuote
+
+# (timestamp ISO string, market_key, direction, edge_bps, confidence,
+#  kalshi_price, sportsbook_p_no_vig)
+AlertRow = tuple[str, str, str, float, str, float, float]
 
 
 class Repository:
     """Async SQLite repository."""
 
+    __slots__ = ("_conn", "db_path")
+
     def __init__(self, db_path: str = "kalshi_odds.db") -> None:
         self.db_path = db_path
-        self._conn: Optional[aiosqlite.Connection] = None
+        self._conn: aiosqlite.Connection | None = None
 
     async def connect(self) -> None:
         """Initialize database and create tables."""
@@ -87,80 +90,112 @@ class Repository:
                 data_json TEXT
             )
         """)
+        # get_recent_alerts / get_recent_alert_rows read newest-first
+        await self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_alerts_timestamp ON alerts (timestamp)"
+        )
 
         await self._conn.commit()
 
     async def save_kalshi_contract(self, contract: KalshiContract) -> None:
         """Save or update a Kalshi contract."""
+        await self.save_kalshi_contracts([contract])
+
+    async def save_kalshi_contracts(self, contracts: list[KalshiContract]) -> None:
+        """Save or update many Kalshi contracts in a single transaction."""
         assert self._conn is not None
 
-        await self._conn.execute(
+        await self._conn.executemany(
             """
             INSERT OR REPLACE INTO kalshi_contracts
             (contract_id, kalshi_market_id, title, outcome_side, close_time, status, last_price, fetched_at, data_json)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
-            (
-                contract.contract_id,
-                contract.kalshi_market_id,
-                contract.title,
-                contract.outcome_side.value,
-                contract.close_time.isoformat() if contract.close_time else None,
-                contract.status,
-                contract.last_price,
-                contract.fetched_at.isoformat() if contract.fetched_at else None,
-                contract.model_dump_json(),
-            ),
+            [
+                (
+                    contract.contract_id,
+                    contract.kalshi_market_id,
+                    contract.title,
+                    contract.outcome_side.value,
+                    contract.close_time.isoformat() if contract.close_time else None,
+                    contract.status,
+                    contract.last_price,
+                    contract.fetched_at.isoformat() if contract.fetched_at else None,
+                    contract.model_dump_json(),
+                )
+                for contract in contracts
+            ],
         )
         await self._conn.commit()
 
     async def save_odds_quote(self, quote: OddsQuote) -> None:
         """Save an odds quote."""
+        await self.save_odds_quotes([quote])
+
+    async def save_odds_quotes(self, quotes: list[OddsQuote]) -> None:
+        """Save many odds quotes in a single transaction."""
         assert self._conn is not None
 
-        await self._conn.execute(
+        await self._conn.executemany(
             """
             INSERT INTO odds_quotes
             (source, bookmaker, event_id, market_type, selection, odds_format, odds_value, timestamp, data_json)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
-            (
-                quote.source,
-                quote.bookmaker,
-                quote.event_id,
-                quote.market_type.value,
-                quote.selection,
-                quote.odds_format.value,
-                quote.odds_value,
-                quote.timestamp.isoformat(),
-                quote.model_dump_json(),
-            ),
+            [
+                (
+                    quote.source,
+                    quote.bookmaker,
+                    quote.event_id,
+                    quote.market_type.value,
+                    quote.selection,
+                    quote.odds_format.value,
+                    quote.odds_value,
+                    quote.timestamp.isoformat(),
+                    quote.model_dump_json(),
+                )
+                for quote in quotes
+            ],
         )
         await self._conn.commit()
 
     async def save_alert(self, alert: Alert) -> None:
         """Save an alert."""
+        await self.save_alerts([alert])
+
+    async def save_alerts(self, alerts: list[Alert], alerts_json: list[str] | None = None) -> None:
+        """
+        Save many alerts in a single transaction.
+
+        alerts_json, if given, holds each alert's model_dump_json() already
+        computed by the caller (e.g. for the JSONL log) so it is not redone.
+        """
         assert self._conn is not None
+        if alerts_json is None:
+            alerts_json = [alert.model_dump_json() for alert in alerts]
 
-        await self._conn.execute(
+        await self._conn.executemany(
             """
             INSERT OR REPLACE INTO alerts
             (alert_id, timestamp, market_key, direction, edge_pct, edge_bps, confidence, confidence_score, kalshi_contract_id, sportsbook_bookmaker, data_json)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
-            (
-                alert.alert_id,
-                alert.timestamp.isoformat(),
-                alert.market_key,
-                alert.direction.value,
-                alert.edge_pct,
-                alert.edge_bps,
-                alert.confidence.value,
-                alert.confidence_score,
-                alert.kalshi_contract_id,
-                alert.sportsbook_bookmaker,
-                alert.model_dump_json(),
-            ),
+            [
+                (
+                    alert.alert_id,
+                    alert.timestamp.isoformat(),
+                    alert.market_key,
+                    alert.direction.value,
+                    alert.edge_pct,
+                    alert.edge_bps,
+                    alert.confidence.value,
+                    alert.confidence_score,
+                    alert.kalshi_contract_id,
+                    alert.sportsbook_bookmaker,
+                    alert_json,
+                )
+                for alert, alert_json in zip(alerts, alerts_json)
+            ],
         )
         await self._conn.commit()
 
@@ -173,17 +208,42 @@ class Repository:
             (limit,),
         )
         rows = await cursor.fetchall()
-        
-        alerts = []
-        for row in rows:
-            data = json.loads(row[0])
-            alerts.append(Alert(**data))
-        
-        return alerts
-
-    async def __aenter__(self) -> Repository:
+        # Stored JSON goes straight into the model in pydantic-core (no intermediate dict)
+        return [Alert.model_validate_json(row[0]) for row in rows]
+
+    async def get_recent_alert_rows(self, limit: int = 20) -> list[AlertRow]:
+        """
+        Get display columns of recent alerts without building Alert models.
+
+        Rows are AlertRow tuples, newest first.
+        """
+        assert self._conn is not None
+
+        cursor = await self._conn.execute(
+            """
+            SELECT timestamp, market_key, direction, edge_bps, confidence,
+                   json_extract(data_json, '$.kalshi_price'),
+                   json_extract(data_json, '$.sportsbook_p_no_vig')
+            FROM alerts ORDER BY timestamp DESC LIMIT ?
+            """,
+            (limit,),
+        )
+        return [
+            (timestamp, market_key, direction, edge_bps, confidence, kalshi_price, p_no_vig)
+            for (
+                timestamp,
+                market_key,
+                direction,
+                edge_bps,
+                confidence,
+                kalshi_price,
+                p_no_vig,
+            ) in await cursor.fetchall()
+        ]
+
+    async def __aenter__(self) -> Self:
         await self.connect()
         return self
 
-    async def __aexit__(self, *exc) -> None:
+    async def __aexit__(self, *exc: object) -> None:
         await self.close()
@@ -1,21 +1,50 @@
 """Normalized data models for Kalshi vs Sportsbook comparison."""
 
-from kalshi_odds.models.kalshi import KalshiContract, KalshiTopOfBook
-from kalshi_odds.models.odds import OddsQuote, OddsFormat, MarketType
-from kalshi_odds.models.probability import NormalizedProb, VigMethod
-from kalshi_odds.models.comparison import Comparison, Alert, Opportunity, Direction, Confidence
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from kalshi_odds._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from kalshi_odds.models.comparison import (
+        Alert,
+        Comparison,
+        Confidence,
+        Direction,
+        Opportunity,
+    )
+    from kalshi_odds.models.kalshi import KalshiContract, KalshiTopOfBook
+    from kalshi_odds.models.odds import MarketType, OddsFormat, OddsQuote
+    from kalshi_odds.models.probability import NormalizedProb, VigMethod
 
 __all__ = [
+    "Alert",
+    "Comparison",
+    "Confidence",
+    "Direction",
     "KalshiContract",
     "KalshiTopOfBook",
-    "OddsQuote",
-    "OddsFormat",
     "MarketType",
     "NormalizedProb",
-    "VigMethod",
-    "Comparison",
-    "Alert",
+    "OddsFormat",
+    "OddsQuote",
     "Opportunity",
-    "Direction",
-    "Confidence",
+    "VigMethod",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "kalshi_odds.models.kalshi": ["KalshiContract", "KalshiTopOfBook"],
+        "kalshi_odds.models.odds": ["OddsQuote", "OddsFormat", "MarketType"],
+        "kalshi_odds.models.probability": ["NormalizedProb", "VigMethod"],
+        "kalshi_odds.models.comparison": [
+            "Comparison",
+            "Alert",
+            "Opportunity",
+            "Direction",
+            "Confidence",
+        ],
+    },
+)
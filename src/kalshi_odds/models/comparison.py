@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import UTC, datetime
 from enum import Enum
-from typing import Optional
+from typing import Any
 
 from pydantic import BaseModel, Field
 
@@ -46,7 +46,7 @@ class Comparison(BaseModel):
     # Assumptions
     assumptions: list[str] = Field(default_factory=list)
     
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
 
 
 class Alert(BaseModel):
@@ -55,7 +55,7 @@ class Alert(BaseModel):
     """
     alert_id: str = Field(description="Unique alert ID")
     
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
     market_key: str
     direction: Direction
     
@@ -79,7 +79,7 @@ class Alert(BaseModel):
     
     # Metadata
     notes: str = ""
-    raw_snapshot_refs: dict = Field(default_factory=dict)
+    raw_snapshot_refs: dict[str, Any] = Field(default_factory=dict)
     
     # Freshness
     kalshi_data_age_seconds: float
@@ -97,7 +97,9 @@ class Opportunity(BaseModel):
     direction: Direction
 
     # Kalshi action
-    kalshi_action: str = Field(description='e.g. "BUY Thunder YES @ 68c" or "SELL Thunder YES @ 66c"')
+    kalshi_action: str = Field(
+        description='e.g. "BUY Thunder YES @ 68c" or "SELL Thunder YES @ 66c"'
+    )
     kalshi_ticker: str
     kalshi_price_cents: int = Field(ge=0, le=100)
     kalshi_spread_cents: int = Field(ge=0, le=100)
@@ -126,6 +128,6 @@ class Opportunity(BaseModel):
     rank_score: float = Field(description="Composite score for sorting")
 
     # Metadata
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
     raw_alert_count: int = Field(ge=0)
     kalshi_url: str = Field(default="", description="Link to Kalshi market page")
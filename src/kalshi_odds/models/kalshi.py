@@ -2,9 +2,8 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import UTC, datetime
 from enum import Enum
-from typing import Optional
 
 from pydantic import BaseModel, Field
 
@@ -30,8 +29,8 @@ class KalshiContract(BaseModel):
     status: str = "active"
     
     # Latest price (optional)
-    last_price: Optional[float] = Field(default=None, ge=0, le=1)
-    fetched_at: Optional[datetime] = None
+    last_price: float | None = Field(default=None, ge=0, le=1)
+    fetched_at: datetime | None = None
 
 
 class KalshiTopOfBook(BaseModel):
@@ -43,18 +42,18 @@ class KalshiTopOfBook(BaseModel):
     contract_id: str
     
     # YES side
-    yes_bid: Optional[float] = Field(default=None, ge=0, le=1)
-    yes_ask: Optional[float] = Field(default=None, ge=0, le=1)
+    yes_bid: float | None = Field(default=None, ge=0, le=1)
+    yes_ask: float | None = Field(default=None, ge=0, le=1)
     yes_bid_size: int = 0
     yes_ask_size: int = 0
     
     # NO side
-    no_bid: Optional[float] = Field(default=None, ge=0, le=1)
-    no_ask: Optional[float] = Field(default=None, ge=0, le=1)
+    no_bid: float | None = Field(default=None, ge=0, le=1)
+    no_ask: float | None = Field(default=None, ge=0, le=1)
     no_bid_size: int = 0
     no_ask_size: int = 0
     
-    timestamp: datetime = Field(default_factory=lambda: datetime.utcnow())
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
     
     @property
     def is_valid(self) -> bool:
@@ -68,14 +67,14 @@ class KalshiTopOfBook(BaseModel):
         )
     
     @property
-    def yes_mid(self) -> Optional[float]:
+    def yes_mid(self) -> float | None:
         """YES side mid price."""
         if self.yes_bid is not None and self.yes_ask is not None:
             return (self.yes_bid + self.yes_ask) / 2.0
         return None
 
 
-def cents_to_decimal(cents: int | float) -> float:
+def cents_to_decimal(cents: float) -> float:
     """Convert Kalshi cents (0-100) to decimal (0-1)."""
     return cents / 100.0
 
@@ -2,9 +2,8 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import UTC, datetime
 from enum import Enum
-from typing import Optional
 
 from pydantic import BaseModel, Field
 
@@ -42,11 +41,11 @@ class OddsQuote(BaseModel):
     odds_value: float = Field(description="Raw odds value")
     
     # Optional point/line for spreads/totals
-    point: Optional[float] = None
+    point: float | None = None
     
-    timestamp: datetime = Field(default_factory=lambda: datetime.utcnow())
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
     
     # Metadata
     event_title: str = ""
     sport: str = ""
-    commence_time: Optional[datetime] = None
+    commence_time: datetime | None = None
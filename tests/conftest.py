@@ -0,0 +1,152 @@
+"""Shared test fixtures: mocked adapters and model factories."""
+
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any
+
+import httpx
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from kalshi_odds.adapters.kalshi import KalshiAdapter
+from kalshi_odds.adapters.odds_api import OddsAPIAdapter
+from kalshi_odds.models.comparison import Alert, Confidence, Direction
+from kalshi_odds.models.kalshi import KalshiContract, OutcomeSide
+from kalshi_odds.models.odds import MarketType, OddsFormat, OddsQuote
+
+KALSHI_BASE_URL = "https://kalshi.test/trade-api/v2"
+ODDS_API_BASE_URL = "https://odds.test/v4"
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+def _recording_client(
+    base_url: str, handler: Handler
+) -> tuple[httpx.AsyncClient, list[httpx.Request]]:
+    """Client that answers through handler; returns it plus the list of requests seen."""
+    seen: list[httpx.Request] = []
+
+    def _record(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return handler(request)
+
+    return httpx.AsyncClient(base_url=base_url, transport=httpx.MockTransport(_record)), seen
+
+
+@pytest.fixture(scope="session")
+def private_key() -> rsa.RSAPrivateKey:
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.fixture
+def mock_kalshi(
+    private_key: rsa.RSAPrivateKey,
+) -> Callable[[Handler], tuple[KalshiAdapter, list[httpx.Request]]]:
+    """Factory: Kalshi adapter wired to a MockTransport, plus the list of requests seen."""
+
+    def make(handler: Handler) -> tuple[KalshiAdapter, list[httpx.Request]]:
+        adapter = KalshiAdapter(
+            api_key_id="test-key",
+            private_key_path="unused.pem",
+            base_url=KALSHI_BASE_URL,
+            requests_per_second=1000.0,
+        )
+        adapter._private_key = private_key
+        adapter._client, seen = _recording_client(KALSHI_BASE_URL, handler)
+        return adapter, seen
+
+    return make
+
+
+@pytest.fixture
+def mock_odds_api() -> Callable[..., tuple[OddsAPIAdapter, list[httpx.Request]]]:
+    """Factory: Odds API adapter wired to a MockTransport, plus the list of requests seen."""
+
+    def make(handler: Handler, cache_dir: Any = None) -> tuple[OddsAPIAdapter, list[httpx.Request]]:
+        adapter = OddsAPIAdapter(
+            api_key="test-key",
+            base_url=ODDS_API_BASE_URL,
+            requests_per_second=1000.0,
+            cache_dir=cache_dir,
+        )
+        adapter._client, seen = _recording_client(ODDS_API_BASE_URL, handler)
+        return adapter, seen
+
+    return make
+
+
+@pytest.fixture
+def make_contract() -> Callable[..., KalshiContract]:
+    """Factory: YES contract for ticker; the title defaults to the ticker."""
+
+    def make(ticker: str, title: str | None = None) -> KalshiContract:
+        return KalshiContract(
+            kalshi_market_id=ticker,
+            contract_id=ticker,
+            title=title or ticker,
+            outcome_side=OutcomeSide.YES,
+            close_time=datetime(2026, 2, 8, 3, tzinfo=UTC),
+        )
+
+    return make
+
+
+@pytest.fixture
+def make_quote() -> Callable[..., OddsQuote]:
+    """Factory: American-odds h2h quote; keyword overrides replace any field."""
+
+    def make(bookmaker: str, selection: str, title: str, **overrides: Any) -> OddsQuote:
+        fields: dict[str, Any] = {
+            "source": "theoddsapi",
+            "bookmaker": bookmaker,
+            "event_id": "evt1",
+            "market_type": MarketType.H2H,
+            "selection": selection,
+            "odds_format": OddsFormat.AMERICAN,
+            "odds_value": -150,
+            "event_title": title,
+        }
+        fields.update(overrides)
+        return OddsQuote(**fields)
+
+    return make
+
+
+@pytest.fixture
+def make_alert() -> Callable[..., Alert]:
+    """Factory: kalshi_cheap alert from one book; keyword overrides replace any field."""
+
+    def make(
+        bookmaker: str,
+        edge_bps: float,
+        p_no_vig: float = 0.40,
+        odds_value: float = -110.0,
+        **overrides: Any,
+    ) -> Alert:
+        fields: dict[str, Any] = {
+            "alert_id": bookmaker,
+            "timestamp": datetime(2026, 2, 8, 1, 30, tzinfo=UTC),
+            "market_key": "nba_20260207_houokc_okc",
+            "direction": Direction.KALSHI_CHEAP,
+            "edge_pct": edge_bps / 100.0,
+            "edge_bps": edge_bps,
+            "confidence": Confidence.LOW,
+            "confidence_score": 0.3,
+            "kalshi_contract_id": "KXNBAGAME-26FEB07HOUOKC-OKC",
+            "kalshi_side": "YES",
+            "kalshi_price": 0.40,
+            "kalshi_liquidity": 100,
+            "sportsbook_bookmaker": bookmaker,
+            "sportsbook_selection": "Oklahoma City Thunder",
+            "sportsbook_p_no_vig": p_no_vig,
+            "raw_snapshot_refs": {
+                "kalshi": {"yes_bid": 0.38, "yes_ask": 0.40},
+                "odds": {"odds_value": odds_value},
+            },
+            "kalshi_data_age_seconds": 1.0,
+            "sportsbook_data_age_seconds": 1.0,
+        }
+        fields.update(overrides)
+        return Alert(**fields)
+
+    return make
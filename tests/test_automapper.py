@@ -0,0 +1,188 @@
+"""Tests for auto-mapper ticker parsing and team matching."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from kalshi_odds.core.automapper import (
+    _KEYWORD_CODES,
+    _market_key_from_ticker,
+    _match_event_to_codes,
+    _team_codes,
+    _team_matches,
+    build_mappings,
+    parse_kalshi_ticker,
+    resolve_series_ticker,
+    write_mappings,
+)
+from kalshi_odds.core.matcher import MarketMatcher
+
+
+class TestTickerParsing:
+    """Test Kalshi game ticker parsing."""
+
+    def test_parse_game_ticker(self):
+        assert parse_kalshi_ticker("KXNBAGAME-26FEB07HOUOKC-OKC") == ("26FEB07", "HOUOKC", "OKC")
+
+    def test_market_key(self):
+        ticker = "KXNBAGAME-26FEB07HOUOKC-OKC"
+        assert (
+            _market_key_from_ticker(ticker, "26FEB07", "OKC", "HOUOKC") == "nba_20260207_houokc_okc"
+        )
+        ticker = "KXNFLGAME-25DEC14SEANE-SEA"
+        assert (
+            _market_key_from_ticker(ticker, "25DEC14", "SEA", "SEANE") == "nfl_20251214_seane_sea"
+        )
+
+    def test_market_key_unparsed_date(self):
+        assert (
+            _market_key_from_ticker("KXFOO-X-Y", "XXXXXXX", "Y", "ABCD") == "game_20260101_abcd_y"
+        )
+
+    def test_parse_invalid(self):
+        assert parse_kalshi_ticker("") is None
+        assert parse_kalshi_ticker("KXNBAGAME") is None
+        assert parse_kalshi_ticker("KXNBAGAME-26FEB07-OKC") is None
+
+
+class TestSeriesLookup:
+    """Test sport key / series ticker resolution."""
+
+    def test_sport_key_and_series(self):
+        assert resolve_series_ticker("basketball_nba") == "KXNBAGAME"
+        assert resolve_series_ticker("KXNFLGAME") == "KXNFLGAME"
+        assert resolve_series_ticker(" kxnbagame ") == "KXNBAGAME"
+
+    def test_unknown(self):
+        assert resolve_series_ticker("curling") is None
+
+
+class TestTeamMatching:
+    """Test team code ↔ team name matching."""
+
+    def test_keyword_match(self):
+        assert _team_matches("OKC", "Oklahoma City Thunder")
+        assert _team_matches("HOU", "Houston Rockets")
+        assert not _team_matches("OKC", "Houston Rockets")
+
+    def test_code_shared_across_leagues(self):
+        assert _team_matches("CLE", "Cleveland Cavaliers")
+        assert _team_matches("CLE", "Cleveland Browns")
+        assert _team_matches("LAC", "LA Clippers")
+        assert _team_matches("LAC", "Los Angeles Chargers")
+
+    def test_case_insensitive(self):
+        assert _team_matches("BOS", "BOSTON CELTICS")
+
+    def test_unknown_code_falls_back_to_code(self):
+        assert _team_matches("XYZ", "Team xyz")
+        assert not _team_matches("XYZ", "Houston Rockets")
+
+    def test_empty_name(self):
+        assert not _team_matches("OKC", "")
+
+    def test_match_event_orientation(self):
+        home, away = "Oklahoma City Thunder", "Houston Rockets"
+        assert _match_event_to_codes(home, away, "HOU", "OKC") == (away, home)
+        assert _match_event_to_codes(home, away, "OKC", "HOU") == (home, away)
+        assert _match_event_to_codes(home, away, "BOS", "OKC") is None
+
+    def test_team_codes_match_plain_substring_scan(self):
+        """Overlapping keywords (New York / New York Jets / Jets) all register."""
+        for name in (
+            "New York Jets",
+            "Los Angeles Lakers",
+            "Golden State Warriors",
+            "GS Warriors",
+            "Unknown FC",
+        ):
+            lowered = name.lower()
+            expected = frozenset(code for kw, code in _KEYWORD_CODES if kw in lowered)
+            assert _team_codes(name) == expected
+
+
+class TestMappingFile:
+    """Test mappings.yaml round-trip."""
+
+    def test_written_mappings_load_into_matcher(self, tmp_path):
+        path = tmp_path / "mappings.yaml"
+        write_mappings(
+            path,
+            [
+                {
+                    "market_key": "nba_hou_okc_2026-02-07_okc",
+                    "kalshi": {"contract_id": "KXNBAGAME-26FEB07HOUOKC-OKC", "side": "YES"},
+                    "odds": {
+                        "event_id": "evt1",
+                        "market_type": "h2h",
+                        "selection": "Oklahoma City Thunder",
+                    },
+                }
+            ],
+        )
+
+        matcher = MarketMatcher(mapping_file=path)
+        assert matcher.load_mappings() == 1
+        assert (
+            matcher.get_market_key_for_kalshi("KXNBAGAME-26FEB07HOUOKC-OKC")
+            == "nba_hou_okc_2026-02-07_okc"
+        )
+
+
+class TestBuildMappings:
+    """Test contract → event mapping."""
+
+    async def test_both_sides_map_to_one_event(self, tmp_path, make_contract):
+        async def list_contracts(**_kwargs):
+            return [
+                make_contract("KXNBAGAME-26FEB07HOUOKC-OKC"),
+                make_contract("KXNBAGAME-26FEB07HOUOKC-HOU"),
+                make_contract("KXNBAGAME-26FEB07BOSLAL-BOS"),
+            ]
+
+        async def list_events(_sport):
+            return [
+                {
+                    "id": "evt1",
+                    "home_team": "Oklahoma City Thunder",
+                    "away_team": "Houston Rockets",
+                },
+            ]
+
+        mappings = await build_mappings(
+            SimpleNamespace(list_contracts=list_contracts),
+            SimpleNamespace(list_events=list_events),
+            "basketball_nba",
+            tmp_path / "mappings.yaml",
+        )
+
+        assert [
+            (m["kalshi"]["contract_id"], m["odds"]["event_id"], m["odds"]["selection"])
+            for m in mappings
+        ] == [
+            ("KXNBAGAME-26FEB07HOUOKC-OKC", "evt1", "Oklahoma City Thunder"),
+            ("KXNBAGAME-26FEB07HOUOKC-HOU", "evt1", "Houston Rockets"),
+        ]
+
+    async def test_failed_fetch_cancels_the_other(self, tmp_path):
+        cancelled = asyncio.Event()
+
+        async def list_contracts(**_kwargs):
+            raise RuntimeError("kalshi down")
+
+        async def list_events(_sport):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with pytest.raises(RuntimeError, match="kalshi down"):
+            await build_mappings(
+                SimpleNamespace(list_contracts=list_contracts),
+                SimpleNamespace(list_events=list_events),
+                "basketball_nba",
+                tmp_path / "mappings.yaml",
+            )
+        assert cancelled.is_set()
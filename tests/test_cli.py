@@ -0,0 +1,202 @@
+"""Tests for the CLI commands and their scan pipeline helpers."""
+
+import asyncio
+import threading
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+import pytest
+from typer.testing import CliRunner
+
+from kalshi_odds import cli, config
+from kalshi_odds.core.automapper import write_mappings
+from kalshi_odds.core.matcher import MarketMatcher
+from kalshi_odds.core.scanner import Scanner, aggregate_opportunities
+from kalshi_odds.db import Repository
+from kalshi_odds.models.kalshi import KalshiTopOfBook
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def settings(tmp_path, monkeypatch) -> config.Settings:
+    """Settings pointing the CLI at a database under tmp_path."""
+    settings = config.get_settings(database_url=f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    monkeypatch.setattr(config, "get_settings", lambda: settings)
+    return settings
+
+
+def _mapping(market_key: str, contract_id: str, event_id: str, selection: str) -> dict:
+    return {
+        "market_key": market_key,
+        "kalshi": {"contract_id": contract_id, "side": "YES"},
+        "odds": {"event_id": event_id, "market_type": "h2h", "selection": selection},
+    }
+
+
+class TestRunScanCycle:
+    """Test one scan cycle against stub adapters."""
+
+    async def test_prices_only_quoted_markets(self, tmp_path, make_quote):
+        mapping_file = tmp_path / "mappings.yaml"
+        write_mappings(
+            mapping_file,
+            [
+                _mapping("okc", "KX-HOUOKC-OKC", "evt1", "Oklahoma City Thunder"),
+                _mapping("lal", "KX-BOSLAL-LAL", "evt2", "Los Angeles Lakers"),
+            ],
+        )
+        matcher = MarketMatcher(mapping_file=mapping_file)
+        matcher.load_mappings()
+        scanner = Scanner(
+            kalshi_slippage_buffer=0.005,
+            sportsbook_execution_friction=0.01,
+            min_edge_bps=50.0,
+            min_liquidity=10,
+            max_staleness_seconds=60.0,
+        )
+        get_odds_calls: list[dict] = []
+        book_requests: list[list[str]] = []
+
+        async def get_odds(**kwargs):
+            get_odds_calls.append(kwargs)
+            return ["raw evt1"]  # evt2 has no sportsbook prices
+
+        def parse_odds_to_quotes(raw_events):
+            return [
+                make_quote("draftkings", "Oklahoma City Thunder", "HOU @ OKC", odds_value=-150),
+                make_quote("draftkings", "Houston Rockets", "HOU @ OKC", odds_value=130),
+            ]
+
+        async def get_top_of_books(contract_ids, concurrency):
+            book_requests.append(contract_ids)
+            return {
+                cid: KalshiTopOfBook(
+                    contract_id=cid,
+                    yes_bid=0.38,
+                    yes_ask=0.40,
+                    yes_bid_size=100,
+                    yes_ask_size=100,
+                    timestamp=datetime.now(UTC),
+                )
+                for cid in contract_ids
+            }
+
+        alerts, opportunities = await cli._run_scan_cycle(
+            "basketball_nba",
+            matcher,
+            scanner,
+            SimpleNamespace(get_top_of_books=get_top_of_books),
+            SimpleNamespace(get_odds=get_odds, parse_odds_to_quotes=parse_odds_to_quotes),
+        )
+
+        # Both mapped events are requested; only the quoted market's orderbook is fetched
+        assert get_odds_calls == [{"sport": "basketball_nba", "event_ids": {"evt1", "evt2"}}]
+        assert book_requests == [["KX-HOUOKC-OKC"]]
+        assert alerts and {a.market_key for a in alerts} == {"okc"}
+        assert [o.market_key for o in opportunities] == ["okc"]
+
+    async def test_no_mappings_skips_all_requests(self, tmp_path):
+        matcher = MarketMatcher(mapping_file=tmp_path / "missing.yaml")
+
+        async def unexpected(*args, **kwargs):
+            raise AssertionError("no request expected")
+
+        alerts, opportunities = await cli._run_scan_cycle(
+            "basketball_nba",
+            matcher,
+            Scanner(),
+            SimpleNamespace(get_top_of_books=unexpected),
+            SimpleNamespace(get_odds=unexpected),
+        )
+
+        assert (alerts, opportunities) == ([], [])
+
+
+class TestPublishScan:
+    """Test persisting a scan's results."""
+
+    async def test_db_and_jsonl_writes_overlap(self, tmp_path, monkeypatch, make_alert):
+        monkeypatch.chdir(tmp_path)  # last-scan file is written to the cwd
+        jsonl_started = threading.Event()
+        append_jsonl = cli._append_jsonl
+
+        def _append(path: str, lines: list[str]) -> None:
+            jsonl_started.set()
+            append_jsonl(path, lines)
+
+        monkeypatch.setattr(cli, "_append_jsonl", _append)
+
+        class _Repo:
+            saved: list[str] | None = None
+            overlapped = False
+
+            async def save_alerts(self, alerts, alerts_json=None):
+                # Finishes only once the JSONL write has started alongside it
+                self.overlapped = await asyncio.to_thread(jsonl_started.wait, 1.0)
+                self.saved = alerts_json
+
+        repo = _Repo()
+        output = tmp_path / "alerts.jsonl"
+        alerts = [make_alert("draftkings", 150.0), make_alert("fanduel", 120.0)]
+        await cli._publish_scan(repo, str(output), alerts, [])
+
+        assert repo.overlapped
+        assert output.read_text().splitlines() == repo.saved
+        assert repo.saved is not None and len(repo.saved) == 2
+
+
+class TestShow:
+    """Test the show command's output formats."""
+
+    @staticmethod
+    def _save(settings, alerts):
+        async def _run():
+            async with Repository(settings.database_url.split("///")[-1]) as repo:
+                await repo.save_alerts(alerts)
+
+        asyncio.run(_run())
+
+    def test_table_by_default(self, settings, make_alert):
+        self._save(settings, [make_alert("draftkings", 150.0)])
+
+        result = runner.invoke(cli.app, ["show"])
+
+        assert result.exit_code == 0
+        assert "Last 1 Alerts" in result.output
+        assert "\t" not in result.output
+
+    def test_plain_writes_tab_separated_lines(self, settings, make_alert):
+        earlier = datetime(2026, 2, 8, 1, 0, tzinfo=UTC)
+        self._save(
+            settings,
+            [
+                make_alert("draftkings", 150.0, 0.46),
+                make_alert("fanduel", 120.0, timestamp=earlier),
+            ],
+        )
+
+        result = runner.invoke(cli.app, ["show", "--plain"])
+
+        assert result.exit_code == 0
+        assert result.output.splitlines() == [
+            "Time\tMarket\tDirection\tEdge\tConfidence\tKalshi Price\tBook Prob",
+            "02-08 01:30\tnba_20260207_houokc_okc\tkalshi_cheap\t150bps\tlow\t0.400\t0.460",
+            "02-08 01:00\tnba_20260207_houokc_okc\tkalshi_cheap\t120bps\tlow\t0.400\t0.400",
+        ]
+
+
+class TestDetail:
+    """Test the detail command's output formats."""
+
+    def test_plain_is_unstyled_detail_text(self, tmp_path, monkeypatch, make_alert):
+        monkeypatch.chdir(tmp_path)
+        opportunities = aggregate_opportunities([make_alert("draftkings", 150.0)])
+        cli._save_last_opportunities(opportunities)
+
+        styled = runner.invoke(cli.app, ["detail", "1"])
+        plain = runner.invoke(cli.app, ["detail", "1", "--plain"])
+
+        assert styled.exit_code == plain.exit_code == 0
+        assert "Books:" in styled.output
+        assert plain.output == cli._detail_text(1, opportunities[0]).plain + "\n"
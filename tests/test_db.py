@@ -0,0 +1,39 @@
+"""Tests for the SQLite repository."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from kalshi_odds.db import Repository
+
+NOW = datetime(2026, 2, 8, 1, 30, tzinfo=UTC)
+
+
+class TestRecentAlerts:
+    """Test newest-first alert reads."""
+
+    async def test_rows_match_full_alerts(self, tmp_path, make_alert):
+        async with Repository(str(tmp_path / "test.db")) as repo:
+            await repo.save_alerts(
+                [
+                    make_alert("a1", 90.0, timestamp=NOW - timedelta(minutes=10)),
+                    make_alert("a2", 120.0, timestamp=NOW),
+                    make_alert("a3", 60.0, timestamp=NOW - timedelta(minutes=20)),
+                ]
+            )
+            alerts = await repo.get_recent_alerts(limit=2)
+            rows = await repo.get_recent_alert_rows(limit=2)
+
+        assert [a.alert_id for a in alerts] == ["a2", "a1"]
+        assert rows == [
+            (
+                a.timestamp.isoformat(),
+                a.market_key,
+                a.direction.value,
+                a.edge_bps,
+                a.confidence.value,
+                pytest.approx(a.kalshi_price),
+                pytest.approx(a.sportsbook_p_no_vig),
+            )
+            for a in alerts
+        ]
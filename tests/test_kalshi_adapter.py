@@ -0,0 +1,472 @@
+"""Tests for the Kalshi adapter against a mocked HTTP transport."""
+
+import asyncio
+import base64
+import json
+from contextlib import aclosing
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import padding
+
+import kalshi_odds.adapters.kalshi as kalshi_module
+from kalshi_odds.adapters.kalshi import BATCH_ORDERBOOK_MAX_TICKERS, KalshiAdapter
+
+
+@pytest.fixture(autouse=True)
+def reset_batch_capability():
+    """Batch-orderbook probe results are shared per process; start each test undecided."""
+    KalshiAdapter._batch_orderbooks_by_url.clear()
+    yield
+    KalshiAdapter._batch_orderbooks_by_url.clear()
+
+
+class TestConnect:
+    """Test adapter setup."""
+
+    async def test_private_key_parsed_once_per_process(self, private_key, tmp_path):
+        key_file = tmp_path / "kalshi.pem"
+        key_file.write_bytes(
+            private_key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            )
+        )
+        keys = []
+        for _ in range(2):
+            async with KalshiAdapter(
+                api_key_id="test-key", private_key_path=str(key_file)
+            ) as adapter:
+                keys.append(adapter._private_key)
+
+        assert keys[0] is keys[1]
+
+
+class TestAuth:
+    """Test request signing."""
+
+    def test_signature_verifies_with_public_key(self, private_key, mock_kalshi):
+        adapter, _ = mock_kalshi(lambda r: httpx.Response(200))
+        headers = adapter._auth_headers("get", "/trade-api/v2/markets")
+
+        message = f"{headers['KALSHI-ACCESS-TIMESTAMP']}GET/trade-api/v2/markets".encode()
+        private_key.public_key().verify(
+            base64.b64decode(headers["KALSHI-ACCESS-SIGNATURE"]),
+            message,
+            padding.PSS(mgf=padding.MGF1(hashes.SHA256()), salt_length=padding.PSS.MAX_LENGTH),
+            hashes.SHA256(),
+        )
+
+
+class TestThrottle:
+    """Test the request token bucket."""
+
+    async def test_burst_then_rate_limited(self, monkeypatch):
+        clock = [1000.0]
+        sleeps: list[float] = []
+
+        async def _sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+            clock[0] += seconds
+
+        monkeypatch.setattr(kalshi_module, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+        monkeypatch.setattr(asyncio, "sleep", _sleep)
+        adapter = KalshiAdapter(
+            api_key_id="test-key", private_key_path="unused.pem", requests_per_second=20.0
+        )
+
+        for _ in range(20):
+            await adapter._throttle()
+        assert sleeps == []  # a full bucket covers one second's worth of requests
+
+        await adapter._throttle()
+        assert sleeps == [pytest.approx(0.05)]  # then one token per 1/20 s
+
+        clock[0] += 0.1  # idle time refills the bucket
+        await adapter._throttle()
+        await adapter._throttle()
+        assert len(sleeps) == 1
+
+    async def test_rate_limited_probe_leaves_batch_support_undecided(self, mock_kalshi):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/markets/orderbooks"):
+                return httpx.Response(429)
+            return httpx.Response(200, json={"orderbook": {"yes": [[20, 4]], "no": [[70, 6]]}})
+
+        adapter, _ = mock_kalshi(handler)
+        books = await adapter.get_top_of_books(["TICK-A"])
+        await adapter.close()
+
+        assert books["TICK-A"] is not None
+        assert adapter._supports_batch_orderbooks is None
+
+
+class TestResponseCache:
+    """Test the TTL response cache on GET endpoints."""
+
+    async def test_orderbook_cached_within_ttl(self, mock_kalshi):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"orderbook": {"yes": [[40, 10]], "no": [[55, 20]]}})
+
+        adapter, seen = mock_kalshi(handler)
+        first = await adapter.get_top_of_book("TICK-A")
+        second = await adapter.get_top_of_book("TICK-A")
+        await adapter.close()
+
+        assert len(seen) == 1
+        assert first is not None and second is not None
+        assert second.yes_bid == first.yes_bid == pytest.approx(0.40)
+
+    async def test_place_order_invalidates_cached_orderbook(self, mock_kalshi):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.method == "POST":
+                return httpx.Response(201, json={"order": {"status": "resting"}})
+            return httpx.Response(200, json={"orderbook": {"yes": [[40, 10]], "no": [[55, 20]]}})
+
+        adapter, seen = mock_kalshi(handler)
+        await adapter.get_top_of_book("TICK-A")
+        await adapter.get_top_of_book("TICK-B")
+        await adapter.place_order("TICK-A", side="yes", action="buy", count=1, yes_price=45)
+        await adapter.get_top_of_book("TICK-A")
+        await adapter.get_top_of_book("TICK-B")
+        await adapter.close()
+
+        assert [r.url.path.rsplit("/", 2)[-2] for r in seen if r.method == "GET"] == [
+            "TICK-A",
+            "TICK-B",
+            "TICK-A",
+        ]
+
+    async def test_place_order_sends_json_body(self, mock_kalshi):
+        adapter, seen = mock_kalshi(lambda r: httpx.Response(201, json={"order": {}}))
+        await adapter.place_order("TICK-A", side="no", action="buy", count=3, no_price=120)
+        await adapter.close()
+
+        assert seen[0].headers["content-type"] == "application/json"
+        assert json.loads(seen[0].content) == {
+            "ticker": "TICK-A",
+            "side": "no",
+            "action": "buy",
+            "count": 3,
+            "type": "limit",
+            "no_price": 99,
+        }
+
+    async def test_uncached_get_always_requests(self, mock_kalshi):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"ok": True})
+
+        adapter, seen = mock_kalshi(handler)
+        await adapter._get("/exchange/status")
+        await adapter._get("/exchange/status")
+        await adapter.close()
+
+        assert len(seen) == 2
+
+    async def test_cache_key_includes_params(self, mock_kalshi):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"markets": [], "cursor": ""})
+
+        adapter, seen = mock_kalshi(handler)
+        await adapter.list_markets(series_ticker="KXNBAGAME")
+        await adapter.list_markets(series_ticker="KXNFLGAME")
+        await adapter.list_markets(series_ticker="KXNBAGAME")
+        await adapter.close()
+
+        assert len(seen) == 2
+
+
+class TestConcurrentOrderbooks:
+    """Test batched orderbook fetching."""
+
+    async def test_get_top_of_books_dedupes_and_maps(self, mock_kalshi):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if "BAD" in request.url.path:
+                raise httpx.ReadTimeout("timed out", request=request)
+            return httpx.Response(200, json={"orderbook": {"yes": [[30, 5]], "no": [[60, 8]]}})
+
+        adapter, seen = mock_kalshi(handler)
+        books = await adapter.get_top_of_books(["TICK-A", "TICK-B", "TICK-A", "TICK-BAD"])
+        await adapter.close()
+
+        assert list(books) == ["TICK-A", "TICK-B", "TICK-BAD"]
+        assert books["TICK-A"] is not None and books["TICK-A"].yes_bid == pytest.approx(0.30)
+        assert books["TICK-BAD"] is None
+        assert sum(1 for r in seen if r.url.path.endswith("TICK-A/orderbook")) == 1
+        assert adapter._supports_batch_orderbooks is False
+
+    async def test_batch_endpoint_used_with_per_ticker_fallback(self, mock_kalshi):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/markets/orderbooks"):
+                assert request.url.params["tickers"] == "TICK-A,TICK-B"
+                return httpx.Response(
+                    200,
+                    json={
+                        "orderbooks": [
+                            {"ticker": "TICK-A", "orderbook": {"yes": [[30, 5]], "no": [[60, 8]]}}
+                        ]
+                    },
+                )
+            return httpx.Response(200, json={"orderbook": {"yes": [[20, 4]], "no": [[70, 6]]}})
+
+        adapter, seen = mock_kalshi(handler)
+        books = await adapter.get_top_of_books(["TICK-A", "TICK-B"])
+        await adapter.close()
+
+        assert adapter._supports_batch_orderbooks is True
+        assert books["TICK-A"].yes_bid == pytest.approx(0.30)
+        assert books["TICK-B"].yes_bid == pytest.approx(0.20)
+        assert [r.url.path.rsplit("/", 2)[-2:] for r in seen] == [
+            ["markets", "orderbooks"],
+            ["TICK-B", "orderbook"],
+        ]
+
+    async def test_batch_chunks_cover_long_ticker_lists(self, mock_kalshi):
+        def handler(request: httpx.Request) -> httpx.Response:
+            tickers = request.url.params["tickers"].split(",")
+            return httpx.Response(
+                200,
+                json={
+                    "orderbooks": [
+                        {"ticker": t, "orderbook": {"yes": [[30, 5]], "no": [[60, 8]]}}
+                        for t in tickers
+                    ]
+                },
+            )
+
+        adapter, seen = mock_kalshi(handler)
+        tickers = [f"TICK-{i}" for i in range(BATCH_ORDERBOOK_MAX_TICKERS * 2 + 50)]
+        books = await adapter.get_top_of_books(tickers)
+        await adapter.close()
+
+        assert all(books[t] is not None for t in tickers)
+        assert [len(r.url.params["tickers"].split(",")) for r in seen] == [
+            BATCH_ORDERBOOK_MAX_TICKERS,
+            BATCH_ORDERBOOK_MAX_TICKERS,
+            50,
+        ]
+
+    async def test_unsupported_batch_endpoint_not_retried(self, mock_kalshi):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/markets/orderbooks"):
+                return httpx.Response(404)
+            return httpx.Response(200, json={"orderbook": {"yes": [[20, 4]], "no": [[70, 6]]}})
+
+        adapter, seen = mock_kalshi(handler)
+        await adapter.get_top_of_books(["TICK-A"])
+        await adapter.get_top_of_books(["TICK-B"])
+        await adapter.close()
+
+        assert adapter._supports_batch_orderbooks is False
+        assert sum(1 for r in seen if r.url.path.endswith("/markets/orderbooks")) == 1
+
+    async def test_auth_failure_leaves_batch_support_undecided(self, mock_kalshi, tmp_path):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/markets/orderbooks"):
+                return httpx.Response(401)
+            return httpx.Response(200, json={"orderbook": {"yes": [[20, 4]], "no": [[70, 6]]}})
+
+        adapter, _ = mock_kalshi(handler)
+        adapter._cache_dir = tmp_path
+        books = await adapter.get_top_of_books(["TICK-A"])
+        await adapter.close()
+
+        assert books["TICK-A"] is not None
+        assert adapter._supports_batch_orderbooks is None
+        assert list(tmp_path.iterdir()) == []
+
+    async def test_rejected_probe_not_persisted(self, mock_kalshi, tmp_path):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/markets/orderbooks"):
+                return httpx.Response(400)
+            return httpx.Response(200, json={"orderbook": {"yes": [[20, 4]], "no": [[70, 6]]}})
+
+        adapter, _ = mock_kalshi(handler)
+        adapter._cache_dir = tmp_path
+        await adapter.get_top_of_books(["TICK-A"])
+        await adapter.close()
+
+        assert adapter._supports_batch_orderbooks is False
+        assert list(tmp_path.iterdir()) == []
+
+    async def test_probe_result_scoped_to_base_url(self, mock_kalshi):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/markets/orderbooks"):
+                return httpx.Response(404)
+            return httpx.Response(200, json={"orderbook": {"yes": [[20, 4]], "no": [[70, 6]]}})
+
+        demo, _ = mock_kalshi(handler)
+        demo._base_url = "https://demo.kalshi.test/trade-api/v2"
+        await demo.get_top_of_books(["TICK-A"])
+        await demo.close()
+        prod, _ = mock_kalshi(handler)
+
+        assert demo._supports_batch_orderbooks is False
+        assert prod._supports_batch_orderbooks is None
+        await prod.close()
+
+    async def test_probe_result_persisted_across_runs(self, mock_kalshi, tmp_path):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/markets/orderbooks"):
+                return httpx.Response(404)
+            return httpx.Response(200, json={"orderbook": {"yes": [[20, 4]], "no": [[70, 6]]}})
+
+        first, _ = mock_kalshi(handler)
+        first._cache_dir = tmp_path
+        await first.get_top_of_books(["TICK-A"])
+        await first.close()
+
+        KalshiAdapter._batch_orderbooks_by_url.clear()  # as in a fresh process
+        second, seen = mock_kalshi(handler)
+        second._cache_dir = tmp_path
+        await second.get_top_of_books(["TICK-B"])
+        await second.close()
+
+        assert second._supports_batch_orderbooks is False
+        assert [r.url.path.rsplit("/", 2)[-2:] for r in seen] == [["TICK-B", "orderbook"]]
+
+
+def _market(ticker: str) -> dict:
+    return {
+        "ticker": ticker,
+        "event_ticker": ticker.rsplit("-", 1)[0],
+        "title": f"Market {ticker}",
+        "status": "active",
+        "close_time": "2026-02-08T03:00:00Z",
+        "yes_ask": 45,
+    }
+
+
+class TestListContracts:
+    """Test paginated contract listing."""
+
+    async def test_duplicate_tickers_across_pages_dropped(self, mock_kalshi):
+        pages = {
+            None: {"markets": [_market("EV-A"), _market("EV-B")], "cursor": "p2"},
+            "p2": {"markets": [_market("EV-B"), _market("EV-C")], "cursor": ""},
+        }
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=pages[request.url.params.get("cursor")])
+
+        adapter, seen = mock_kalshi(handler)
+        contracts = await adapter.list_contracts()
+        await adapter.close()
+
+        assert [c.contract_id for c in contracts] == ["EV-A", "EV-B", "EV-C"]
+        assert len(seen) == 2
+
+    async def test_max_results_stops_paging(self, mock_kalshi):
+        pages = {
+            None: {"markets": [_market("EV-A"), _market("EV-B")], "cursor": "p2"},
+            "p2": {"markets": [_market("EV-C"), _market("EV-D")], "cursor": "p3"},
+        }
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=pages[request.url.params.get("cursor")])
+
+        adapter, seen = mock_kalshi(handler)
+        contracts = await adapter.list_contracts(limit=2, max_results=3)
+        await adapter.close()
+
+        assert [c.contract_id for c in contracts] == ["EV-A", "EV-B", "EV-C"]
+        assert [r.url.params["limit"] for r in seen] == ["2", "1"]
+
+    @pytest.mark.parametrize("max_results", [0, -1])
+    async def test_non_positive_max_results_sends_nothing(self, mock_kalshi, max_results):
+        adapter, seen = mock_kalshi(lambda r: httpx.Response(200, json={"markets": []}))
+        contracts = await adapter.list_contracts(max_results=max_results)
+        await adapter.close()
+
+        assert contracts == []
+        assert seen == []
+
+
+class TestTopOfBook:
+    """Test orderbook → top of book parsing."""
+
+    async def test_best_levels_from_unsorted_ladders(self, mock_kalshi):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                json={
+                    "orderbook": {
+                        "yes": [[38, 5], [41, 12], [40, 3]],
+                        "no": [[50, 7], [57, 9], [55, 2]],
+                    }
+                },
+            )
+
+        adapter, _ = mock_kalshi(handler)
+        tob = await adapter.get_top_of_book("TICK-A")
+        await adapter.close()
+
+        assert tob is not None
+        assert tob.yes_bid == pytest.approx(0.41)
+        assert tob.yes_bid_size == 12
+        assert tob.yes_ask == pytest.approx(0.43)
+        assert tob.yes_ask_size == 9
+        assert tob.no_bid == pytest.approx(0.57)
+        assert tob.no_ask == 0.59  # exact: complement taken in cents
+
+    async def test_iter_contracts_early_exit_skips_later_pages(self, mock_kalshi):
+        pages = {
+            None: {"markets": [_market("EV-A"), _market("EV-B")], "cursor": "p2"},
+            "p2": {"markets": [_market("EV-C")], "cursor": ""},
+        }
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=pages[request.url.params.get("cursor")])
+
+        adapter, seen = mock_kalshi(handler)
+        async with aclosing(adapter.iter_contracts()) as contracts:
+            async for contract in contracts:
+                if contract.contract_id == "EV-B":
+                    break
+        await adapter.close()
+
+        assert len(seen) == 1
+
+    async def test_iter_contracts_aclosing_cancels_prefetch(self, mock_kalshi):
+        pages = {
+            None: {"markets": [_market("EV-A"), _market("EV-B")], "cursor": "p2"},
+            "p2": {"markets": [_market("EV-C")], "cursor": ""},
+        }
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.params.get("cursor"):
+                await asyncio.sleep(10)  # page two never arrives before the caller stops
+            return httpx.Response(200, json=pages[request.url.params.get("cursor")])
+
+        adapter, _ = mock_kalshi(handler)
+        async with aclosing(adapter.iter_contracts(prefetch=True)) as contracts:
+            async for _contract in contracts:
+                break
+        pending = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        await adapter.close()
+
+        assert pending == []
+
+    async def test_iter_contracts_prefetches_next_page(self, mock_kalshi):
+        pages = {
+            None: {"markets": [_market("EV-A"), _market("EV-B")], "cursor": "p2"},
+            "p2": {"markets": [_market("EV-C")], "cursor": ""},
+        }
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=pages[request.url.params.get("cursor")])
+
+        adapter, seen = mock_kalshi(handler)
+        tickers = []
+        async for contract in adapter.iter_contracts(prefetch=True):
+            tickers.append(contract.contract_id)
+            if contract.contract_id == "EV-A":
+                await asyncio.sleep(0.05)  # caller work; page two downloads meanwhile
+                assert len(seen) == 2
+        await adapter.close()
+
+        assert tickers == ["EV-A", "EV-B", "EV-C"]
+        assert len(seen) == 2
@@ -0,0 +1,86 @@
+"""Tests for fuzzy candidate matching."""
+
+import pytest
+from rapidfuzz import fuzz
+
+from kalshi_odds.core.matcher import MarketMatcher
+
+
+class TestFuzzyCandidates:
+    """Test batched fuzzy title matching."""
+
+    def test_disabled_returns_nothing(self, make_contract, make_quote):
+        matcher = MarketMatcher(fuzzy_enabled=False)
+        assert (
+            matcher.find_fuzzy_candidates([make_contract("A", "x")], [make_quote("dk", "x", "x")])
+            == []
+        )
+
+    def test_shared_titles_fan_out_with_unnormalized_scores(self, make_contract, make_quote):
+        # Titles are only lowercased: punctuation still counts toward the score
+        matcher = MarketMatcher(fuzzy_enabled=True, fuzzy_threshold=0.9)
+        contracts = [
+            make_contract("KXNBAGAME-26FEB07HOUOKC-OKC", "Houston Rockets @ Oklahoma City Thunder"),
+            make_contract(
+                "KXNBAGAME-26FEB07HOUOKC-HOU", "Houston Rockets @ Oklahoma City Thunder!"
+            ),
+            make_contract("KXNFLGAME-26FEB08SEANE-SEA", "Seattle at New England"),
+        ]
+        quotes = [
+            make_quote(
+                "draftkings", "Oklahoma City Thunder", "Houston Rockets @ Oklahoma City Thunder"
+            ),
+            make_quote("fanduel", "Houston Rockets", "houston rockets - oklahoma city thunder"),
+        ]
+
+        candidates = matcher.find_fuzzy_candidates(contracts, quotes)
+
+        assert [(c.contract_id, q.bookmaker, score) for c, q, score in candidates] == [
+            ("KXNBAGAME-26FEB07HOUOKC-OKC", "draftkings", 1.0),
+            ("KXNBAGAME-26FEB07HOUOKC-HOU", "draftkings", pytest.approx(0.9873, abs=1e-4)),
+            ("KXNBAGAME-26FEB07HOUOKC-OKC", "fanduel", pytest.approx(0.9744, abs=1e-4)),
+            ("KXNBAGAME-26FEB07HOUOKC-HOU", "fanduel", pytest.approx(0.9620, abs=1e-4)),
+        ]
+        for c, q, score in candidates:
+            assert score == pytest.approx(
+                fuzz.token_sort_ratio(c.title.lower(), q.event_title.lower()) / 100.0
+            )
+
+    def test_ties_keep_input_order(self, make_contract, make_quote):
+        # token_sort_ratio ignores word order, so all three titles score 1.0
+        matcher = MarketMatcher(fuzzy_enabled=True, fuzzy_threshold=0.9)
+        contracts = [
+            make_contract("X", "Rockets at Thunder"),
+            make_contract("Y", "Thunder at Rockets"),
+            make_contract("Z", "Rockets at Thunder"),
+        ]
+        quotes = [
+            make_quote("fanduel", "Houston Rockets", "Rockets at Thunder"),
+            make_quote("draftkings", "Houston Rockets", "Thunder at Rockets"),
+        ]
+
+        candidates = matcher.find_fuzzy_candidates(contracts, quotes)
+
+        assert [(c.contract_id, q.bookmaker) for c, q, _ in candidates] == [
+            ("X", "fanduel"),
+            ("X", "draftkings"),
+            ("Y", "fanduel"),
+            ("Y", "draftkings"),
+            ("Z", "fanduel"),
+            ("Z", "draftkings"),
+        ]
+
+    def test_zero_threshold_keeps_zero_scores(self, make_contract, make_quote):
+        matcher = MarketMatcher(fuzzy_enabled=True, fuzzy_threshold=0.0)
+        contracts = [make_contract("A", "Rockets at Thunder")]
+        quotes = [
+            make_quote("fanduel", "x", "zzzz"),
+            make_quote("draftkings", "Houston Rockets", "Rockets at Thunder"),
+        ]
+
+        candidates = matcher.find_fuzzy_candidates(contracts, quotes)
+
+        assert [(q.bookmaker, score) for _, q, score in candidates] == [
+            ("draftkings", 1.0),
+            ("fanduel", 0.0),
+        ]
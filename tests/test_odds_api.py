@@ -0,0 +1,143 @@
+"""Tests for The Odds API adapter against a mocked HTTP transport."""
+
+from datetime import UTC, datetime
+
+import httpx
+
+from kalshi_odds.adapters.odds_api import EVENT_IDS_FILTER_MAX, OddsAPIAdapter
+from kalshi_odds.models.odds import MarketType
+
+EVENTS = [
+    {
+        "id": "evt1",
+        "sport_key": "basketball_nba",
+        "commence_time": "2026-02-08T01:00:00Z",
+        "home_team": "Oklahoma City Thunder",
+        "away_team": "Houston Rockets",
+    }
+]
+
+
+class TestResponseCache:
+    """Test listing cache (memory, disk, ETag revalidation)."""
+
+    async def test_events_cached_in_memory(self, mock_odds_api):
+        adapter, seen = mock_odds_api(lambda r: httpx.Response(200, json=EVENTS))
+        assert await adapter.list_events("basketball_nba") == EVENTS
+        assert await adapter.list_events("basketball_nba") == EVENTS
+        await adapter.close()
+
+        assert len(seen) == 1
+        assert seen[0].url.params["apiKey"] == "test-key"
+
+    async def test_events_cached_on_disk_across_instances(self, mock_odds_api, tmp_path):
+        first, seen_first = mock_odds_api(
+            lambda r: httpx.Response(200, json=EVENTS), cache_dir=tmp_path
+        )
+        await first.list_events("basketball_nba")
+        await first.close()
+
+        second, seen_second = mock_odds_api(lambda r: httpx.Response(500), cache_dir=tmp_path)
+        assert await second.list_events("basketball_nba") == EVENTS
+        await second.close()
+
+        assert len(seen_first) == 1
+        assert seen_second == []
+
+    async def test_disk_cache_scoped_to_base_url(self, mock_odds_api, tmp_path):
+        prod, _ = mock_odds_api(lambda r: httpx.Response(200, json=EVENTS), cache_dir=tmp_path)
+        await prod.list_events("basketball_nba")
+        await prod.close()
+
+        staging, seen = mock_odds_api(lambda r: httpx.Response(200, json=[]), cache_dir=tmp_path)
+        staging._base_url = "https://staging.odds.test/v4"
+        assert await staging.list_events("basketball_nba") == []
+        await staging.close()
+
+        assert len(seen) == 1
+
+    async def test_stale_entry_revalidated_with_etag(self, mock_odds_api):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json=EVENTS, headers={"ETag": '"v1"'})
+
+        adapter, seen = mock_odds_api(handler)
+        await adapter.list_events("basketball_nba")
+        # Age every entry past its TTL
+        for key, (fetched_at, etag, data) in list(adapter._cache.items()):
+            adapter._cache[key] = (fetched_at - 10_000.0, etag, data)
+        assert await adapter.list_events("basketball_nba") == EVENTS
+        await adapter.close()
+
+        assert len(seen) == 2
+        assert seen[1].headers["if-none-match"] == '"v1"'
+
+    async def test_odds_never_cached(self, mock_odds_api):
+        adapter, seen = mock_odds_api(lambda r: httpx.Response(200, json=[]))
+        await adapter.get_odds("basketball_nba")
+        await adapter.get_odds("basketball_nba")
+        await adapter.close()
+
+        assert len(seen) == 2
+
+
+class TestGetOdds:
+    """Test event filtering on the odds endpoint."""
+
+    async def test_event_ids_filtered_server_and_client_side(self, mock_odds_api):
+        events = [{"id": "evt1", "bookmakers": []}, {"id": "evt2", "bookmakers": []}]
+        adapter, seen = mock_odds_api(lambda r: httpx.Response(200, json=events))
+        result = await adapter.get_odds("basketball_nba", event_ids={"evt2", "evt9"})
+        await adapter.close()
+
+        assert seen[0].url.params["eventIds"] == "evt2,evt9"
+        assert [e["id"] for e in result] == ["evt2"]
+
+    async def test_long_event_id_list_fetches_whole_sport(self, mock_odds_api):
+        events = [{"id": "evt1", "bookmakers": []}, {"id": "evt2", "bookmakers": []}]
+        adapter, seen = mock_odds_api(lambda r: httpx.Response(200, json=events))
+        wanted = {"evt1", *(f"other{i}" for i in range(EVENT_IDS_FILTER_MAX))}
+        result = await adapter.get_odds("basketball_nba", event_ids=wanted)
+        await adapter.close()
+
+        assert "eventIds" not in seen[0].url.params
+        assert [e["id"] for e in result] == ["evt1"]
+
+
+class TestParseQuotes:
+    """Test odds response → OddsQuote parsing."""
+
+    def test_quotes_share_timestamp_and_skip_unknown_markets(self):
+        adapter = OddsAPIAdapter(api_key="test-key")
+        raw = [
+            {
+                **EVENTS[0],
+                "bookmakers": [
+                    {
+                        "key": "draftkings",
+                        "markets": [
+                            {
+                                "key": "h2h",
+                                "outcomes": [
+                                    {"name": "Oklahoma City Thunder", "price": -150},
+                                    {"name": "Houston Rockets", "price": 130},
+                                ],
+                            },
+                            {
+                                "key": "player_points",
+                                "outcomes": [{"name": "Someone", "price": -110}],
+                            },
+                        ],
+                    }
+                ],
+            }
+        ]
+
+        quotes = adapter.parse_odds_to_quotes(raw)
+
+        assert len(quotes) == 2
+        assert {q.market_type for q in quotes} == {MarketType.H2H}
+        assert quotes[0].timestamp == quotes[1].timestamp
+        assert quotes[0].commence_time == datetime(2026, 2, 8, 1, tzinfo=UTC)
+        assert quotes[0].event_title == "Houston Rockets @ Oklahoma City Thunder"
@@ -5,11 +5,11 @@ import pytest
 from kalshi_odds.core.odds_math import (
     american_to_prob,
     decimal_to_prob,
-    prob_to_american,
-    prob_to_decimal,
-    no_vig_two_way,
     get_overround,
     get_vig_pct,
+    no_vig_two_way,
+    prob_to_american,
+    prob_to_decimal,
 )
 
 
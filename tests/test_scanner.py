@@ -1,13 +1,13 @@
 """Tests for edge calculation and comparison logic."""
 
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 
 import pytest
 
-from kalshi_odds.core.scanner import Scanner
+from kalshi_odds.core.scanner import Scanner, _kalshi_url_from_ticker, aggregate_opportunities
+from kalshi_odds.models.comparison import Confidence, Direction
 from kalshi_odds.models.kalshi import KalshiTopOfBook
-from kalshi_odds.models.odds import OddsQuote, OddsFormat, MarketType
-from kalshi_odds.models.comparison import Direction
+from kalshi_odds.models.odds import MarketType, OddsFormat, OddsQuote
 
 
 @pytest.fixture
@@ -31,14 +31,14 @@ def kalshi_tob() -> KalshiTopOfBook:
         yes_ask_size=100,
         no_bid=0.48,
         no_ask=0.52,
-        timestamp=datetime.utcnow(),
+        timestamp=datetime.now(UTC),
     )
 
 
 @pytest.fixture
 def odds_quote_h2h() -> list[OddsQuote]:
     """H2H market with two sides."""
-    now = datetime.utcnow()
+    now = datetime.now(UTC)
     return [
         OddsQuote(
             source="theoddsapi",
@@ -66,17 +66,19 @@ def odds_quote_h2h() -> list[OddsQuote]:
 class TestEdgeDetection:
     """Test edge detection logic."""
 
-    def test_no_edge_fair_market(self, scanner: Scanner, kalshi_tob: KalshiTopOfBook, odds_quote_h2h: list[OddsQuote]):
+    def test_no_edge_fair_market(
+        self, scanner: Scanner, kalshi_tob: KalshiTopOfBook, odds_quote_h2h: list[OddsQuote]
+    ):
         """When prices match, no alert should trigger."""
         # Both -110 implies 50% no-vig
         # Kalshi at 0.52 ask (+ buffer = 0.525)
         # After sportsbook friction: 0.50 * 0.99 = 0.495
         # Edge = 0.495 - 0.525 = -0.03 (negative, no alert)
-        
+
         alerts = scanner.compare("test-market", kalshi_tob, odds_quote_h2h, {})
         assert len(alerts) == 0
 
-    def test_kalshi_cheap_alert(self, scanner: Scanner):
+    def test_kalshi_cheapmake_alert(self, scanner: Scanner):
         """Kalshi cheap: Kalshi ask < sportsbook no-vig prob."""
         # Kalshi at 0.40 ask
         kalshi = KalshiTopOfBook(
@@ -85,9 +87,9 @@ class TestEdgeDetection:
             yes_ask=0.40,
             yes_bid_size=100,
             yes_ask_size=100,
-            timestamp=datetime.utcnow(),
+            timestamp=datetime.now(UTC),
         )
-        
+
         # Sportsbook at 0.55 implied (no-vig ~0.50 after opposite side)
         # But let's make it 0.60 to trigger
         odds = [
@@ -99,7 +101,7 @@ class TestEdgeDetection:
                 selection="A",
                 odds_format=OddsFormat.DECIMAL,
                 odds_value=1.67,  # 60% implied
-                timestamp=datetime.utcnow(),
+                timestamp=datetime.now(UTC),
             ),
             OddsQuote(
                 source="theoddsapi",
@@ -109,24 +111,26 @@ class TestEdgeDetection:
                 selection="B",
                 odds_format=OddsFormat.DECIMAL,
                 odds_value=2.50,  # 40% implied
-                timestamp=datetime.utcnow(),
+                timestamp=datetime.now(UTC),
             ),
         ]
-        
+
         alerts = scanner.compare("test", kalshi, odds, {})
-        
+
         # Should find kalshi_cheap alert
         cheap_alerts = [a for a in alerts if a.direction == Direction.KALSHI_CHEAP]
         assert len(cheap_alerts) > 0
-        
+
         alert = cheap_alerts[0]
         assert alert.edge_bps > 0
 
-    def test_stale_data_rejected(self, scanner: Scanner, kalshi_tob: KalshiTopOfBook, odds_quote_h2h: list[OddsQuote]):
+    def test_stale_data_rejected(
+        self, scanner: Scanner, kalshi_tob: KalshiTopOfBook, odds_quote_h2h: list[OddsQuote]
+    ):
         """Stale data should be filtered out."""
         # Make Kalshi data stale
-        kalshi_tob.timestamp = datetime.utcnow() - timedelta(seconds=120)
-        
+        kalshi_tob.timestamp = datetime.now(UTC) - timedelta(seconds=120)
+
         alerts = scanner.compare("test", kalshi_tob, odds_quote_h2h, {})
         assert len(alerts) == 0
 
@@ -138,9 +142,9 @@ class TestEdgeDetection:
             yes_ask=0.42,
             yes_bid_size=5,  # Below min_liquidity
             yes_ask_size=5,
-            timestamp=datetime.utcnow(),
+            timestamp=datetime.now(UTC),
         )
-        
+
         alerts = scanner.compare("test", kalshi, odds_quote_h2h, {})
         assert len(alerts) == 0
 
@@ -152,16 +156,16 @@ class TestConfidenceScoring:
         """Larger edge + fresher data + higher liquidity = higher confidence."""
         # This would require building a full alert and checking confidence
         # For now, we test the compare method indirectly
-        
+
         kalshi = KalshiTopOfBook(
             contract_id="TEST",
             yes_bid=0.30,
             yes_ask=0.32,  # Very cheap
             yes_bid_size=200,  # High liquidity
             yes_ask_size=200,
-            timestamp=datetime.utcnow(),  # Fresh
+            timestamp=datetime.now(UTC),  # Fresh
         )
-        
+
         odds = [
             OddsQuote(
                 source="theoddsapi",
@@ -171,7 +175,7 @@ class TestConfidenceScoring:
                 selection="A",
                 odds_format=OddsFormat.DECIMAL,
                 odds_value=1.43,  # 70% implied
-                timestamp=datetime.utcnow(),
+                timestamp=datetime.now(UTC),
             ),
             OddsQuote(
                 source="theoddsapi",
@@ -181,12 +185,110 @@ class TestConfidenceScoring:
                 selection="B",
                 odds_format=OddsFormat.DECIMAL,
                 odds_value=3.33,  # 30% implied
-                timestamp=datetime.utcnow(),
+                timestamp=datetime.now(UTC),
             ),
         ]
-        
+
         alerts = scanner.compare("test", kalshi, odds, {})
-        
+
         if alerts:
             # Should have high confidence due to large edge + fresh data + high liquidity
             assert any(a.confidence.value == "high" for a in alerts)
+
+    def test_confidence_thresholds(self, scanner: Scanner):
+        """Each factor's cutoff is inclusive on the upper bucket."""
+        conf, score = scanner._compute_confidence(
+            edge_bps=200, kalshi_age=1, odds_age=9.9, kalshi_liquidity=100, overround=1.02
+        )
+        assert conf == Confidence.HIGH
+        assert score == pytest.approx(1.0)
+
+        conf, score = scanner._compute_confidence(
+            edge_bps=50, kalshi_age=10, odds_age=0, kalshi_liquidity=20, overround=1.03
+        )
+        assert conf == Confidence.MED
+        assert score == pytest.approx(0.2 + 0.2 + 0.1 + 0.05)
+
+        conf, score = scanner._compute_confidence(
+            edge_bps=10, kalshi_age=60, odds_age=0, kalshi_liquidity=5, overround=1.05
+        )
+        assert conf == Confidence.LOW
+        assert score == pytest.approx(0.1 + 0.0 + 0.05 + 0.0)
+
+
+class TestAggregation:
+    """Test aggregation of alerts into opportunities."""
+
+    def test_empty(self):
+        assert aggregate_opportunities([]) == []
+
+    def test_group_summary(self, make_alert):
+        alerts = [
+            make_alert("draftkings", 150.0, 0.46, -120.0),
+            make_alert("fan_duel", 300.0, 0.48, -130.0, confidence=Confidence.HIGH),
+            make_alert("mybookie", 60.0, 0.44, -110.0, confidence=Confidence.MED),
+        ]
+        [opp] = aggregate_opportunities(alerts)
+
+        assert opp.book_count == 3
+        assert opp.edge_bps == pytest.approx(150.0)
+        assert opp.edge_cents == pytest.approx(1.5)
+        assert opp.book_fair_prob == pytest.approx(0.46)
+        assert opp.book_best == "Fan Duel -130"
+        assert opp.book_worst == "Mybookie -110"
+        assert opp.kalshi_spread_cents == 2
+        assert opp.kalshi_price_cents == 40
+        assert opp.confidence == Confidence.HIGH
+        assert opp.kalshi_action == "BUY Oklahoma City Thunder YES @ 40c"
+        assert opp.hedge_action == "Bet opposite of Oklahoma City Thunder on Fan Duel at -130"
+        assert opp.hedge_odds == "-130"
+        assert opp.kalshi_url.endswith("/kxnbagame-26feb07houokc-okc")
+
+    def test_even_group_median(self, make_alert):
+        alerts = [
+            make_alert("a", 100.0, 0.40, 2.5),
+            make_alert("b", 200.0, 0.50, 2.1),
+        ]
+        [opp] = aggregate_opportunities(alerts)
+        assert opp.edge_bps == pytest.approx(150.0)
+        assert opp.book_fair_prob == pytest.approx(0.45)
+        assert opp.book_best == "B 2.10"
+
+    def test_tied_edge_keeps_first_book_as_best(self, make_alert):
+        alerts = [
+            make_alert("a", 200.0, 0.40, -110.0),
+            make_alert("b", 200.0, 0.40, -120.0),
+            make_alert("c", 200.0, 0.40, -130.0),
+        ]
+        [opp] = aggregate_opportunities(alerts)
+        assert opp.book_best == "A -110"
+        assert opp.book_worst == "A -110"
+        assert opp.hedge_action.endswith("on A at -110")
+
+    def test_split_by_direction_and_ranked(self, make_alert):
+        alerts = [
+            make_alert("a", 100.0, 0.40, -110.0),
+            make_alert("b", 500.0, 0.30, -110.0, direction=Direction.KALSHI_RICH),
+        ]
+        opps = aggregate_opportunities(alerts)
+        assert [o.direction for o in opps] == [Direction.KALSHI_RICH, Direction.KALSHI_CHEAP]
+        assert opps[0].kalshi_action.startswith("SELL ")
+        assert opps[0].hedge_action == "Bet Oklahoma City Thunder ML on B at -110"
+
+    def test_limit_keeps_top_ranked(self, make_alert):
+        alerts = [
+            make_alert(f"b{i}", 100.0 * (i + 1), 0.40, -110.0, market_key=f"m{i}") for i in range(5)
+        ]
+        full = aggregate_opportunities(alerts)
+        top = aggregate_opportunities(alerts, limit=2)
+        assert [o.market_key for o in top] == [o.market_key for o in full[:2]] == ["m4", "m3"]
+
+    def test_kalshi_url_by_series_prefix(self):
+        assert _kalshi_url_from_ticker("KXNFLGAME-26FEB08SEANE-SEA") == (
+            "https://kalshi.com/markets/kxnflgame/professional-football-game/"
+            "kxnflgame-26feb08seane-sea"
+        )
+        assert _kalshi_url_from_ticker("KXSB-26-SEA").startswith(
+            "https://kalshi.com/markets/kxsb/super-bowl/"
+        )
+        assert _kalshi_url_from_ticker("OTHER-1") == "https://kalshi.com/markets/other-1"